@@ -679,6 +679,8 @@ class Crew(FlowTrackable, BaseModel):
             )
             raise
         finally:
+            # Also on failure, so memories saved before the error are not lost.
+            self._flush_memories()
             detach(token)
 
     def kickoff_for_each(self, inputs: List[Dict[str, Any]]) -> List[CrewOutput]:
@@ -1287,6 +1289,16 @@ class Crew(FlowTrackable, BaseModel):
         if self.max_rpm:
             self._rpm_controller.stop_rpm_counter()
 
+    def _flush_memories(self) -> None:
+        """Write out saves that memory storages are still buffering."""
+        for memory in (
+            getattr(self, "_short_term_memory", None),
+            getattr(self, "_entity_memory", None),
+        ):
+            flush = getattr(getattr(memory, "storage", None), "flush", None)
+            if callable(flush):
+                flush()
+
     def calculate_usage_metrics(self) -> UsageMetrics:
         """Calculates and returns the usage metrics."""
         total_usage_metrics = UsageMetrics()
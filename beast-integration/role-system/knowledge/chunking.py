@@ -0,0 +1,231 @@
+"""Structure-aware, token-budgeted chunking for knowledge sources.
+
+Text is read line by line. Markdown headings and sheet titles start a new
+chunk, blank lines mark paragraph boundaries, and every other line (a
+sentence run, a CSV or sheet row) is kept whole unless it alone exceeds the
+budget, in which case it is split at sentence ends and then between words.
+Chunks are packed up to ``max_tokens`` as measured by a token counter and
+preferably end at a paragraph boundary. Every chunk starts with the path
+of headings it belongs to ("Guide > Install"), so a chunk retrieved on its
+own still names its section. Each line is counted once and moved at most
+once, so the cost is linear in the input. Line counts are summed, so with a
+BPE counter a chunk can exceed the budget by about a token per line break.
+A line longer than 64 characters per budget token is read in parts broken
+at spaces, so it is never held whole; only a line that long which still
+fits the budget is chunked differently than it would be whole.
+
+This module only depends on the standard library (tiktoken is used for
+counting when installed) so it can be imported without the crew runtime.
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+TokenCounter = Callable[[str], int]
+
+DEFAULT_MAX_TOKENS = 512
+_LINE_CHARS_PER_TOKEN = 64
+_HEADING = re.compile(r"^(#{1,6})\s+(.*\S)\s*$")
+_SENTENCE_END = re.compile(r"(?<=[.!?;])\s+")
+_APPROX_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+
+def approximate_token_count(text: str) -> int:
+    """Words plus punctuation marks; close to BPE counts for English prose."""
+    return len(_APPROX_TOKEN.findall(text))
+
+
+@lru_cache(maxsize=None)
+def default_token_counter() -> TokenCounter:
+    """tiktoken's cl100k_base when it is installed and usable, else ``approximate_token_count``."""
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return approximate_token_count
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+def fixed_size_chunks(text: str, chunk_size: int, chunk_overlap: int) -> List[str]:
+    """The character-window chunking used by knowledge sources without a token budget."""
+    return [
+        text[i : i + chunk_size] for i in range(0, len(text), chunk_size - chunk_overlap)
+    ]
+
+
+def iter_lines(pieces: Iterable[str]) -> Iterator[str]:
+    """Re-split arbitrary text pieces into lines without the line terminators."""
+    for line, _ in _line_parts(pieces):
+        yield line
+
+
+def _line_parts(
+    pieces: Iterable[str], max_length: Optional[int] = None
+) -> Iterator[Tuple[str, bool]]:
+    """Lines of the concatenated ``pieces`` as ``(text, continued)`` parts.
+
+    A line's fragments are buffered in a list and joined once. With
+    ``max_length`` a longer line is yielded in parts of at most that many
+    characters, broken at the last space when there is one; ``continued``
+    is True for every part after a line's first.
+    """
+    buffered: List[str] = []
+    size = 0
+    continued = False
+    for piece in pieces:
+        start = 0
+        while start < len(piece):
+            end = piece.find("\n", start)
+            stop = len(piece) if end < 0 else end
+            if max_length is not None and size + stop - start > max_length:
+                taken = max_length + 1 - size
+                window = "".join(buffered) + piece[start : start + taken]
+                start += taken
+                cut = window.rfind(" ", 1)
+                if cut <= 0:
+                    cut = max_length
+                yield window[:cut], continued
+                buffered, size, continued = [window[cut:]], len(window) - cut, True
+                continue
+            buffered.append(piece[start:stop])
+            size += stop - start
+            if end < 0:
+                break
+            yield "".join(buffered).rstrip("\r"), continued
+            buffered, size, continued = [], 0, False
+            start = end + 1
+    if buffered:
+        yield "".join(buffered).rstrip("\r"), continued
+
+
+class StructuredChunker:
+    def __init__(
+        self,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        token_counter: Optional[TokenCounter] = None,
+    ):
+        if max_tokens < 8:
+            raise ValueError("max_tokens must be at least 8")
+        self.max_tokens = max_tokens
+        self.count = token_counter or default_token_counter()
+
+    def chunk(self, pieces: Iterable[str]) -> Iterator[str]:
+        """Chunks of the text formed by concatenating ``pieces``."""
+        packer = _Packer(self.max_tokens, self.count)
+        for line, continued in _line_parts(pieces, _LINE_CHARS_PER_TOKEN * self.max_tokens):
+            yield from packer.feed(line, continued)
+        yield from packer.finish()
+
+    def chunk_text(self, text: str) -> List[str]:
+        return list(self.chunk([text]))
+
+
+class _Packer:
+    def __init__(self, max_tokens: int, count: TokenCounter):
+        self.max_tokens = max_tokens
+        self.count = count
+        self.lines: List[str] = []
+        self.tokens = 0
+        self.body_start = 0  # lines before this index are the heading path prefix
+        self.boundary: Optional[Tuple[int, int]] = None  # (line index, tokens before it)
+        self.headings: List[Tuple[int, str]] = []
+        self.path = ""
+        self.path_tokens = 0
+        self.section_empty = False
+
+    def feed(self, line: str, continued: bool = False) -> Iterator[str]:
+        """Add a line, or with ``continued`` the next part of the last one."""
+        stripped = line.strip()
+        if not stripped:
+            if len(self.lines) > self.body_start and not continued:
+                self.boundary = (len(self.lines), self.tokens)
+            return
+        heading = None if continued else _HEADING.match(stripped)
+        if heading:
+            level, title = len(heading.group(1)), heading.group(2)
+            headings = [h for h in self.headings if h[0] < level] + [(level, title)]
+            path = " > ".join(title for _, title in headings)
+            tokens = self.count(path)
+            if tokens <= self.max_tokens // 4:
+                yield from self.emit()
+                # A section without body text otherwise only survives in its subsections' paths.
+                if self.section_empty and level <= self.headings[-1][0]:
+                    yield self.path
+                self.headings, self.path, self.path_tokens = headings, path, tokens
+                self.section_empty = True
+                self._reset([], 0)
+                return
+        tokens = self.count(line)
+        if tokens + self.path_tokens <= self.max_tokens:
+            yield from self._add(line, tokens)
+            return
+        for part in self._split(line, self.max_tokens - self.path_tokens):
+            yield from self._add(part, self.count(part))
+
+    def emit(self) -> Iterator[str]:
+        if len(self.lines) > self.body_start:
+            yield "\n".join(self.lines)
+        self._reset([], 0)
+
+    def finish(self) -> Iterator[str]:
+        yield from self.emit()
+        if self.section_empty:
+            yield self.path
+
+    def _add(self, line: str, tokens: int) -> Iterator[str]:
+        if self.tokens + tokens > self.max_tokens and len(self.lines) > self.body_start:
+            boundary = self.boundary
+            if boundary is not None and boundary[1] >= self.max_tokens // 2:
+                # End this chunk at the last paragraph break and carry the rest over.
+                index, before = boundary
+                yield "\n".join(self.lines[:index])
+                self._reset(self.lines[index:], self.tokens - before)
+            if self.tokens + tokens > self.max_tokens:
+                yield from self.emit()
+        self.lines.append(line)
+        self.tokens += tokens
+        self.section_empty = False
+
+    def _reset(self, carried: List[str], carried_tokens: int) -> None:
+        """Start a chunk with the heading path, followed by ``carried`` lines."""
+        self.lines = [self.path] if self.path else []
+        self.tokens = self.path_tokens
+        self.body_start = len(self.lines)
+        self.boundary = None
+        self.lines.extend(carried)
+        self.tokens += carried_tokens
+
+    def _split(self, line: str, budget: int) -> Iterator[str]:
+        """Pieces of an over-budget line: sentence runs, then word runs, each within ``budget``."""
+        run: List[str] = []
+        run_tokens = 0
+        for sentence in _SENTENCE_END.split(line):
+            tokens = self.count(sentence)
+            if tokens > budget:
+                if run:
+                    yield " ".join(run)
+                    run, run_tokens = [], 0
+                yield from self._split_words(sentence, budget)
+                continue
+            if run and run_tokens + tokens > budget:
+                yield " ".join(run)
+                run, run_tokens = [], 0
+            run.append(sentence)
+            run_tokens += tokens
+        if run:
+            yield " ".join(run)
+
+    def _split_words(self, sentence: str, budget: int) -> Iterator[str]:
+        run: List[str] = []
+        run_tokens = 0
+        for word in sentence.split():
+            tokens = self.count(word)
+            if run and run_tokens + tokens > budget:
+                yield " ".join(run)
+                run, run_tokens = [], 0
+            run.append(word)
+            run_tokens += tokens
+        if run:
+            yield " ".join(run)
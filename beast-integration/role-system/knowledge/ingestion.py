@@ -0,0 +1,261 @@
+"""Parallel ingestion of file-based knowledge sources.
+
+Files are parsed and chunked, optionally on a process pool (PDF and Excel
+parsing is CPU-bound), chunk batches are embedded on a thread pool (embedding
+calls are I/O-bound), and the main thread upserts each embedded batch in
+bulk. Chunk ids come from ``chunk_id`` so they do not depend on worker
+scheduling.
+"""
+
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from crewai.knowledge.storage.ingestion_manifest import IngestionManifest, chunk_id
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+
+DEFAULT_EMBED_WORKERS = 4
+DEFAULT_BATCH_SIZE = 256
+# Files larger than this are streamed in-process instead of parsed whole.
+DEFAULT_STREAM_THRESHOLD = 8 * 1024 * 1024
+
+
+@dataclass
+class IngestionReport:
+    """Progress of one ingestion run; passed to the progress callback after every file."""
+
+    files_total: int = 0
+    files_done: int = 0
+    files_skipped: int = 0
+    chunks: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files_done / self.seconds if self.seconds else 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks / self.seconds if self.seconds else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes / 1_000_000 / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **asdict(self),
+            "files_per_second": self.files_per_second,
+            "chunks_per_second": self.chunks_per_second,
+            "megabytes_per_second": self.megabytes_per_second,
+        }
+
+
+def _parse_file(source: BaseKnowledgeSource, path: Path) -> Tuple[List[str], List[str]]:
+    """Chunk one file in a worker process; returns its unique chunks and their ids."""
+    chunks: Dict[str, str] = {}
+    for chunk in source._chunk_stream(source._iter_text(path)):
+        chunks.setdefault(chunk_id(path, chunk), chunk)
+    return list(chunks.values()), list(chunks)
+
+
+@dataclass
+class _FileJob:
+    path: Path
+    ids: List[str]
+    batches: List[Tuple[List[str], List[str], "Future[Any]"]]
+
+
+class ParallelIngestor:
+    """Ingests knowledge sources into a ``KnowledgeStorage``.
+
+    Sources whose ``ingestion_paths`` returns None are added serially as
+    before. Files up to ``stream_threshold`` bytes are parsed whole, at most
+    ``max_pending_files`` of them at a time; larger files are streamed on the
+    calling thread in ``batch_size`` chunks with a bounded number of batches
+    being embedded, so memory stays within a few small files' chunks.
+
+    With ``parse_workers`` above 1, small files are parsed on a pool of
+    spawned processes. Spawned workers re-import the main module, so this is
+    only safe from scripts guarded by ``if __name__ == "__main__"``; a file
+    whose source cannot be sent to a worker, or whose worker dies, is parsed
+    in-process instead.
+    """
+
+    def __init__(
+        self,
+        storage: KnowledgeStorage,
+        manifest: Optional[IngestionManifest] = None,
+        *,
+        parse_workers: int = 1,
+        embed_workers: int = DEFAULT_EMBED_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_pending_files: Optional[int] = None,
+        stream_threshold: int = DEFAULT_STREAM_THRESHOLD,
+        progress: Optional[Callable[[IngestionReport], None]] = None,
+    ):
+        self.storage = storage
+        self.manifest = manifest
+        self.parse_workers = max(1, parse_workers)
+        self.embed_workers = max(1, embed_workers)
+        self.batch_size = max(1, batch_size)
+        self.max_pending_files = max_pending_files or 2 * self.parse_workers
+        self.stream_threshold = stream_threshold
+        self.progress = progress
+
+    def run(self, sources: List[BaseKnowledgeSource]) -> IngestionReport:
+        report = IngestionReport()
+        started = time.monotonic()
+        jobs: List[Tuple[BaseKnowledgeSource, Path]] = []
+        large: List[Tuple[BaseKnowledgeSource, Path]] = []
+        for source in sources:
+            source.storage = self.storage
+            source.manifest = self.manifest
+            paths = source.ingestion_paths()
+            if paths is None:
+                source.add()
+                continue
+            # Workers get a copy without the storage client, which cannot be pickled.
+            worker_source = source.model_copy(update={"storage": None, "manifest": None})
+            for path in paths:
+                report.files_total += 1
+                if self.manifest is not None and self.manifest.is_current(path):
+                    report.files_skipped += 1
+                    continue
+                if path.stat().st_size > self.stream_threshold:
+                    large.append((worker_source, path))
+                else:
+                    jobs.append((worker_source, path))
+
+        in_process = ThreadPoolExecutor(max_workers=1)
+        parse_pool: Executor = in_process
+        if len(jobs) > 1 and self.parse_workers > 1:
+            parse_pool = ProcessPoolExecutor(
+                max_workers=min(self.parse_workers, len(jobs)),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        with in_process, parse_pool, ThreadPoolExecutor(
+            max_workers=self.embed_workers, thread_name_prefix="knowledge-embed"
+        ) as embed_pool:
+            queued = deque(jobs)
+            parsing: Dict["Future[Any]", Tuple[BaseKnowledgeSource, Path, Executor]] = {}
+            waiting: Deque[_FileJob] = deque()
+            while queued or parsing or waiting:
+                while queued and len(parsing) + len(waiting) < self.max_pending_files:
+                    source, path = queued.popleft()
+                    parsing[parse_pool.submit(_parse_file, source, path)] = (source, path, parse_pool)
+                # Wake up for a parsed file or for the oldest file's embeddings.
+                head = {batch[2] for batch in waiting[0].batches} if waiting else set()
+                done, _ = wait(set(parsing) | head, return_when=FIRST_COMPLETED)
+                # In submission order, so files are saved in the order they were listed.
+                for future in [future for future in parsing if future in done]:
+                    source, path, pool = parsing.pop(future)
+                    try:
+                        chunks, ids = future.result()
+                    except Exception as exc:
+                        if pool is in_process:
+                            raise
+                        if isinstance(exc, BrokenProcessPool):
+                            parse_pool = in_process
+                        # Parsing here re-raises errors that are not about the worker.
+                        chunks, ids = _parse_file(source, path)
+                    waiting.append(self._embed(embed_pool, path, chunks, ids))
+                while waiting and all(batch[2].done() for batch in waiting[0].batches):
+                    job = waiting.popleft()
+                    for chunks, ids, future in job.batches:
+                        self.storage.save(chunks, ids=ids, embeddings=future.result())
+                        report.chunks += len(chunks)
+                    self._finish(job.path, job.ids, report, started)
+            for source, path in large:
+                self._stream(embed_pool, source, path, report, started)
+
+        if self.manifest is not None:
+            stale = self.manifest.prune()
+            if stale:
+                self.storage.delete(stale)
+            self.manifest.save()
+        report.seconds = time.monotonic() - started
+        return report
+
+    def _embed(
+        self, pool: Executor, path: Path, chunks: List[str], ids: List[str]
+    ) -> _FileJob:
+        batches = []
+        for start in range(0, len(chunks), self.batch_size):
+            batch_chunks = chunks[start : start + self.batch_size]
+            batch_ids = ids[start : start + self.batch_size]
+            batches.append(
+                (batch_chunks, batch_ids, pool.submit(self.storage.embedder, batch_chunks))
+            )
+        return _FileJob(path, ids, batches)
+
+    def _stream(
+        self,
+        pool: Executor,
+        source: BaseKnowledgeSource,
+        path: Path,
+        report: IngestionReport,
+        started: float,
+    ) -> None:
+        """Chunk a large file in-process, keeping at most two batches per embed worker in flight."""
+        ids: Dict[str, None] = {}
+        in_flight: Deque[Tuple[List[str], List[str], "Future[Any]"]] = deque()
+        batch_chunks: List[str] = []
+        batch_ids: List[str] = []
+
+        def save_oldest() -> None:
+            chunks, chunk_ids, future = in_flight.popleft()
+            self.storage.save(chunks, ids=chunk_ids, embeddings=future.result())
+            report.chunks += len(chunks)
+
+        def submit() -> None:
+            if len(in_flight) >= 2 * self.embed_workers:
+                save_oldest()
+            in_flight.append(
+                (batch_chunks[:], batch_ids[:], pool.submit(self.storage.embedder, batch_chunks[:]))
+            )
+            batch_chunks.clear()
+            batch_ids.clear()
+
+        for chunk in source._chunk_stream(source._iter_text(path)):
+            identifier = chunk_id(path, chunk)
+            if identifier in ids:
+                continue
+            ids[identifier] = None
+            batch_chunks.append(chunk)
+            batch_ids.append(identifier)
+            if len(batch_chunks) >= self.batch_size:
+                submit()
+        if batch_chunks:
+            submit()
+        while in_flight:
+            save_oldest()
+        self._finish(path, list(ids), report, started)
+
+    def _finish(
+        self, path: Path, ids: List[str], report: IngestionReport, started: float
+    ) -> None:
+        """Update the manifest for a file whose chunks are all saved."""
+        if self.manifest is not None:
+            stale = self.manifest.commit(path, ids)
+            if stale:
+                self.storage.delete(stale)
+        report.files_done += 1
+        report.bytes += path.stat().st_size
+        report.seconds = time.monotonic() - started
+        if self.progress is not None:
+            self.progress(report)
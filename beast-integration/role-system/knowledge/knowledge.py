@@ -1,9 +1,14 @@
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from crewai.knowledge.ingestion import IngestionReport, ParallelIngestor
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from crewai.knowledge.storage.ingestion_manifest import (
+    IngestionManifest,
+    clear_unmanaged,
+)
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
 
 os.environ["TOKENIZERS_PARALLELISM"] = "false"  # removes logging from fastembed
@@ -16,6 +21,10 @@ class Knowledge(BaseModel):
         sources: List[BaseKnowledgeSource] = Field(default_factory=list)
         storage: Optional[KnowledgeStorage] = Field(default=None)
         embedder: Optional[Dict[str, Any]] = None
+        ingestion_workers: int = 1
+
+    File sources are parsed in-process by default; set ``ingestion_workers``
+    above 1 to opt in to parsing them on a pool of spawned processes.
     """
 
     sources: List[BaseKnowledgeSource] = Field(default_factory=list)
@@ -23,6 +32,9 @@ class Knowledge(BaseModel):
     storage: Optional[KnowledgeStorage] = Field(default=None)
     embedder: Optional[Dict[str, Any]] = None
     collection_name: Optional[str] = None
+    # Parse processes for file sources. Above 1 the workers are spawned and
+    # re-import the main module, which must then be guarded by __main__.
+    ingestion_workers: int = 1
 
     def __init__(
         self,
@@ -62,13 +74,34 @@ class Knowledge(BaseModel):
         )
         return results
 
-    def add_sources(self):
-        try:
+    def add_sources(
+        self, progress: Optional[Callable[[IngestionReport], None]] = None
+    ) -> Optional[IngestionReport]:
+        """Ingest all sources.
+
+        With the default ``KnowledgeStorage`` file sources are ingested by a
+        ``ParallelIngestor`` (parsing on ``ingestion_workers`` processes when
+        above 1) and an ingestion manifest is kept per collection: files
+        unchanged since the last run are skipped, and chunks of files no
+        longer listed by any source are deleted. A non-empty collection
+        without a manifest is cleared and rebuilt once. ``progress`` is
+        called after each file; the final report is returned. Other storages
+        ingest serially and return None.
+        """
+        if not isinstance(self.storage, KnowledgeStorage):
             for source in self.sources:
                 source.storage = self.storage
                 source.add()
-        except Exception as e:
-            raise e
+            return None
+        manifest = IngestionManifest.for_collection(self.storage.collection_name)
+        clear_unmanaged(self.storage, manifest)
+        ingestor = ParallelIngestor(
+            self.storage,
+            manifest,
+            parse_workers=self.ingestion_workers,
+            progress=progress,
+        )
+        return ingestor.run(self.sources)
 
     def reset(self) -> None:
         if self.storage:
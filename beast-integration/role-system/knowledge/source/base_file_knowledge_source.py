@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import ClassVar, Dict, Iterator, List, Optional, Union
 
 from pydantic import Field, field_validator
 
@@ -24,6 +24,9 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
     content: Dict[Path, str] = Field(init=False, default_factory=dict)
     storage: Optional[KnowledgeStorage] = Field(default=None)
     safe_file_paths: List[Path] = Field(default_factory=list)
+    # Sources that set this read files lazily through ``_iter_text`` in ``add``
+    # instead of loading them into ``content`` up front.
+    streams_content: ClassVar[bool] = False
 
     @field_validator("file_path", "file_paths", mode="before")
     def validate_file_path(cls, v, info):
@@ -43,13 +46,25 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
         """Post-initialization method to load content."""
         self.safe_file_paths = self._process_file_paths()
         self.validate_content()
-        self.content = self.load_content()
+        if not self.streams_content:
+            self.content = self.load_content()
 
     @abstractmethod
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess file content. Should be overridden by subclasses. Assume that the file path is relative to the project root in the knowledge directory."""
         pass
 
+    def _iter_text(self, path: Path) -> Iterator[str]:
+        """Yield the text of ``path`` in pieces. Overridden by streaming sources."""
+        raise NotImplementedError
+
+    def ingestion_paths(self) -> Optional[List[Path]]:
+        return self.safe_file_paths if self.streams_content else None
+
+    def _read_all(self) -> Dict[Path, str]:
+        """Whole-file content of every path, built from ``_iter_text``."""
+        return {path: "".join(self._iter_text(path)) for path in self.safe_file_paths}
+
     def validate_content(self):
         """Validate the paths."""
         for path in self.safe_file_paths:
@@ -1,17 +1,25 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
+from crewai.knowledge.chunking import StructuredChunker
+from crewai.knowledge.storage.ingestion_manifest import IngestionManifest, chunk_id
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
 
+SAVE_BATCH_SIZE = 256
+
 
 class BaseKnowledgeSource(BaseModel, ABC):
     """Abstract base class for knowledge sources."""
 
     chunk_size: int = 4000
     chunk_overlap: int = 200
+    # When set, chunks follow headings, paragraphs and rows and hold at most
+    # this many tokens; chunk_size and chunk_overlap are then ignored.
+    chunk_tokens: Optional[int] = Field(default=None, ge=8)
     chunks: List[str] = Field(default_factory=list)
     chunk_embeddings: List[np.ndarray] = Field(default_factory=list)
 
@@ -19,6 +27,7 @@ class BaseKnowledgeSource(BaseModel, ABC):
     storage: Optional[KnowledgeStorage] = Field(default=None)
     metadata: Dict[str, Any] = Field(default_factory=dict)  # Currently unused
     collection_name: Optional[str] = Field(default=None)
+    manifest: Optional[IngestionManifest] = Field(default=None, exclude=True)
 
     @abstractmethod
     def validate_content(self) -> Any:
@@ -41,6 +50,71 @@ class BaseKnowledgeSource(BaseModel, ABC):
             for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
         ]
 
+    def _chunk_stream(self, pieces: Iterable[str]) -> Iterator[str]:
+        """Same chunks as ``_chunk_text`` over the concatenated pieces, holding at most one chunk plus one piece.
+
+        With ``chunk_tokens`` set, the pieces are chunked by ``StructuredChunker`` instead.
+        """
+        if self.chunk_tokens is not None:
+            yield from StructuredChunker(self.chunk_tokens).chunk(pieces)
+            return
+        step = self.chunk_size - self.chunk_overlap
+        buffer = ""
+        for piece in pieces:
+            buffer += piece
+            while len(buffer) >= self.chunk_size + step:
+                yield buffer[: self.chunk_size]
+                buffer = buffer[step:]
+        for start in range(0, len(buffer), step):
+            yield buffer[start : start + self.chunk_size]
+
+    def _ingest_files(
+        self, paths: List[Path], read: Callable[[Path], Iterable[str]]
+    ) -> None:
+        """Chunk and save each file in ``paths`` from the text pieces ``read`` yields.
+
+        With a ``manifest`` (set by ``Knowledge``) unchanged files are skipped
+        and a changed file's old chunks are deleted once its new ones are
+        saved. Chunks are saved in batches rather than kept on the source.
+        Only a ``KnowledgeStorage`` takes chunk ids, so other storages ignore
+        the manifest.
+        """
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+        manifest = self.manifest if isinstance(self.storage, KnowledgeStorage) else None
+        for path in paths:
+            if manifest is not None and manifest.is_current(path):
+                continue
+            saved: List[str] = []
+            batch: List[str] = []
+            for chunk in self._chunk_stream(read(path)):
+                batch.append(chunk)
+                if len(batch) >= SAVE_BATCH_SIZE:
+                    saved.extend(self._save_file_chunks(path, batch))
+                    batch = []
+            if batch:
+                saved.extend(self._save_file_chunks(path, batch))
+            if manifest is not None:
+                stale = manifest.commit(path, saved)
+                if stale:
+                    self.storage.delete(stale)  # type: ignore[union-attr]
+
+    def ingestion_paths(self) -> Optional[List[Path]]:
+        """Files ``add`` would stream through ``_iter_text``, or None if ``add`` must run itself.
+
+        ``Knowledge`` uses this to parse such files on a process pool.
+        """
+        return None
+
+    def _save_file_chunks(self, path: Path, chunks: List[str]) -> List[str]:
+        """Save ``chunks`` of ``path``; returns their ids, or none if the storage assigns its own."""
+        if not isinstance(self.storage, KnowledgeStorage):
+            self.storage.save(chunks)  # type: ignore[union-attr]
+            return []
+        ids = [chunk_id(path, chunk) for chunk in chunks]
+        self.storage.save(chunks, ids=ids)
+        return ids
+
     def _save_documents(self):
         """
         Save the documents to the storage.
@@ -1,6 +1,6 @@
 import csv
 from pathlib import Path
-from typing import Dict, List
+from typing import ClassVar, Dict, Iterator, List
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
@@ -8,29 +8,23 @@ from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledge
 class CSVKnowledgeSource(BaseFileKnowledgeSource):
     """A knowledge source that stores and queries CSV file content using embeddings."""
 
+    streams_content: ClassVar[bool] = True
+
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess CSV file content."""
-        content_dict = {}
-        for file_path in self.safe_file_paths:
-            with open(file_path, "r", encoding="utf-8") as csvfile:
-                reader = csv.reader(csvfile)
-                content = ""
-                for row in reader:
-                    content += " ".join(row) + "\n"
-                content_dict[file_path] = content
-        return content_dict
+        return self._read_all()
+
+    def _iter_text(self, path: Path) -> Iterator[str]:
+        with open(path, "r", encoding="utf-8") as csvfile:
+            for row in csv.reader(csvfile):
+                yield " ".join(row) + "\n"
 
     def add(self) -> None:
         """
         Add CSV file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
+        and save the embeddings. Rows are read one at a time and unchanged files are skipped.
         """
-        content_str = (
-            str(self.content) if isinstance(self.content, dict) else self.content
-        )
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
+        self._ingest_files(self.safe_file_paths, self._iter_text)
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
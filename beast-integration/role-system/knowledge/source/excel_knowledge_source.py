@@ -1,3 +1,5 @@
+import csv
+import io
 from pathlib import Path
 from typing import Dict, Iterator, List, Optional, Union
 from urllib.parse import urlparse
@@ -98,7 +100,8 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
             self.file_paths = self.file_path
         self.safe_file_paths = self._process_file_paths()
         self.validate_content()
-        self.content = self._load_content()
+        # Workbooks are read sheet by sheet in ``add``; ``_load_content`` still
+        # returns the whole content for callers that want it.
 
     def _load_content(self) -> Dict[Path, Dict[str, str]]:
         """Load and preprocess Excel file content from multiple sheets.
@@ -126,6 +129,43 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
             content_dict[file_path] = sheet_dict
         return content_dict
 
+    def _iter_text(self, path: Path) -> Iterator[str]:
+        """Yield a workbook as CSV, one row at a time, with a blank line after each sheet.
+
+        With ``chunk_tokens`` set each sheet also starts with a ``# <sheet name>``
+        heading, so structured chunks follow sheet boundaries; the character
+        windows used otherwise are left as they were.
+
+        ``.xlsx``/``.xlsm`` files are read in openpyxl's read-only mode so rows
+        are never all in memory; other formats fall back to pandas per sheet.
+        """
+        if path.suffix.lower() not in {".xlsx", ".xlsm"}:
+            pd = self._import_dependencies()
+            with pd.ExcelFile(path) as xl:
+                for sheet_name in xl.sheet_names:
+                    if self.chunk_tokens is not None:
+                        yield f"# {sheet_name}\n"
+                    yield str(pd.read_excel(xl, sheet_name).to_csv(index=False)) + "\n"
+            return
+        openpyxl = self._import_openpyxl()
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            for sheet in workbook.worksheets:
+                if self.chunk_tokens is not None:
+                    yield f"# {sheet.title}\n"
+                for row in sheet.iter_rows(values_only=True):
+                    line = io.StringIO()
+                    csv.writer(line, lineterminator="\n").writerow(
+                        ["" if value is None else value for value in row]
+                    )
+                    yield line.getvalue()
+                yield "\n"
+        finally:
+            workbook.close()
+
+    def ingestion_paths(self) -> Optional[List[Path]]:
+        return self.safe_file_paths
+
     def convert_to_path(self, path: Union[Path, str]) -> Path:
         """Convert a path to a Path object."""
         return Path(KNOWLEDGE_DIRECTORY + "/" + path) if isinstance(path, str) else path
@@ -142,24 +182,23 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
                 f"{missing_package} is not installed. Please install it with: pip install {missing_package}"
             )
 
+    def _import_openpyxl(self):
+        """Dynamically import openpyxl."""
+        try:
+            import openpyxl
+
+            return openpyxl
+        except ImportError:
+            raise ImportError(
+                "openpyxl is not installed. Please install it with: pip install openpyxl"
+            )
+
     def add(self) -> None:
         """
         Add Excel file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
+        and save the embeddings. Workbooks are streamed and unchanged files are skipped.
         """
-        # Convert dictionary values to a single string if content is a dictionary
-        # Updated to account for .xlsx workbooks with multiple tabs/sheets
-        content_str = ""
-        for value in self.content.values():
-            if isinstance(value, dict):
-                for sheet_value in value.values():
-                    content_str += str(sheet_value) + "\n"
-            else:
-                content_str += str(value) + "\n"
-
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
+        self._ingest_files(self.safe_file_paths, self._iter_text)
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
@@ -40,7 +40,7 @@ class JSONKnowledgeSource(BaseFileKnowledgeSource):
         content_str = (
             str(self.content) if isinstance(self.content, dict) else self.content
         )
-        new_chunks = self._chunk_text(content_str)
+        new_chunks = list(self._chunk_stream([content_str]))
         self.chunks.extend(new_chunks)
         self._save_documents()
 
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, List
+from typing import ClassVar, Dict, Iterator, List
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
@@ -7,22 +7,22 @@ from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledge
 class PDFKnowledgeSource(BaseFileKnowledgeSource):
     """A knowledge source that stores and queries PDF file content using embeddings."""
 
+    streams_content: ClassVar[bool] = True
+
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess PDF file content."""
-        pdfplumber = self._import_pdfplumber()
+        return self._read_all()
 
-        content = {}
-
-        for path in self.safe_file_paths:
-            text = ""
-            path = self.convert_to_path(path)
-            with pdfplumber.open(path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            content[path] = text
-        return content
+    def _iter_text(self, path: Path) -> Iterator[str]:
+        """Yield the text of one page at a time, releasing each page once read."""
+        pdfplumber = self._import_pdfplumber()
+        with pdfplumber.open(path) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                if hasattr(page, "close"):
+                    page.close()
+                if page_text:
+                    yield page_text + "\n"
 
     def _import_pdfplumber(self):
         """Dynamically import pdfplumber."""
@@ -38,12 +38,9 @@ class PDFKnowledgeSource(BaseFileKnowledgeSource):
     def add(self) -> None:
         """
         Add PDF file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
+        and save the embeddings. Pages are parsed one at a time and unchanged files are skipped.
         """
-        for _, text in self.content.items():
-            new_chunks = self._chunk_text(text)
-            self.chunks.extend(new_chunks)
-        self._save_documents()
+        self._ingest_files(self.safe_file_paths, self._iter_text)
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
@@ -22,7 +22,7 @@ class StringKnowledgeSource(BaseKnowledgeSource):
 
     def add(self) -> None:
         """Add string content to the knowledge source, chunk it, compute embeddings, and save them."""
-        new_chunks = self._chunk_text(self.content)
+        new_chunks = list(self._chunk_stream([self.content]))
         self.chunks.extend(new_chunks)
         self._save_documents()
 
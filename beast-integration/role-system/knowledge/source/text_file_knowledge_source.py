@@ -1,30 +1,31 @@
 from pathlib import Path
-from typing import Dict, List
+from typing import ClassVar, Dict, Iterator, List
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
+READ_BLOCK_SIZE = 1024 * 1024
+
 
 class TextFileKnowledgeSource(BaseFileKnowledgeSource):
     """A knowledge source that stores and queries text file content using embeddings."""
 
+    streams_content: ClassVar[bool] = True
+
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess text file content."""
-        content = {}
-        for path in self.safe_file_paths:
-            path = self.convert_to_path(path)
-            with open(path, "r", encoding="utf-8") as f:
-                content[path] = f.read()
-        return content
+        return self._read_all()
+
+    def _iter_text(self, path: Path) -> Iterator[str]:
+        with open(path, "r", encoding="utf-8") as f:
+            while block := f.read(READ_BLOCK_SIZE):
+                yield block
 
     def add(self) -> None:
         """
         Add text file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
+        and save the embeddings. Files are read in blocks and unchanged files are skipped.
         """
-        for _, text in self.content.items():
-            new_chunks = self._chunk_text(text)
-            self.chunks.extend(new_chunks)
-        self._save_documents()
+        self._ingest_files(self.safe_file_paths, self._iter_text)
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from crewai.utilities.chromadb import sanitize_collection_name
+from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from crewai.utilities.paths import db_storage_path
+
+MANIFEST_VERSION = 1
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_digest(path: Path) -> str:
+    """sha256 of a file, read in blocks so large files are never held in memory."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def chunk_id(path: Path, chunk: str) -> str:
+    """Deterministic id for a chunk of ``path``; equal chunks of different files stay distinct."""
+    return hashlib.sha256(f"{path.resolve()}\0{chunk}".encode("utf-8")).hexdigest()
+
+
+class IngestionManifest:
+    """Records which files a knowledge collection was built from.
+
+    For every ingested file it keeps the path, mtime, size, content hash and
+    the ids of the chunks it produced, so a later ingestion can skip unchanged
+    files, replace the chunks of changed ones and delete the chunks of files
+    that are no longer part of any source. The manifest lives next to the
+    knowledge database and is removed with it on reset. ``existed`` is False
+    when no manifest of this version was found.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        files: Optional[Dict[str, Dict[str, Any]]] = None,
+        existed: bool = False,
+    ):
+        self.path = Path(path)
+        self.files: Dict[str, Dict[str, Any]] = files or {}
+        self.existed = existed
+        self._seen: Set[str] = set()
+
+    @classmethod
+    def for_collection(cls, collection_name: Optional[str]) -> "IngestionManifest":
+        name = sanitize_collection_name(
+            f"knowledge_{collection_name}" if collection_name else "knowledge"
+        )
+        return cls.load(
+            Path(db_storage_path()) / KNOWLEDGE_DIRECTORY / "manifests" / f"{name}.json"
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "IngestionManifest":
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+        if payload.get("version") != MANIFEST_VERSION:
+            return cls(path)
+        return cls(path, payload.get("files", {}), existed=True)
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=self.path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"version": MANIFEST_VERSION, "files": self.files}, handle)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def is_current(self, path: Path) -> bool:
+        """Whether ``path`` is unchanged since it was recorded; marks it as seen either way.
+
+        mtime and size are compared first; the content hash is only computed
+        when they differ, so touching a file does not force re-ingestion.
+        """
+        key = self._key(path)
+        self._seen.add(key)
+        entry = self.files.get(key)
+        if entry is None:
+            return False
+        stat = path.stat()
+        if entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+            return True
+        if entry["size"] != stat.st_size or entry["sha256"] != file_digest(path):
+            return False
+        entry["mtime"] = stat.st_mtime
+        return True
+
+    def chunk_ids(self, path: Path) -> List[str]:
+        entry = self.files.get(self._key(path))
+        return list(entry["chunk_ids"]) if entry else []
+
+    def record(self, path: Path, chunk_ids: Iterable[str]) -> None:
+        key = self._key(path)
+        stat = path.stat()
+        self._seen.add(key)
+        self.files[key] = {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "sha256": file_digest(path),
+            "chunk_ids": list(dict.fromkeys(chunk_ids)),
+        }
+
+    def commit(self, path: Path, chunk_ids: List[str]) -> List[str]:
+        """Record a re-ingested file; returns ids of its previous chunks that are now gone."""
+        stale = set(self.chunk_ids(path)) - set(chunk_ids)
+        self.record(path, chunk_ids)
+        return sorted(stale)
+
+    def prune(self) -> List[str]:
+        """Drop files not seen since the manifest was loaded; returns their chunk ids."""
+        stale: List[str] = []
+        for key in [key for key in self.files if key not in self._seen]:
+            stale.extend(self.files.pop(key)["chunk_ids"])
+        return stale
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return str(Path(path).resolve())
+
+
+def clear_unmanaged(storage: Any, manifest: IngestionManifest) -> bool:
+    """Clear ``storage`` if it holds documents but ``manifest`` was not found; returns whether it did.
+
+    Such a collection was built before manifests: its file chunks have
+    content-hash ids that nothing would replace or delete, so it is rebuilt
+    from the sources once.
+    """
+    if manifest.existed or not storage.collection or not storage.collection.count():
+        return False
+    storage.clear()
+    return True
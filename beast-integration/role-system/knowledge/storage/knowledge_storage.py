@@ -1,5 +1,4 @@
 import contextlib
-import hashlib
 import io
 import logging
 import os
@@ -14,6 +13,11 @@ from chromadb.config import Settings
 import warnings
 
 from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.rag.embeddings.cache import (
+    CachedEmbeddingFunction,
+    content_hash,
+    embedder_namespace,
+)
 from crewai.rag.embeddings.configurator import EmbeddingConfigurator
 from crewai.utilities.chromadb import sanitize_collection_name
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
@@ -131,7 +135,14 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         self,
         documents: List[str],
         metadata: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+        ids: Optional[List[str]] = None,
+        embeddings: Optional[List[Any]] = None,
     ):
+        """Upsert ``documents``; ids default to the sha256 of each document.
+
+        Pass ``embeddings`` (aligned with ``documents``) to skip the embedding
+        function, e.g. when they were computed ahead of time in parallel.
+        """
         if not self.collection:
             raise Exception("Collection not initialized")
 
@@ -141,25 +152,28 @@ class KnowledgeStorage(BaseKnowledgeStorage):
 
             # Generate IDs and create a mapping of id -> (document, metadata)
             for idx, doc in enumerate(documents):
-                doc_id = hashlib.sha256(doc.encode("utf-8")).hexdigest()
+                doc_id = ids[idx] if ids is not None else content_hash(doc)
                 doc_metadata = None
                 if metadata is not None:
                     if isinstance(metadata, list):
                         doc_metadata = metadata[idx]
                     else:
                         doc_metadata = metadata
-                unique_docs[doc_id] = (doc, doc_metadata)
+                doc_embedding = embeddings[idx] if embeddings is not None else None
+                unique_docs[doc_id] = (doc, doc_metadata, doc_embedding)
 
             # Prepare filtered lists for ChromaDB
             filtered_docs = []
             filtered_metadata = []
             filtered_ids = []
+            filtered_embeddings = []
 
             # Build the filtered lists
-            for doc_id, (doc, meta) in unique_docs.items():
+            for doc_id, (doc, meta, embedding) in unique_docs.items():
                 filtered_docs.append(doc)
                 filtered_metadata.append(meta)
                 filtered_ids.append(doc_id)
+                filtered_embeddings.append(embedding)
 
             # If we have no metadata at all, set it to None
             final_metadata: Optional[OneOrMany[chromadb.Metadata]] = (
@@ -170,6 +184,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 documents=filtered_docs,
                 metadatas=final_metadata,
                 ids=filtered_ids,
+                embeddings=filtered_embeddings if embeddings is not None else None,
             )
         except chromadb.errors.InvalidDimensionException as e:
             Logger(verbose=True).log(
@@ -186,6 +201,25 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             Logger(verbose=True).log("error", f"Failed to upsert documents: {e}", "red")
             raise
 
+    def delete(self, ids: List[str], batch_size: int = 5000) -> None:
+        """Remove documents by id; unknown ids are ignored."""
+        if not self.collection:
+            raise Exception("Collection not initialized")
+        for start in range(0, len(ids), batch_size):
+            self.collection.delete(ids=ids[start : start + batch_size])
+
+    def clear(self, batch_size: int = 5000) -> int:
+        """Remove every document but keep the collection; returns how many were removed."""
+        if not self.collection:
+            raise Exception("Collection not initialized")
+        removed = 0
+        while True:
+            ids = self.collection.get(limit=batch_size, include=[])["ids"]
+            if not ids:
+                return removed
+            self.collection.delete(ids=ids)
+            removed += len(ids)
+
     def _create_default_embedding_function(self):
         from chromadb.utils.embedding_functions.openai_embedding_function import (
             OpenAIEmbeddingFunction,
@@ -201,9 +235,15 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         Args:
             embedder_config (Optional[Dict[str, Any]]): Configuration dictionary for the embedder.
                 If None or empty, defaults to the default embedding function.
+
+        Embeddings go through the shared on-disk cache, so unchanged documents
+        are not re-embedded when a source is ingested again.
         """
-        self.embedder = (
+        embedding_function = (
             EmbeddingConfigurator().configure_embedder(embedder)
             if embedder
             else self._create_default_embedding_function()
         )
+        self.embedder = CachedEmbeddingFunction(
+            embedding_function, embedder_namespace(embedder)
+        )
@@ -1,13 +1,18 @@
+import atexit
 import contextlib
 import io
 import logging
 import os
 import shutil
+import threading
+import time
 import uuid
+import weakref
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from chromadb.api import ClientAPI
 from crewai.rag.storage.base_rag_storage import BaseRAGStorage
+from crewai.rag.embeddings.cache import CachedEmbeddingFunction, embedder_namespace
 from crewai.rag.embeddings.configurator import EmbeddingConfigurator
 from crewai.utilities.chromadb import create_persistent_client
 from crewai.utilities.constants import MAX_FILE_NAME_LENGTH
@@ -32,18 +37,58 @@ def suppress_logging(
     logger.setLevel(original_level)
 
 
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_FLUSH_INTERVAL = 5.0
+# Failed batch writes kept for retry before falling back to per-item adds.
+MAX_FLUSH_RETRIES = 3
+
+# Storages with saves still pending; flushed when the interpreter exits.
+_buffered_storages: "weakref.WeakSet[RAGStorage]" = weakref.WeakSet()
+
+
+def _flush_buffered_storages() -> None:
+    for storage in list(_buffered_storages):
+        storage.flush()
+
+
+atexit.register(_flush_buffered_storages)
+
+
 class RAGStorage(BaseRAGStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
     search efficiency.
+
+    Saves are buffered and written as one ``collection.add`` (one embedding
+    batch) once ``batch_size`` items are pending or, from a background timer,
+    once the oldest pending item is ``flush_interval`` seconds old (0 disables
+    the timer). ``search`` flushes first, so it always sees earlier saves; a
+    crew flushes when kickoff ends and anything left is flushed at exit. A
+    batch that fails to write is kept and retried on the next flush; after
+    ``MAX_FLUSH_RETRIES`` failures in a row its items are added one at a time
+    and any that still fail are logged and dropped.
     """
 
     app: ClientAPI | None = None
 
     def __init__(
-        self, type, allow_reset=True, embedder_config=None, crew=None, path=None
+        self,
+        type,
+        allow_reset=True,
+        embedder_config=None,
+        crew=None,
+        path=None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
     ):
         super().__init__(type, allow_reset, embedder_config, crew)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._pending: List[Tuple[str, Dict[str, Any], str]] = []
+        self._pending_since: Optional[float] = None
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_failures = 0
         agents = crew.agents if crew else []
         agents = [self._sanitize_role(agent.role) for agent in agents]
         agents = "_".join(agents)
@@ -58,7 +103,10 @@ class RAGStorage(BaseRAGStorage):
 
     def _set_embedder_config(self):
         configurator = EmbeddingConfigurator()
-        self.embedder_config = configurator.configure_embedder(self.embedder_config)
+        namespace = embedder_namespace(self.embedder_config)
+        self.embedder_config = CachedEmbeddingFunction(
+            configurator.configure_embedder(self.embedder_config), namespace
+        )
 
     def _initialize_app(self):
         from chromadb.config import Settings
@@ -104,12 +152,77 @@ class RAGStorage(BaseRAGStorage):
         return f"{base_path}/{file_name}"
 
     def save(self, value: Any, metadata: Dict[str, Any]) -> None:
-        if not hasattr(self, "app") or not hasattr(self, "collection"):
-            self._initialize_app()
+        with self._pending_lock:
+            self._queue([(value, metadata or {}, str(uuid.uuid4()))])
+            due = len(self._pending) >= self.batch_size
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all pending saves in one batch; returns how many were written.
+
+        If the write fails the batch is put back in front of newer saves, up
+        to ``MAX_FLUSH_RETRIES`` times; then it is written item by item.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+            self._pending_since = None
+            self._cancel_flush_timer()
+        if not pending:
+            return 0
         try:
-            self._generate_embedding(value, metadata)
+            if not hasattr(self, "app") or not hasattr(self, "collection"):
+                self._initialize_app()
+            self._add_batch(pending)
         except Exception as e:
-            logging.error(f"Error during {self.type} save: {str(e)}")
+            with self._pending_lock:
+                self._flush_failures += 1
+                retry = self._flush_failures < MAX_FLUSH_RETRIES
+                if retry:
+                    self._queue(pending, front=True)
+                else:
+                    self._flush_failures = 0
+            if retry:
+                logging.error(f"Error during {self.type} save, will retry: {str(e)}")
+                return 0
+            logging.error(f"Error during {self.type} save, writing items one at a time: {str(e)}")
+            return self._add_each(pending)
+        with self._pending_lock:
+            self._flush_failures = 0
+        return len(pending)
+
+    def _add_each(self, items: List[Tuple[str, Dict[str, Any], str]]) -> int:
+        """Add ``items`` one at a time, logging and dropping those that fail."""
+        written = 0
+        for item in items:
+            try:
+                self._add_batch([item])
+            except Exception as e:
+                logging.error(f"Dropping {self.type} memory item {item[2]}: {str(e)}")
+            else:
+                written += 1
+        return written
+
+    def _queue(
+        self, items: List[Tuple[str, Dict[str, Any], str]], front: bool = False
+    ) -> None:
+        """Add ``items`` to the pending saves and arm the flush timer; the caller holds the lock."""
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        if front:
+            self._pending[:0] = items
+        else:
+            self._pending.extend(items)
+        _buffered_storages.add(self)
+        if self._flush_timer is None and self.flush_interval > 0:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _cancel_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
 
     def search(
         self,
@@ -120,6 +233,7 @@ class RAGStorage(BaseRAGStorage):
     ) -> List[Any]:
         if not hasattr(self, "app"):
             self._initialize_app()
+        self.flush()
 
         try:
             with suppress_logging():
@@ -145,13 +259,21 @@ class RAGStorage(BaseRAGStorage):
         if not hasattr(self, "app") or not hasattr(self, "collection"):
             self._initialize_app()
 
+        self._add_batch([(text, metadata or {}, str(uuid.uuid4()))])
+
+    def _add_batch(self, items: List[Tuple[str, Dict[str, Any], str]]) -> None:
         self.collection.add(
-            documents=[text],
-            metadatas=[metadata or {}],
-            ids=[str(uuid.uuid4())],
+            documents=[text for text, _, _ in items],
+            metadatas=[metadata for _, metadata, _ in items],
+            ids=[item_id for _, _, item_id in items],
         )
 
     def reset(self) -> None:
+        with self._pending_lock:
+            self._pending = []
+            self._pending_since = None
+            self._flush_failures = 0
+            self._cancel_flush_timer()
         try:
             if self.app:
                 self.app.reset()
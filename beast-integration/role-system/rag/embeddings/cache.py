@@ -0,0 +1,238 @@
+"""Persistent embedding cache keyed by embedder configuration and content hash."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.utilities.paths import db_storage_path
+
+DEFAULT_MAX_ENTRIES = 200_000
+CACHE_FILE_NAME = "embedding_cache.db"
+
+# Config keys that identify credentials or transport rather than the model, so
+# rotating an API key does not invalidate cached vectors.
+_IGNORED_CONFIG_KEYS = ("key", "token", "secret", "password", "credential", "header")
+
+_shared_caches: Dict[str, "EmbeddingCache"] = {}
+_shared_lock = threading.Lock()
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def embedder_namespace(embedder_config: Optional[Dict[str, Any]]) -> str:
+    """Stable identifier for the embedding model described by ``embedder_config``.
+
+    ``None`` stands for the default OpenAI embedder. A top-level
+    ``cache_namespace`` entry is used as given. Custom embedders are
+    identified by their class and public scalar attributes (model name,
+    dimensions, ...), other providers by their non-secret settings. A custom
+    embedder whose model is not visible in its attributes should set
+    ``cache_namespace``, or instances of its class share cached vectors.
+    """
+    if not embedder_config:
+        return "openai:text-embedding-3-small"
+    provider = embedder_config.get("provider")
+    if embedder_config.get("cache_namespace"):
+        return f"{provider}:{embedder_config['cache_namespace']}"
+    config = embedder_config.get("config") or {}
+    settings = _public_settings(config)
+    if provider == "custom":
+        embedder = config.get("embedder")
+        embedder_type = embedder if isinstance(embedder, type) else type(embedder)
+        settings["embedder"] = f"{embedder_type.__module__}.{embedder_type.__qualname__}"
+        if not isinstance(embedder, type):
+            attributes = _public_settings(getattr(embedder, "__dict__", {}))
+            settings["attributes"] = {
+                key: value
+                for key, value in attributes.items()
+                if not key.startswith("_") and _is_scalar(value)
+            }
+    payload = json.dumps({"provider": provider, "config": settings}, sort_keys=True, default=repr)
+    return f"{provider}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]}"
+
+
+def _public_settings(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Entries of ``values`` that do not name credentials or transport."""
+    return {
+        key: value
+        for key, value in values.items()
+        if isinstance(key, str)
+        and not any(part in key.lower() for part in _IGNORED_CONFIG_KEYS)
+    }
+
+
+def _is_scalar(value: Any) -> bool:
+    """Plain values and tuples of them; lists and objects are usually runtime state."""
+    if isinstance(value, tuple):
+        return all(_is_scalar(item) for item in value)
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+class EmbeddingCache:
+    """SQLite-backed vector store shared across storages and processes.
+
+    Entries are evicted least recently used first once more than
+    ``max_entries`` are stored. ``stats`` reports hits and misses for this
+    process.
+    """
+
+    def __init__(
+        self, path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        if path is None:
+            path = str(Path(db_storage_path()) / CACHE_FILE_NAME)
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    namespace TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (namespace, content_hash)
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)"
+            )
+
+    def get_many(
+        self, namespace: str, hashes: Sequence[str]
+    ) -> Dict[str, List[float]]:
+        """Cached vectors for ``hashes``; missing hashes are left out."""
+        found: Dict[str, List[float]] = {}
+        unique = list(dict.fromkeys(hashes))
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit.
+            for start in range(0, len(unique), 500):
+                chunk = unique[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT content_hash, vector FROM embeddings "
+                    f"WHERE namespace = ? AND content_hash IN ({placeholders})",
+                    [namespace, *chunk],
+                ).fetchall()
+                for digest, blob in rows:
+                    found[digest] = array("f", blob).tolist()
+            if found:
+                now = time.time()
+                with self._conn:
+                    self._conn.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE namespace = ? AND content_hash = ?",
+                        [(now, namespace, digest) for digest in found],
+                    )
+            self.hits += sum(1 for digest in hashes if digest in found)
+            self.misses += sum(1 for digest in hashes if digest not in found)
+        return found
+
+    def put_many(self, namespace: str, vectors: Dict[str, Sequence[float]]) -> None:
+        if not vectors:
+            return
+        now = time.time()
+        rows = [
+            (namespace, digest, array("f", vector).tobytes(), now)
+            for digest, vector in vectors.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (namespace, content_hash, vector, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM embeddings WHERE rowid IN "
+                    "(SELECT rowid FROM embeddings ORDER BY last_used LIMIT ?)",
+                    (excess,),
+                )
+                self.evictions += excess
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM embeddings")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def get_embedding_cache(path: Optional[str] = None) -> EmbeddingCache:
+    """Process-wide cache instance for ``path`` (default: the crew storage directory)."""
+    if path is None:
+        path = str(Path(db_storage_path()) / CACHE_FILE_NAME)
+    with _shared_lock:
+        cache = _shared_caches.get(path)
+        if cache is None:
+            cache = _shared_caches[path] = EmbeddingCache(path)
+        return cache
+
+
+class CachedEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Wraps an embedding function so only documents missing from ``cache`` are embedded.
+
+    Misses from one call are sent to the wrapped function as a single batch.
+    Vectors are stored and returned as float32 values, cached or not.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbeddingFunction,
+        namespace: str,
+        cache: Optional[EmbeddingCache] = None,
+    ) -> None:
+        self.embedder = embedder
+        self.namespace = namespace
+        self.cache = cache if cache is not None else get_embedding_cache()
+
+    def __call__(self, input: Documents) -> Embeddings:
+        texts = [input] if isinstance(input, str) else list(input)
+        hashes = [content_hash(text) for text in texts]
+        vectors = self.cache.get_many(self.namespace, hashes)
+        missing = [
+            (digest, text)
+            for digest, text in dict(zip(hashes, texts)).items()
+            if digest not in vectors
+        ]
+        if missing:
+            embedded = self.embedder([text for _, text in missing])
+            fresh = {
+                digest: array("f", vector).tolist()
+                for (digest, _), vector in zip(missing, embedded)
+            }
+            self.cache.put_many(self.namespace, fresh)
+            vectors.update(fresh)
+        return [vectors[digest] for digest in hashes]
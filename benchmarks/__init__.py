@@ -0,0 +1 @@
+"""Micro-benchmarks for Liber8 hot paths."""
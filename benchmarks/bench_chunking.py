@@ -0,0 +1,107 @@
+"""Retrieval hit rate against tokens retrieved for fixed-size and structure-aware chunking.
+
+Run with ``python -m benchmarks.bench_chunking [--services N] [--top-k K]``.
+A synthetic handbook (one section per service, with configuration prose and
+an inventory table) is chunked by each strategy and indexed with BM25. Every
+query asks for one configuration value or one inventory row; it is a hit if
+a top-k chunk contains the answer. Tokens are those of the top-k chunks, i.e.
+what a prompt would pay for the retrieved context.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import random
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from src.text_index import HybridIndex
+
+# Loaded from its file: the vendored role-system package needs the whole crew runtime to import.
+_CHUNKING_PATH = Path(__file__).resolve().parents[1] / "beast-integration" / "role-system" / "knowledge" / "chunking.py"
+_spec = importlib.util.spec_from_file_location("role_system_chunking", _CHUNKING_PATH)
+chunking = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(chunking)  # type: ignore[union-attr]
+
+ATTRIBUTES = ["timeout", "retry limit", "region", "owner", "log level", "cache size", "queue depth", "port"]
+FILLER = [
+    "Changes are rolled out behind a feature flag and reviewed by the on-call engineer.",
+    "The service reads its configuration at startup and again on every reload signal.",
+    "Operators should prefer the dashboard over editing values by hand.",
+    "Defaults were chosen after the last capacity review and are revisited every quarter.",
+    "All values are validated before the service accepts traffic.",
+    "Metrics for this setting are exported to the shared monitoring stack.",
+]
+Query = Tuple[str, str]  # (question, answer that must appear in a retrieved chunk)
+
+
+def build_corpus(services: int, seed: int = 7) -> Tuple[str, List[Query]]:
+    rng = random.Random(seed)
+    lines: List[str] = ["# Platform handbook", ""]
+    queries: List[Query] = []
+    for index in range(services):
+        name = f"svc{index:03d}"
+        lines += [f"## Service {name}", "", "### Configuration", ""]
+        for attribute in ATTRIBUTES:
+            value = f"v{rng.randrange(10**6):06d}"
+            prose = " ".join(rng.sample(FILLER, 3))
+            lines += [f"The {attribute} is set to {value}. {prose}", ""]
+            queries.append((f"{name} {attribute}", value))
+        lines += ["### Inventory", "", "sku,item,warehouse,quantity"]
+        for row in range(12):
+            sku = f"{name}-sku{row:02d}"
+            warehouse = f"wh{rng.randrange(100):02d}"
+            lines.append(f"{sku},part {rng.randrange(1000)},{warehouse},{rng.randrange(500)}")
+            if row % 4 == 0:
+                queries.append((f"{sku} warehouse", f"{sku},"))
+        lines.append("")
+    return "\n".join(lines), queries
+
+
+def strategies(count: Callable[[str], int]) -> List[Tuple[str, Callable[[str], List[str]]]]:
+    fixed = [(size, size // 20) for size in (4000, 1000, 500)]
+    return [
+        *(
+            (f"fixed {size}/{overlap} chars", lambda text, s=size, o=overlap: chunking.fixed_size_chunks(text, s, o))
+            for size, overlap in fixed
+        ),
+        *(
+            (f"structured {tokens} tokens", chunking.StructuredChunker(tokens, count).chunk_text)
+            for tokens in (512, 256, 128)
+        ),
+    ]
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--services", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=3)
+    args = parser.parse_args(argv)
+    text, queries = build_corpus(args.services)
+    count = chunking.default_token_counter()
+    print(f"{len(text) / 1e6:.1f} MB corpus, {count(text)} tokens, {len(queries)} queries, top-{args.top_k}")
+    for name, chunk in strategies(count):
+        start = time.perf_counter()
+        chunks = chunk(text)
+        chunk_elapsed = time.perf_counter() - start
+        index = HybridIndex()
+        index.add_many([(str(position), body) for position, body in enumerate(chunks)])
+        hits = 0
+        tokens = 0
+        for question, answer in queries:
+            scores = index.search(question)
+            top = sorted(scores, key=scores.__getitem__, reverse=True)[: args.top_k]
+            retrieved = [chunks[int(doc_id)] for doc_id in top]
+            hits += any(answer in body for body in retrieved)
+            tokens += sum(count(body) for body in retrieved)
+        print(
+            f"{name:<26} {len(chunks):>7} chunks {hits / len(queries):>8.1%} hit rate"
+            f" {tokens / len(queries):>8.0f} tokens/query {1000 * hits / max(tokens, 1):>7.2f} hits/1k tokens"
+            f" {len(text) / 1e6 / chunk_elapsed:>8.1f} MB/s chunking"
+        )
+
+
+if __name__ == "__main__":
+    main()
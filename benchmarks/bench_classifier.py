@@ -0,0 +1,87 @@
+"""Command classifier throughput over a corpus of agent-style commands.
+
+Run with ``python -m benchmarks.bench_classifier [--rounds N]``. Reports cold
+(cache cleared before every pass) and warm (cached) classifications per second.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List
+
+from src.execution.classifier import classifier_cache_info, classify_command, clear_classifier_cache
+
+CORPUS: List[str] = [
+    "ls",
+    "ls -la src",
+    "cat README.md",
+    "cat src/cli.py | head -n 40",
+    "git status",
+    "git status --short",
+    "git diff HEAD~1 -- src/eventlog.py",
+    "git log --oneline -n 20",
+    "git reset --hard HEAD",
+    "git clean -fdx",
+    "python -m unittest discover -s tests",
+    "python3 -m unittest tests.test_contracts",
+    'python -c "import sys; print(sys.version)"',
+    "python -m pytest -q",
+    "pip install requests",
+    "npm install --save-dev typescript",
+    "curl -sS https://example.com/health",
+    "wget https://example.com/archive.tar.gz",
+    "mkdir -p build/output",
+    "touch build/.keep",
+    "rm -rf build",
+    "rm -f /tmp/liber8-scratch.txt",
+    "echo hello > /tmp/liber8-bench-out.txt",
+    "echo data > README.md",
+    "echo more >> notes.txt",
+    "ls && rm -rf /tmp/test",
+    "ls; cat setup.cfg; git status",
+    "grep -rn TODO src | wc -l",
+    "find . -name '*.py' -newer setup.cfg",
+    "sed -n '1,20p' src/contracts.py",
+    'echo "a && b"',
+    "shutdown -h now",
+    "dir C:\\\\Users",
+    "type notes.txt",
+    "Remove-Item -Recurse build",
+    "Invoke-WebRequest https://example.com",
+    "make test",
+    "docker ps",
+    "uname -a",
+    "",
+]
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        clear_classifier_cache()
+        for command in CORPUS:
+            classify_command(command)
+    cold = time.perf_counter() - start
+
+    clear_classifier_cache()
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for command in CORPUS:
+            classify_command(command)
+    warm = time.perf_counter() - start
+
+    total = args.rounds * len(CORPUS)
+    print(f"corpus: {len(CORPUS)} commands x {args.rounds} rounds")
+    print(f"cold: {total / cold:,.0f} classifications/s")
+    print(f"warm: {total / warm:,.0f} classifications/s")
+    print(f"cache: {classifier_cache_info()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
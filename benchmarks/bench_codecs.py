@@ -0,0 +1,50 @@
+"""On-disk size and read throughput of each record codec.
+
+Run with ``python -m benchmarks.bench_codecs [--records N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from src.eventlog import EventLog, EventLogWriter
+from src.serialization import get_codec
+
+from .bench_eventlog import _records
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=64)
+    args = parser.parse_args(argv)
+    records = _records(args.records)
+    specs = ["jsonl", "binary", "binary+zlib"]
+    try:
+        get_codec("binary+zstd")
+        specs.append("binary+zstd")
+    except ValueError:
+        pass
+    for spec in specs:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "eventlog.jsonl"
+            start = time.perf_counter()
+            with EventLogWriter(path, max_batch=args.batch, flush_interval=None, codec=get_codec(spec)) as writer:
+                writer.extend(records)
+            write_elapsed = time.perf_counter() - start
+            size = path.stat().st_size
+            start = time.perf_counter()
+            count = sum(1 for _ in EventLog(path).iter(validate=False))
+            read_elapsed = time.perf_counter() - start
+        print(
+            f"{spec:<14} {size / 1024:>10.1f} KiB"
+            f" {len(records) / write_elapsed:>12.0f} writes/s {count / read_elapsed:>12.0f} reads/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Construct / to_dict / from_dict throughput for each contract type.
+
+Run with ``python -m benchmarks.bench_contracts [--number N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.contracts import EventRecord, MemoryBlock, QueryPlan, TagSet, WritebackPackage
+
+
+def _tags() -> TagSet:
+    return TagSet(
+        schema_version="v0",
+        tags={"intent": "bench", "domain": "contracts", "task_length": 42},
+        uncertainty={"intent": 0.1},
+    )
+
+
+def _query_plan() -> QueryPlan:
+    return QueryPlan(
+        filters={"tags": {"intent": "bench"}},
+        limits=5,
+        recency_bias=0.5,
+        diversity_rules=["unique_sources"],
+        expansion_rules=["synonyms"],
+        scoring_knobs={"freshness": 0.3, "relevance": 0.7},
+    )
+
+
+def _memory_block() -> MemoryBlock:
+    return MemoryBlock(
+        content="SYNTHESIS: benchmark contracts",
+        tags=_tags(),
+        provenance={"source": "bench"},
+        lane="episodic",
+        confidence=0.6,
+    )
+
+
+def _writeback() -> WritebackPackage:
+    return WritebackPackage(
+        episode="SYNTHESIS: benchmark contracts",
+        distilled_facts=["benchmark contracts"],
+        tags=_tags(),
+        evaluation_outcome="ok",
+        promotion_notes="stored in episodic lane",
+    )
+
+
+def _event_record() -> EventRecord:
+    return EventRecord(
+        task="benchmark contracts",
+        tags=_tags(),
+        query_plan=_query_plan(),
+        retrieved_ids=["a", "b", "c"],
+        actions=["tag_extraction", "memory_read", "synthesis", "memory_write", "event_log"],
+        tool_calls=[{"name": "tagger", "fake": True}],
+        validations=["contracts_v0"],
+        outcome="success",
+        provenance={"writeback": _writeback().to_dict(), "query_plan": _query_plan().to_dict()},
+    )
+
+
+CASES: List[Tuple[str, Callable[[], Any]]] = [
+    ("TagSet", _tags),
+    ("QueryPlan", _query_plan),
+    ("MemoryBlock", _memory_block),
+    ("WritebackPackage", _writeback),
+    ("EventRecord", _event_record),
+]
+
+
+def run(number: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for name, factory in CASES:
+        instance = factory()
+        payload = instance.to_dict()
+        cls = type(instance)
+        timings = {
+            "construct": timeit.timeit(factory, number=number),
+            "to_dict": timeit.timeit(instance.to_dict, number=number),
+            "from_dict": timeit.timeit(lambda: cls.from_dict(payload), number=number),
+            "from_dict_trusted": timeit.timeit(lambda: cls.from_dict(payload, validate=False), number=number),
+        }
+        results[name] = {label: number / seconds for label, seconds in timings.items()}
+    return results
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args(argv)
+    results = run(args.number)
+    columns = ["construct", "to_dict", "from_dict", "from_dict_trusted"]
+    print(f"{'contract':<18}" + "".join(f"{column:>20}" for column in columns) + "   (ops/s)")
+    for name, rates in results.items():
+        print(f"{name:<18}" + "".join(f"{rates[column]:>20.0f}" for column in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compare EventLog append throughput against the batching EventLogWriter.
+
+Run with ``python -m benchmarks.bench_eventlog [--records N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from src.contracts import EventRecord, QueryPlan, TagSet
+from src.eventlog import EventLog, EventLogWriter
+
+
+def _records(count: int) -> List[EventRecord]:
+    tags = TagSet(schema_version="v0", tags={"intent": "bench"})
+    plan = QueryPlan(filters={}, limits=5, recency_bias=0.5)
+    return [
+        EventRecord(
+            task=f"bench task {idx}",
+            tags=tags,
+            query_plan=plan,
+            retrieved_ids=[],
+            actions=["event_log"],
+            tool_calls=[],
+            validations=["contracts_v0"],
+            outcome="success",
+            provenance={"source": "bench"},
+        )
+        for idx in range(count)
+    ]
+
+
+def _per_record_append(path: Path, records: List[EventRecord]) -> None:
+    log = EventLog(path)
+    for record in records:
+        log.append(record)
+
+
+def _writer(durability: str, max_batch: int) -> Callable[[Path, List[EventRecord]], None]:
+    def run(path: Path, records: List[EventRecord]) -> None:
+        with EventLogWriter(path, max_batch=max_batch, flush_interval=None, durability=durability) as writer:
+            writer.extend(records)
+
+    return run
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=5000)
+    args = parser.parse_args(argv)
+    records = _records(args.records)
+    cases = [
+        ("EventLog.append (open/close per record)", _per_record_append),
+        ("EventLogWriter durability=none batch=64", _writer("none", 64)),
+        ("EventLogWriter durability=batch batch=64", _writer("batch", 64)),
+        ("EventLogWriter durability=record", _writer("record", 1)),
+    ]
+    for label, run in cases:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "eventlog.jsonl"
+            start = time.perf_counter()
+            run(path, records)
+            elapsed = time.perf_counter() - start
+        print(f"{label:<45} {len(records) / elapsed:>12.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
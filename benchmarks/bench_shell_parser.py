@@ -0,0 +1,51 @@
+"""Shell tokenizer throughput.
+
+Run with ``python -m benchmarks.bench_shell_parser [--rounds N]``. Reports
+commands/s over the classifier corpus and MB/s on long generated command lines,
+which should stay flat as length grows (the tokenizer is a single pass).
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List
+
+from benchmarks.bench_classifier import CORPUS
+from src.execution.shell_parser import ShellSyntaxError, parse
+
+_UNIT = "git status 2>&1 | grep -n \"a && b\" ; echo $(date) `id` || ls -la 'x;y' && "
+
+
+def _parse_all(commands: List[str]) -> None:
+    for command in commands:
+        try:
+            parse(command)
+        except ShellSyntaxError:
+            pass
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        _parse_all(CORPUS)
+    elapsed = time.perf_counter() - start
+    print(f"corpus: {args.rounds * len(CORPUS) / elapsed:,.0f} commands/s")
+
+    for repeat in (10, 100, 1000):
+        command = _UNIT * repeat + "true"
+        rounds = max(1, 2000 // repeat)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            parse(command)
+        elapsed = time.perf_counter() - start
+        print(f"{len(command):>8} chars: {rounds * len(command) / elapsed / 1e6:6.2f} MB/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
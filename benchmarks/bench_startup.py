@@ -0,0 +1,55 @@
+"""Cold-start import cost of the CLI, measured with ``python -X importtime``.
+
+Run with ``python -m benchmarks.bench_startup [--module src.cli] [--top N] [--repeat N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def measure_import(module: str = "src.cli") -> Dict[str, Tuple[int, int]]:
+    """Import ``module`` in a fresh interpreter; returns ``{name: (self_us, cumulative_us)}``."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: Dict[str, Tuple[int, int]] = {}
+    for line in completed.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            timings[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return timings
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="src.cli")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    runs = [measure_import(args.module) for _ in range(args.repeat)]
+    totals = [run[args.module][1] for run in runs]
+    print(f"{args.module}: median {statistics.median(totals) / 1000:.1f} ms over {args.repeat} runs")
+    print(f"modules imported: {len(runs[-1])}")
+    slowest = sorted(runs[-1].items(), key=lambda item: item[1][0], reverse=True)[: args.top]
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"  {name:<40} self {self_us / 1000:7.2f} ms  cumulative {cumulative_us / 1000:7.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..contracts import MemoryBlock, QueryPlan, TagSet
-from ..memory_adapter import FileSystemMemoryAdapter
+from ..memory_adapter import MemoryStore
 
 
-def build_query_plan(tags: TagSet) -> QueryPlan:
+def build_query_plan(tags: TagSet, query: Optional[str] = None) -> QueryPlan:
+    filters: Dict[str, Any] = {"tags": tags.tags}
+    if query:
+        filters["query"] = query
     return QueryPlan(
-        filters={"tags": tags.tags},
+        filters=filters,
         limits=5,
         recency_bias=0.5,
         diversity_rules=["unique_sources"],
@@ -21,10 +24,11 @@ def build_query_plan(tags: TagSet) -> QueryPlan:
 
 def retrieve(
     tags: TagSet,
-    memory_adapter: FileSystemMemoryAdapter,
+    memory_adapter: MemoryStore,
     *,
     query_plan: QueryPlan | None = None,
+    query: Optional[str] = None,
 ) -> Tuple[List[MemoryBlock], QueryPlan]:
-    plan = query_plan or build_query_plan(tags)
+    plan = query_plan or build_query_plan(tags, query)
     blocks = memory_adapter.read(tags, query_plan=plan)
     return blocks, plan
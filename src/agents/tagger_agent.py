@@ -2,14 +2,48 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from ..contracts import TagSet
-from ..tagger import Tagger
+from ..tagger import Tagger, TaggerService, TagResult
+
+_services: Dict[Tuple[bool, Optional[str]], TaggerService] = {}
+_services_lock = threading.Lock()
+
+
+def get_tagger_service(*, fake_backend: bool = False, model_endpoint: Optional[str] = None) -> TaggerService:
+    """Return the process-wide TaggerService for this backend configuration."""
+    model_endpoint = model_endpoint or os.getenv("LIBR8_MODEL_ENDPOINT")
+    key = (fake_backend, model_endpoint)
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            tagger = Tagger(fake_backend=fake_backend, model_endpoint=model_endpoint)
+            service = _services[key] = TaggerService(tagger)
+    return service
+
+
+def reset_tagger_services() -> None:
+    with _services_lock:
+        services = list(_services.values())
+        _services.clear()
+    for service in services:
+        service.tagger.close()
 
 
 def extract_tags(task: str, *, fake_backend: bool = False, model_endpoint: Optional[str] = None) -> TagSet:
-    tagger = Tagger(fake_backend=fake_backend)
-    if model_endpoint is not None:
-        tagger.model_endpoint = model_endpoint
-    return tagger.extract_tags(task)
+    return get_tagger_service(fake_backend=fake_backend, model_endpoint=model_endpoint).extract_tags(task)
+
+
+def extract(task: str, *, fake_backend: bool = False, model_endpoint: Optional[str] = None) -> TagResult:
+    """Like ``extract_tags`` but also returns the measured backend latency and cost."""
+    return get_tagger_service(fake_backend=fake_backend, model_endpoint=model_endpoint).extract([task])[0]
+
+
+def extract_tags_many(
+    tasks: Iterable[str], *, fake_backend: bool = False, model_endpoint: Optional[str] = None
+) -> List[TagSet]:
+    service = get_tagger_service(fake_backend=fake_backend, model_endpoint=model_endpoint)
+    return service.extract_tags_many(tasks)
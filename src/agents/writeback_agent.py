@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from ..contracts import MemoryBlock, TagSet
-from ..memory_adapter import FileSystemMemoryAdapter
+from ..memory_adapter import MemoryStore
 
 
-def write_memory(synthesis: str, tags: TagSet, memory_adapter: FileSystemMemoryAdapter) -> str:
+def write_memory(synthesis: str, tags: TagSet, memory_adapter: MemoryStore) -> str:
     memory_block = MemoryBlock(
         content=synthesis,
         tags=tags,
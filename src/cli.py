@@ -4,13 +4,20 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import IO, TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
 
-from .contracts import EventRecord
-from .eventlog import EventLog
-from .orchestration.router import run_router
+# Subcommands import what they need when they run: ``liber8 show-runs`` should
+# not pay for the router, agents, tagger backend or asyncio at start-up.
+# tests/test_cli_startup.py enforces this.
+if TYPE_CHECKING:
+    from .contracts import EventRecord
+
+DEFAULT_PARALLELISM = 8  # keep in sync with orchestration.async_router.DEFAULT_CONCURRENCY
+DEFAULT_SEGMENT_BYTES = 4 * 1024 * 1024  # keep in sync with segment_store.DEFAULT_SEGMENT_BYTES
 
 
 def _default_run_dir() -> Path:
@@ -19,12 +26,13 @@ def _default_run_dir() -> Path:
 
 
 def _read_latest_events(paths: Iterable[Path]) -> list[EventRecord]:
+    from .eventlog import EventLog
+
     events: list[EventRecord] = []
     for path in paths:
         if not path.exists():
             continue
-        log = EventLog(path)
-        records = log.read_all()
+        records = EventLog(path).read_last(1)
         if records:
             events.append(records[-1])
     return events
@@ -39,6 +47,11 @@ def _find_run_dirs(base_dir: Path, limit: int) -> list[Path]:
 
 
 def run_command(args: argparse.Namespace) -> int:
+    if args.daemon:
+        return _run_via_daemon(args)
+
+    from .orchestration.router import run_router
+
     storage_dir = Path(args.storage) if args.storage else _default_run_dir()
     storage_dir.mkdir(parents=True, exist_ok=True)
     event = run_router(
@@ -46,6 +59,7 @@ def run_command(args: argparse.Namespace) -> int:
         storage_dir,
         fake_backend=args.fake,
         model_endpoint=args.model_endpoint,
+        text_index=args.text_index,
     )
     if args.print_json:
         print(json.dumps(event.to_dict()))
@@ -54,6 +68,165 @@ def run_command(args: argparse.Namespace) -> int:
     return 0
 
 
+def _run_via_daemon(args: argparse.Namespace) -> int:
+    from .daemon import DaemonClient, DaemonError, default_socket_path
+
+    if args.fake or args.model_endpoint or args.text_index:
+        print("--fake, --model-endpoint and --text-index are set when starting liber8 serve, not with --daemon")
+        return 1
+    if args.socket:
+        socket_path = Path(args.socket)
+    else:  # the same default as ``serve``: the socket lives in the daemon's storage directory
+        socket_path = default_socket_path(Path(args.storage)) if args.storage else default_socket_path()
+    try:
+        with DaemonClient(socket_path) as client:
+            storage_dir = client.ping()["storage"]
+            event = client.run([args.task])[0]
+    except (DaemonError, OSError) as exc:
+        print(f"liber8 daemon at {socket_path} unavailable: {exc}")
+        return 1
+    if args.print_json:
+        print(json.dumps(event.to_dict()))
+    else:
+        print(f"{event.id} {event.outcome} {storage_dir}")
+    return 0
+
+
+def serve_command(args: argparse.Namespace) -> int:
+    from .daemon import DEFAULT_STORAGE, DaemonError, RouterDaemon
+
+    daemon = RouterDaemon(
+        Path(args.storage) if args.storage else DEFAULT_STORAGE,
+        Path(args.socket) if args.socket else None,
+        fake_backend=args.fake,
+        model_endpoint=args.model_endpoint,
+        concurrency=args.parallelism,
+        text_index=args.text_index,
+    )
+    print(f"liber8 serving {daemon.storage_dir} on {daemon.socket_path}", flush=True)
+    try:
+        daemon.serve_forever()
+    except DaemonError as exc:
+        print(str(exc))
+        return 1
+    return 0
+
+
+def _parse_task_line(line: str) -> Optional[str]:
+    """A JSONL line is a JSON string or an object with a ``task`` key; anything else is plain text.
+
+    Blank lines and blank tasks are skipped (None); a JSON object without a
+    string ``task`` raises ValueError.
+    """
+    line = line.strip()
+    if not line:
+        return None
+    if line[0] in "{\"":
+        try:
+            payload = json.loads(line)
+        except ValueError:
+            return line
+        if isinstance(payload, str):
+            return payload if payload.strip() else None
+        if isinstance(payload, dict):
+            task = payload.get("task")
+            if not isinstance(task, str):
+                raise ValueError('JSON object without a string "task"')
+            return task if task.strip() else None
+    return line
+
+
+def _iter_tasks(handle: IO[str], skipped: List[int]) -> Iterator[str]:
+    """Tasks of ``handle``; the numbers of malformed lines are appended to ``skipped``."""
+    for number, line in enumerate(handle, start=1):
+        try:
+            task = _parse_task_line(line)
+        except ValueError:
+            skipped.append(number)
+            continue
+        if task is not None:
+            yield task
+
+
+def _chunks(tasks: Iterable[str], size: int) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    for task in tasks:
+        chunk.append(task)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _run_batch(args: argparse.Namespace, handle: IO[str], storage_dir: Path) -> Dict[str, object]:
+    from .eventlog import EventLogWriter
+    from .orchestration.async_router import run_many
+    from .orchestration.router import open_memory
+
+    adapter = open_memory(storage_dir, text_index=args.text_index)
+    failures: Dict[str, int] = {}
+    skipped: List[int] = []
+    count = 0
+    start = time.monotonic()
+    with EventLogWriter(storage_dir / "eventlog.jsonl") as writer:
+        for chunk in _chunks(_iter_tasks(handle, skipped), args.chunk_size):
+            events = await run_many(
+                chunk,
+                storage_dir,
+                concurrency=args.parallelism,
+                fake_backend=args.fake,
+                model_endpoint=args.model_endpoint,
+                memory_adapter=adapter,
+                event_writer=writer,
+            )
+            count += len(events)
+            for event in events:
+                if event.outcome != "success":
+                    key = event.failure_class or "unknown"
+                    failures[key] = failures.get(key, 0) + 1
+    elapsed = time.monotonic() - start
+    return {
+        "tasks": count,
+        "failures": failures,
+        "skipped_lines": skipped,
+        "seconds": elapsed,
+        "tasks_per_second": count / elapsed if elapsed > 0 else 0.0,
+        "storage": str(storage_dir),
+    }
+
+
+def run_batch_command(args: argparse.Namespace) -> int:
+    import asyncio
+
+    if args.parallelism < 1 or args.chunk_size < 1:
+        print("--parallelism and --chunk-size must be at least 1")
+        return 1
+    storage_dir = Path(args.storage) if args.storage else _default_run_dir()
+    storage_dir.mkdir(parents=True, exist_ok=True)
+    if args.source == "-":
+        summary = asyncio.run(_run_batch(args, sys.stdin, storage_dir))
+    else:
+        source = Path(args.source)
+        if not source.exists():
+            print(f"task file not found: {source}")
+            return 1
+        with source.open(encoding="utf-8") as handle:
+            summary = asyncio.run(_run_batch(args, handle, storage_dir))
+    if args.print_json:
+        print(json.dumps(summary))
+        return 0
+    print(
+        f"{summary['tasks']} tasks in {summary['seconds']:.2f}s "
+        f"({summary['tasks_per_second']:.1f} tasks/sec) {storage_dir}"
+    )
+    for failure_class, failed in sorted(summary["failures"].items()):
+        print(f"  {failure_class}: {failed}")
+    if summary["skipped_lines"]:
+        print(f"  skipped malformed lines: {', '.join(map(str, summary['skipped_lines']))}")
+    return 0
+
+
 def show_runs_command(args: argparse.Namespace) -> int:
     base_dir = Path(args.storage) if args.storage else Path(".runs")
     run_dirs = _find_run_dirs(base_dir, args.limit)
@@ -64,22 +237,208 @@ def show_runs_command(args: argparse.Namespace) -> int:
     return 0
 
 
+def _iter_run_events(base_dir: Path) -> Iterator[EventRecord]:
+    from .eventlog import EventLog
+
+    if not base_dir.exists():
+        return
+    candidates = [base_dir, *sorted(path for path in base_dir.iterdir() if path.is_dir())]
+    for run_dir in candidates:
+        log_path = run_dir / "eventlog.jsonl"
+        if log_path.exists():
+            yield from EventLog(log_path).iter(validate=False)
+
+
+def stats_command(args: argparse.Namespace) -> int:
+    from .metrics import summarize_stages
+
+    base_dir = Path(args.storage) if args.storage else Path(".runs")
+    summary = summarize_stages(_iter_run_events(base_dir))
+    if args.print_json:
+        print(json.dumps(summary))
+        return 0
+    if not summary:
+        print(f"no timed events under {base_dir}")
+        return 0
+    print(f"{'stage':<16}{'count':>7}{'p50_ms':>10}{'p95_ms':>10}{'p99_ms':>10}{'read_B':>12}{'written_B':>12}")
+    for stage, row in summary.items():
+        print(
+            f"{stage:<16}{row['count']:>7}{row['p50'] * 1000:>10.2f}{row['p95'] * 1000:>10.2f}"
+            f"{row['p99'] * 1000:>10.2f}{row['bytes_read']:>12}{row['bytes_written']:>12}"
+        )
+    return 0
+
+
+def migrate_memory_command(args: argparse.Namespace) -> int:
+    from .segment_store import RUN_STORE_DIR, migrate_jsonl_store
+
+    source = Path(args.source)
+    if not source.exists():
+        print(f"memory store not found: {source}")
+        return 1
+    target = Path(args.target) if args.target else source.parent / RUN_STORE_DIR
+    adapter = migrate_jsonl_store(source, target, segment_bytes=args.segment_bytes)
+    print(f"migrated {len(adapter)} blocks to {adapter.directory}")
+    return 0
+
+
+def convert_store_command(args: argparse.Namespace) -> int:
+    from .serialization import convert_store, get_codec
+
+    source = Path(args.path)
+    if not source.exists():
+        print(f"store not found: {source}")
+        return 1
+    try:
+        codec = get_codec(args.codec)
+    except ValueError as exc:
+        print(f"invalid codec: {exc}")
+        return 2
+    target = Path(args.output) if args.output else source
+    count = convert_store(source, target, codec)
+    print(f"converted {count} records to {args.codec} in {target}")
+    return 0
+
+
+def lifecycle_command(args: argparse.Namespace) -> int:
+    from .lifecycle import LifecyclePolicy, run_lifecycle
+    from .memory_adapter import FileSystemMemoryAdapter
+    from .segment_store import CURRENT_FILE, RUN_STORE_DIR, SegmentMemoryAdapter
+
+    path = Path(args.path)
+    if (path / CURRENT_FILE).exists():
+        adapter = SegmentMemoryAdapter(path)
+    elif (path / RUN_STORE_DIR / CURRENT_FILE).exists():
+        adapter = SegmentMemoryAdapter(path / RUN_STORE_DIR)
+    elif path.is_dir() and (path / "memory.jsonl").exists():
+        adapter = FileSystemMemoryAdapter(path / "memory.jsonl")
+    elif path.is_file():
+        adapter = FileSystemMemoryAdapter(path)
+    else:
+        print(f"memory store not found: {path}")
+        return 1
+    try:
+        policy = LifecyclePolicy(episodic_ttl_hours=args.episodic_ttl_hours, promote_after=args.promote_after)
+    except ValueError as exc:
+        print(f"invalid policy: {exc}")
+        return 2
+    report = run_lifecycle(adapter, policy, dry_run=args.dry_run)
+    if args.print_json:
+        print(json.dumps(report.to_dict()))
+        return 0
+    verb = "would keep" if report.dry_run else "kept"
+    print(
+        f"{verb} {report.blocks_after}/{report.blocks_before} blocks: "
+        f"{report.expired} expired, {report.merged} merged, {report.promoted} promoted"
+    )
+    if not report.dry_run:
+        print(
+            f"reclaimed {report.bytes_reclaimed} bytes ({report.bytes_before} -> {report.bytes_after}); "
+            f"read {report.read_seconds_before * 1000:.2f} ms -> {report.read_seconds_after * 1000:.2f} ms"
+        )
+    return 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="liber8")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     run_parser = subparsers.add_parser("run", help="Run a task")
     run_parser.add_argument("task", help="Task string")
-    run_parser.add_argument("--storage", help="Storage directory path")
+    run_parser.add_argument("--storage", help="Storage directory path (with --daemon: the one given to serve)")
     run_parser.add_argument("--fake", action="store_true", help="Use fake backend")
     run_parser.add_argument("--model-endpoint", help="Model endpoint URL")
     run_parser.add_argument("--print-json", action="store_true", help="Print full EventRecord JSON")
+    run_parser.add_argument(
+        "--text-index",
+        action="store_true",
+        help="Also match memory content against the task text (BM25, hashed vectors, synonyms.json)",
+    )
+    run_parser.add_argument("--daemon", action="store_true", help="Forward the task to a running liber8 serve")
+    run_parser.add_argument(
+        "--socket", help="Daemon socket path (default: STORAGE/liber8.sock, STORAGE being serve's --storage)"
+    )
     run_parser.set_defaults(func=run_command)
 
+    serve_parser = subparsers.add_parser("serve", help="Keep the router resident and accept tasks on a socket")
+    serve_parser.add_argument("--storage", help="Storage directory path (default: .runs/daemon)")
+    serve_parser.add_argument("--socket", help="Unix socket path (default: STORAGE/liber8.sock)")
+    serve_parser.add_argument("--fake", action="store_true", help="Use fake backend")
+    serve_parser.add_argument("--model-endpoint", help="Model endpoint URL")
+    serve_parser.add_argument(
+        "--parallelism", type=int, default=DEFAULT_PARALLELISM, help="Tasks tagged/retrieved concurrently"
+    )
+    serve_parser.add_argument(
+        "--text-index",
+        action="store_true",
+        help="Keep a text index (BM25, hashed vectors, synonyms.json) over memory content",
+    )
+    serve_parser.set_defaults(func=serve_command)
+
+    batch_parser = subparsers.add_parser("run-batch", help="Run many tasks from a file or stdin in one process")
+    batch_parser.add_argument("source", help="JSONL or text file with one task per line, or - for stdin")
+    batch_parser.add_argument("--storage", help="Storage directory path")
+    batch_parser.add_argument("--fake", action="store_true", help="Use fake backend")
+    batch_parser.add_argument("--model-endpoint", help="Model endpoint URL")
+    batch_parser.add_argument(
+        "--parallelism", type=int, default=DEFAULT_PARALLELISM, help="Tasks tagged/retrieved concurrently"
+    )
+    batch_parser.add_argument("--chunk-size", type=int, default=256, help="Tasks read from the source per batch")
+    batch_parser.add_argument(
+        "--text-index",
+        action="store_true",
+        help="Also match memory content against each task's text (BM25, hashed vectors, synonyms.json)",
+    )
+    batch_parser.add_argument("--print-json", action="store_true", help="Print the summary as JSON")
+    batch_parser.set_defaults(func=run_batch_command)
+
     show_parser = subparsers.add_parser("show-runs", help="List latest runs")
     show_parser.add_argument("--storage", help="Base storage directory")
     show_parser.add_argument("--limit", type=int, default=5, help="Number of runs to list")
     show_parser.set_defaults(func=show_runs_command)
+
+    stats_parser = subparsers.add_parser("stats", help="Per-stage latency percentiles across runs")
+    stats_parser.add_argument("--storage", help="Base storage directory, or a single run directory")
+    stats_parser.add_argument("--print-json", action="store_true", help="Print the summary as JSON")
+    stats_parser.set_defaults(func=stats_command)
+
+    migrate_parser = subparsers.add_parser(
+        "migrate-memory", help="Convert a memory.jsonl store into a compacted segment store"
+    )
+    migrate_parser.add_argument("source", help="Path to memory.jsonl")
+    migrate_parser.add_argument(
+        "target",
+        nargs="?",
+        help="Segment store directory (default: memory/ beside the source, which the run directory then reads)",
+    )
+    migrate_parser.add_argument(
+        "--segment-bytes", type=int, default=DEFAULT_SEGMENT_BYTES, help="Roll segments after this many bytes"
+    )
+    migrate_parser.set_defaults(func=migrate_memory_command)
+
+    convert_parser = subparsers.add_parser(
+        "convert-store", help="Rewrite an event log or memory store with another codec"
+    )
+    convert_parser.add_argument("path", help="Path to eventlog.jsonl or memory.jsonl")
+    convert_parser.add_argument(
+        "--codec", required=True, help="Target codec: jsonl, binary, binary+zlib or binary+zstd"
+    )
+    convert_parser.add_argument("--output", help="Write to this path instead of converting in place")
+    convert_parser.set_defaults(func=convert_store_command)
+
+    lifecycle_parser = subparsers.add_parser(
+        "lifecycle", help="Expire, merge and promote memory blocks, then rewrite the store"
+    )
+    lifecycle_parser.add_argument("path", help="memory.jsonl, a run directory, or a segment store directory")
+    lifecycle_parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+    lifecycle_parser.add_argument(
+        "--episodic-ttl-hours", type=float, help="Expire episodic blocks not updated for this long"
+    )
+    lifecycle_parser.add_argument(
+        "--promote-after", type=int, default=3, help="Promote an episode after this many occurrences"
+    )
+    lifecycle_parser.add_argument("--print-json", action="store_true", help="Print the report as JSON")
+    lifecycle_parser.set_defaults(func=lifecycle_command)
     return parser
 
 
@@ -5,10 +5,11 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
+from .agents import tagger_agent
 from .contracts import EventRecord, MemoryBlock, QueryPlan, TagSet, WritebackPackage
 from .eventlog import EventLog
-from .memory_adapter import FileSystemMemoryAdapter
-from .tagger import Tagger
+from .metrics import StageTimer
+from .orchestration.router import open_memory
 
 
 def run_cognition_loop(
@@ -19,12 +20,14 @@ def run_cognition_loop(
     model_endpoint: Optional[str] = None,
 ) -> EventRecord:
     storage_dir = Path(storage_dir)
-    tagger = Tagger(fake_backend=fake_backend)
-    if model_endpoint is not None:
-        tagger.model_endpoint = model_endpoint
-    tags = tagger.extract_tags(task)
+    timer = StageTimer()
+    # The shared service keeps one backend (batcher thread and connections) per endpoint.
+    tagger = tagger_agent.get_tagger_service(fake_backend=fake_backend, model_endpoint=model_endpoint)
+    with timer.stage("tag_extraction"):
+        tag_result = tagger.extract([task])[0]
+    tags = tag_result.tags
 
-    memory_adapter = FileSystemMemoryAdapter(storage_dir / "memory.jsonl")
+    memory_adapter = open_memory(storage_dir)
     query_plan = QueryPlan(
         filters={"tags": tags.tags},
         limits=5,
@@ -33,18 +36,20 @@ def run_cognition_loop(
         expansion_rules=["synonyms"],
         scoring_knobs={"freshness": 0.3, "relevance": 0.7},
     )
-    retrieved = memory_adapter.read(tags, query_plan=query_plan)
+    with timer.stage("memory_read", memory_adapter):
+        retrieved = memory_adapter.read(tags, query_plan=query_plan)
 
-    synthesis = f"SYNTHESIS: {task} (retrieved {len(retrieved)} memories)"
-    writeback = WritebackPackage(
-        episode=synthesis,
-        distilled_facts=[task],
-        procedural_snippet=None,
-        tags=tags,
-        evaluation_outcome="ok",
-        promotion_notes="stored in episodic lane",
-        demotion_notes=None,
-    )
+    with timer.stage("synthesis"):
+        synthesis = f"SYNTHESIS: {task} (retrieved {len(retrieved)} memories)"
+        writeback = WritebackPackage(
+            episode=synthesis,
+            distilled_facts=[task],
+            procedural_snippet=None,
+            tags=tags,
+            evaluation_outcome="ok",
+            promotion_notes="stored in episodic lane",
+            demotion_notes=None,
+        )
 
     memory_block = MemoryBlock(
         content=synthesis,
@@ -53,7 +58,8 @@ def run_cognition_loop(
         lane="episodic",
         confidence=0.6,
     )
-    memory_adapter.write(memory_block)
+    with timer.stage("memory_write", memory_adapter):
+        memory_adapter.write(memory_block)
 
     event = EventRecord(
         task=task,
@@ -61,17 +67,18 @@ def run_cognition_loop(
         query_plan=query_plan,
         retrieved_ids=[block.id for block in retrieved],
         actions=["tag_extraction", "memory_read", "synthesis", "memory_write", "event_log"],
-        tool_calls=[{"name": "tagger", "fake": fake_backend}],
+        tool_calls=[tag_result.to_tool_call(fake=fake_backend)],
         validations=["contracts_v0"],
         outcome="success",
         failure_class=None,
         retries=0,
-        cost=0.0,
-        latency=0.0,
+        cost=tag_result.cost,
+        latency=timer.total,
         provenance={
             "writeback": writeback.to_dict(),
             "model_endpoint": tagger.model_endpoint,
             "query_plan": query_plan.to_dict(),
+            "stages": timer.to_dict(),
         },
     )
 
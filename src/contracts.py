@@ -5,8 +5,15 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import json
+import sys
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+
+_T = TypeVar("_T")
+
+# Slotted dataclasses are smaller and faster to construct; they need Python 3.10+.
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class ValidationError(ValueError):
@@ -29,6 +36,16 @@ def _ensure_jsonable(value: Any, path: str) -> None:
         raise ValidationError(f"Value at {path} is not JSON-serializable") from exc
 
 
+def _construct(cls: Type[_T], validate: bool, **values: Any) -> _T:
+    """Build a contract, skipping ``__post_init__`` checks for trusted payloads."""
+    if validate:
+        return cls(**values)
+    instance = object.__new__(cls)
+    for name, value in values.items():
+        object.__setattr__(instance, name, value)
+    return instance
+
+
 def _ensure_list_of_str(values: List[Any], path: str) -> None:
     _require(isinstance(values, list), f"{path} must be a list")
     for idx, value in enumerate(values):
@@ -41,7 +58,7 @@ def _ensure_dict_str_keys(values: Dict[Any, Any], path: str) -> None:
         _require(isinstance(key, str), f"{path} keys must be strings")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TagSet:
     schema_version: str
     tags: Dict[str, Any]
@@ -66,15 +83,17 @@ class TagSet:
         }
 
     @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "TagSet":
-        return cls(
+    def from_dict(cls, payload: Dict[str, Any], *, validate: bool = True) -> "TagSet":
+        return _construct(
+            cls,
+            validate,
             schema_version=payload["schema_version"],
             tags=payload["tags"],
             uncertainty=payload.get("uncertainty"),
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class QueryPlan:
     filters: Dict[str, Any]
     limits: int
@@ -104,8 +123,10 @@ class QueryPlan:
         }
 
     @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "QueryPlan":
-        return cls(
+    def from_dict(cls, payload: Dict[str, Any], *, validate: bool = True) -> "QueryPlan":
+        return _construct(
+            cls,
+            validate,
             filters=payload["filters"],
             limits=payload["limits"],
             recency_bias=payload["recency_bias"],
@@ -115,7 +136,7 @@ class QueryPlan:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MemoryBlock:
     content: str
     tags: TagSet
@@ -154,21 +175,23 @@ class MemoryBlock:
         }
 
     @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "MemoryBlock":
-        return cls(
-            id=payload.get("id", str(uuid.uuid4())),
+    def from_dict(cls, payload: Dict[str, Any], *, validate: bool = True) -> "MemoryBlock":
+        return _construct(
+            cls,
+            validate,
+            id=payload["id"] if "id" in payload else str(uuid.uuid4()),
             content=payload["content"],
-            tags=TagSet.from_dict(payload["tags"]),
+            tags=TagSet.from_dict(payload["tags"], validate=validate),
             provenance=payload.get("provenance", {}),
             lane=payload["lane"],
             confidence=payload["confidence"],
-            created_at=payload.get("created_at", _now_iso()),
-            updated_at=payload.get("updated_at", _now_iso()),
+            created_at=payload["created_at"] if "created_at" in payload else _now_iso(),
+            updated_at=payload["updated_at"] if "updated_at" in payload else _now_iso(),
             valid_until=payload.get("valid_until"),
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class WritebackPackage:
     episode: str
     distilled_facts: List[str]
@@ -202,19 +225,21 @@ class WritebackPackage:
         }
 
     @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "WritebackPackage":
-        return cls(
+    def from_dict(cls, payload: Dict[str, Any], *, validate: bool = True) -> "WritebackPackage":
+        return _construct(
+            cls,
+            validate,
             episode=payload["episode"],
             distilled_facts=payload.get("distilled_facts", []),
             procedural_snippet=payload.get("procedural_snippet"),
-            tags=TagSet.from_dict(payload["tags"]),
+            tags=TagSet.from_dict(payload["tags"], validate=validate),
             evaluation_outcome=payload["evaluation_outcome"],
             promotion_notes=payload.get("promotion_notes"),
             demotion_notes=payload.get("demotion_notes"),
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class EventRecord:
     task: str
     tags: TagSet
@@ -274,13 +299,15 @@ class EventRecord:
         }
 
     @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "EventRecord":
-        return cls(
-            id=payload.get("id", str(uuid.uuid4())),
-            timestamp=payload.get("timestamp", _now_iso()),
+    def from_dict(cls, payload: Dict[str, Any], *, validate: bool = True) -> "EventRecord":
+        return _construct(
+            cls,
+            validate,
+            id=payload["id"] if "id" in payload else str(uuid.uuid4()),
+            timestamp=payload["timestamp"] if "timestamp" in payload else _now_iso(),
             task=payload["task"],
-            tags=TagSet.from_dict(payload["tags"]),
-            query_plan=QueryPlan.from_dict(payload["query_plan"]),
+            tags=TagSet.from_dict(payload["tags"], validate=validate),
+            query_plan=QueryPlan.from_dict(payload["query_plan"], validate=validate),
             retrieved_ids=payload.get("retrieved_ids", []),
             actions=payload.get("actions", []),
             tool_calls=payload.get("tool_calls", []),
@@ -0,0 +1,229 @@
+"""Long-running router daemon serving tasks over a Unix domain socket.
+
+The daemon keeps one memory adapter, the process-wide tagger service (and its
+tag cache) and one EventLogWriter resident, so a forwarded task pays neither
+interpreter start-up nor store/index loading.
+
+Protocol: newline-delimited JSON over the socket. A connection may send any
+number of requests, each answered by one response line::
+
+    {"op": "run", "tasks": ["task", ...]}   -> {"ok": true, "events": [EventRecord dict, ...]}
+    {"op": "ping"}                          -> {"ok": true, "storage": "...", "pid": 123}
+    {"op": "shutdown"}                      -> {"ok": true}
+
+Failures are answered with ``{"ok": false, "error": "..."}``. ``"task": "..."``
+is accepted in place of ``"tasks"`` for a single task.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .contracts import EventRecord
+from .eventlog import EventLogWriter
+from .orchestration.async_router import DEFAULT_CONCURRENCY, run_many
+from .orchestration.router import open_memory
+
+DEFAULT_STORAGE = Path(".runs") / "daemon"
+SOCKET_NAME = "liber8.sock"
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+
+def default_socket_path(storage_dir: Path = DEFAULT_STORAGE) -> Path:
+    return Path(storage_dir) / SOCKET_NAME
+
+
+class DaemonError(RuntimeError):
+    """Raised by DaemonClient when the daemon answers with an error."""
+
+
+class RouterDaemon:
+    def __init__(
+        self,
+        storage_dir: Path = DEFAULT_STORAGE,
+        socket_path: Optional[Path] = None,
+        *,
+        fake_backend: bool = False,
+        model_endpoint: Optional[str] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        text_index: bool = False,
+    ) -> None:
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path(self.storage_dir)
+        self.fake_backend = fake_backend
+        self.model_endpoint = model_endpoint
+        self.concurrency = concurrency
+        self.adapter = open_memory(self.storage_dir, text_index=text_index)
+        self.writer: Optional[EventLogWriter] = None
+        self.ready = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._connections: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    def serve_forever(self) -> None:
+        asyncio.run(self.serve())
+
+    async def serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                self._loop.add_signal_handler(signum, self._stopping.set)
+        self._remove_stale_socket()
+        self.writer = EventLogWriter(self.storage_dir / "eventlog.jsonl")
+        server = await asyncio.start_unix_server(self._handle, path=str(self.socket_path), limit=MAX_REQUEST_BYTES)
+        try:
+            self.ready.set()
+            await self._stopping.wait()
+        finally:
+            server.close()
+            handlers = list(self._connections.values())
+            for handler in handlers:
+                handler.cancel()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await server.wait_closed()
+            self.writer.close()
+            self.socket_path.unlink(missing_ok=True)
+            self.ready.clear()
+            self._loop = None
+
+    def stop(self) -> None:
+        """Ask a running daemon to exit; safe to call from another thread."""
+        loop = self._loop
+        if loop is not None and self._stopping is not None:
+            try:
+                loop.call_soon_threadsafe(self._stopping.set)
+            except RuntimeError:  # the loop finished between the check and the call
+                pass
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections[writer] = task
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # request line over MAX_REQUEST_BYTES
+                    await self._respond(writer, {"ok": False, "error": "request too large"})
+                    return
+                if not line:
+                    return
+                response = await self._dispatch(line)
+                await self._respond(writer, response)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, response: Dict[str, Any]) -> None:
+        writer.write(json.dumps(response).encode("utf-8") + b"\n")
+        await writer.drain()
+
+    async def _dispatch(self, line: bytes) -> Dict[str, Any]:
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"ok": False, "error": "request is not valid JSON"}
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "request must be a JSON object"}
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "storage": str(self.storage_dir), "pid": os.getpid()}
+        if op == "shutdown":
+            assert self._stopping is not None
+            self._stopping.set()
+            return {"ok": True}
+        if op == "run":
+            tasks = request.get("tasks", [request["task"]] if "task" in request else None)
+            if not isinstance(tasks, list) or not tasks or not all(isinstance(task, str) for task in tasks):
+                return {"ok": False, "error": "run needs a task string or a non-empty tasks list"}
+            try:
+                events = await run_many(
+                    tasks,
+                    self.storage_dir,
+                    concurrency=self.concurrency,
+                    fake_backend=self.fake_backend,
+                    model_endpoint=self.model_endpoint,
+                    memory_adapter=self.adapter,
+                    event_writer=self.writer,
+                )
+            except Exception as exc:  # noqa: BLE001 - reported to the client, daemon keeps serving
+                return {"ok": False, "error": str(exc)}
+            return {"ok": True, "events": [event.to_dict() for event in events]}
+        return {"ok": False, "error": f"unknown op: {op!r}"}
+
+    def _remove_stale_socket(self) -> None:
+        if not self.socket_path.exists():
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(self.socket_path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                self.socket_path.unlink(missing_ok=True)
+                return
+        raise DaemonError(f"a daemon is already listening on {self.socket_path}")
+
+
+class DaemonClient:
+    """Blocking client for RouterDaemon; keeps one connection open across requests."""
+
+    def __init__(self, socket_path: Path, *, timeout: Optional[float] = 60.0) -> None:
+        self.socket_path = Path(socket_path)
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader: Any = None
+
+    def request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if self._sock is None:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.settimeout(self.timeout)
+            try:
+                self._sock.connect(str(self.socket_path))
+            except OSError:
+                self.close()
+                raise
+            self._reader = self._sock.makefile("rb")
+        self._sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        line = self._reader.readline()
+        if not line:
+            self.close()
+            raise ConnectionError("daemon closed the connection")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise DaemonError(response.get("error", "daemon request failed"))
+        return response
+
+    def run(self, tasks: List[str]) -> List[EventRecord]:
+        response = self.request({"op": "run", "tasks": tasks})
+        return [EventRecord.from_dict(payload, validate=False) for payload in response["events"]]
+
+    def ping(self) -> Dict[str, Any]:
+        return self.request({"op": "ping"})
+
+    def shutdown(self) -> None:
+        self.request({"op": "shutdown"})
+        self.close()
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
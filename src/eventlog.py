@@ -2,40 +2,280 @@
 
 from __future__ import annotations
 
-import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Union
 
 from .contracts import EventRecord
+from .serialization import (
+    REVERSE_BLOCK_SIZE,
+    Codec,
+    append_payloads,
+    iter_payloads_reverse,
+    read_header,
+    resolve_codec,
+)
+
+try:  # POSIX
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+DURABILITY_MODES = ("none", "batch", "record")
+
+TimeBound = Union[str, datetime]
+
+
+@contextmanager
+def _locked(handle: IO[bytes]) -> Iterator[None]:
+    """Hold an exclusive advisory lock so concurrent writers never interleave lines."""
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        return
+    handle.seek(0)  # pragma: no cover - Windows
+    msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)  # pragma: no cover
+    try:  # pragma: no cover
+        handle.seek(0, os.SEEK_END)
+        yield
+    finally:  # pragma: no cover
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
 
 
 class EventLog:
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, *, codec: Optional[Codec] = None) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.codec = resolve_codec(self.path, codec)
 
     def append(self, record: EventRecord) -> None:
         payload = record.to_dict()
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload))
-            handle.write("\n")
+        with self.path.open("ab") as handle, _locked(handle):
+            append_payloads(handle, self.codec, [payload])
 
     def read_all(self) -> List[EventRecord]:
+        return list(self.iter())
+
+    def iter(
+        self,
+        *,
+        outcome: Optional[str] = None,
+        failure_class: Optional[str] = None,
+        since: Optional[TimeBound] = None,
+        until: Optional[TimeBound] = None,
+        tags: Optional[Dict[str, Any]] = None,
+        validate: bool = True,
+    ) -> Iterator[EventRecord]:
+        """Stream records in file order.
+
+        Filters are checked against the decoded JSON dict before an EventRecord is
+        built, so rejected lines never pay for contract construction. ``since`` is
+        inclusive and ``until`` exclusive; every ``tags`` key/value must match.
+        Pass ``validate=False`` to skip contract validation for trusted logs.
+        """
         if not self.path.exists():
+            return
+        predicate = _RecordFilter(outcome, failure_class, since, until, tags)
+        with self.path.open("rb") as handle:
+            codec, _ = read_header(handle)
+            for frame in codec.iter_frames(handle):
+                for payload in codec.decode(frame):
+                    if predicate.matches(payload):
+                        yield EventRecord.from_dict(payload, validate=validate)
+
+    def iter_reverse(self, *, block_size: int = REVERSE_BLOCK_SIZE) -> Iterator[EventRecord]:
+        """Yield records newest first, reading the file backwards in blocks."""
+        for payload in iter_payloads_reverse(self.path, block_size):
+            yield EventRecord.from_dict(payload)
+
+    def read_last(self, n: int = 1) -> List[EventRecord]:
+        """Return the last ``n`` records in file order without decoding the rest."""
+        if n <= 0:
             return []
         records: List[EventRecord] = []
-        with self.path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                if line.strip():
-                    records.append(EventRecord.from_dict(json.loads(line)))
+        for record in self.iter_reverse():
+            records.append(record)
+            if len(records) == n:
+                break
+        records.reverse()
         return records
 
 
+def _parse_time(value: TimeBound) -> datetime:
+    if isinstance(value, str):
+        parsed = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    else:
+        parsed = value
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class _RecordFilter:
+    def __init__(
+        self,
+        outcome: Optional[str],
+        failure_class: Optional[str],
+        since: Optional[TimeBound],
+        until: Optional[TimeBound],
+        tags: Optional[Dict[str, Any]],
+    ) -> None:
+        self.outcome = outcome
+        self.failure_class = failure_class
+        self.since = _parse_time(since) if since is not None else None
+        self.until = _parse_time(until) if until is not None else None
+        self.tags = tags or {}
+
+    def matches(self, payload: Dict[str, Any]) -> bool:
+        if self.outcome is not None and payload.get("outcome") != self.outcome:
+            return False
+        if self.failure_class is not None and payload.get("failure_class") != self.failure_class:
+            return False
+        if self.since is not None or self.until is not None:
+            timestamp = payload.get("timestamp")
+            if not isinstance(timestamp, str):
+                return False
+            try:
+                moment = _parse_time(timestamp)
+            except ValueError:  # a corrupt stored timestamp lies in no time range
+                return False
+            if self.since is not None and moment < self.since:
+                return False
+            if self.until is not None and moment >= self.until:
+                return False
+        if self.tags:
+            record_tags = (payload.get("tags") or {}).get("tags") or {}
+            for key, value in self.tags.items():
+                if key not in record_tags or record_tags[key] != value:
+                    return False
+        return True
+
+
+class EventLogWriter:
+    """Long-lived, batching EventLog writer.
+
+    Records are buffered and written with a single locked ``write`` once
+    ``max_batch`` records are pending or the oldest pending record is older than
+    ``flush_interval`` seconds. ``durability`` selects when to ``fsync``: never
+    (``"none"``), after every flushed batch (``"batch"``) or after every record
+    (``"record"``, which also disables batching).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_batch: int = 64,
+        flush_interval: Optional[float] = 1.0,
+        durability: str = "none",
+        codec: Optional[Codec] = None,
+    ) -> None:
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {', '.join(DURABILITY_MODES)}")
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_batch = 1 if durability == "record" else max_batch
+        self.flush_interval = flush_interval
+        self.durability = durability
+        self.codec = resolve_codec(self.path, codec)
+        self._handle: Optional[IO[bytes]] = self.path.open("ab")
+        self._pending: List[Dict[str, Any]] = []
+        self._oldest_pending = 0.0
+        self._cond = threading.Condition()
+        self._flusher: Optional[threading.Thread] = None
+
+    def append(self, record: EventRecord) -> None:
+        payload = record.to_dict()
+        with self._cond:
+            if self._handle is None:
+                raise ValueError("EventLogWriter is closed")
+            if not self._pending:
+                self._oldest_pending = time.monotonic()
+            self._pending.append(payload)
+            if len(self._pending) >= self.max_batch:
+                self._flush_locked()
+            else:
+                self._ensure_flusher()
+                self._cond.notify()
+
+    def extend(self, records: Iterable[EventRecord]) -> None:
+        for record in records:
+            self.append(record)
+
+    def flush(self) -> None:
+        with self._cond:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._cond:
+            if self._handle is None:
+                return
+            self._flush_locked()
+            self._handle.close()
+            self._handle = None
+            self._cond.notify_all()
+        if self._flusher is not None:
+            self._flusher.join()
+
+    @property
+    def closed(self) -> bool:
+        return self._handle is None
+
+    def __enter__(self) -> "EventLogWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _flush_locked(self) -> None:
+        if not self._pending or self._handle is None:
+            return
+        pending = self._pending
+        self._pending = []
+        with _locked(self._handle):
+            append_payloads(self._handle, self.codec, pending)
+            self._handle.flush()
+            if self.durability != "none":
+                os.fsync(self._handle.fileno())
+
+    def _ensure_flusher(self) -> None:
+        if self.flush_interval is None or self._flusher is not None:
+            return
+        self._flusher = threading.Thread(target=self._run_flusher, name="eventlog-flusher", daemon=True)
+        self._flusher.start()
+
+    def _run_flusher(self) -> None:
+        assert self.flush_interval is not None
+        with self._cond:
+            while self._handle is not None:
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                remaining = self._oldest_pending + self.flush_interval - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                self._flush_locked()
+
+
 def write_event_record(path: Path, record: EventRecord) -> None:
     EventLog(path).append(record)
 
 
 def write_event_records(path: Path, records: Iterable[EventRecord]) -> None:
-    log = EventLog(path)
-    for record in records:
-        log.append(record)
+    with EventLogWriter(path, flush_interval=None, max_batch=256) as writer:
+        writer.extend(records)
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import os
-import re
-import shlex
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from .shell_parser import ShellSyntaxError, SimpleCommand, parse
 
 
 READ_ONLY_COMMANDS = {"ls", "dir", "cat", "type"}
@@ -25,98 +28,142 @@ DESTRUCTIVE_COMMANDS = {
 NETWORK_COMMANDS = {"curl", "wget", "invoke-webrequest"}
 
 
+# Redirect operators that truncate or open their target for writing; ``>>`` and
+# ``&>>`` only append. ``>&N`` duplicates a descriptor and names no file.
+_OVERWRITE_OPS = {">", ">|", "&>", ">&", "<>"}
+_NULL_DEVICE = "/dev/null"
+CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class _Rule:
+    classification: str
+    base: str
+    all_of: FrozenSet[str] = frozenset()
+
+
+# Token rules on top of the command sets above. ``_compile_rules`` merges both into
+# ``_TRIE``; for a given base the first branch (by ``_PRIORITY``) whose ``all_of``
+# tokens all occur in the command wins.
+RULES: Tuple[_Rule, ...] = (
+    _Rule("network", "pip", frozenset({"install"})),
+    _Rule("network", "npm", frozenset({"install"})),
+    _Rule("destructive", "git", frozenset({"reset", "--hard"})),
+    _Rule("destructive", "git", frozenset({"clean", "-fdx"})),
+    _Rule("read_only", "git", frozenset({"status"})),
+    _Rule("read_only", "git", frozenset({"diff"})),
+    # ``python -c`` is not listed: inline interpreter code is opaque, so it falls through to destructive.
+    _Rule("read_only", "python", frozenset({"-m", "unittest"})),
+    _Rule("read_only", "python3", frozenset({"-m", "unittest"})),
+)
+
+_PRIORITY = ("network", "destructive", "read_only", "write_non_destructive")
+# These verdicts hold whatever the filesystem looks like; read_only and
+# write_non_destructive only stand if no redirect overwrites an existing file.
+_FINAL = ("network", "destructive")
+
+
+class _Segment(NamedTuple):
+    """Cacheable analysis of one chain segment; ``redirect_targets`` is None without a ``>`` redirect."""
+
+    verdict: Optional[str]
+    redirect_targets: Optional[Tuple[str, ...]]
+
+
+def _compile_rules() -> Dict[str, Tuple[Tuple[FrozenSet[str], str], ...]]:
+    """Token trie: base command -> ordered (required tokens, classification) branches."""
+    trie: Dict[str, List[Tuple[FrozenSet[str], str]]] = {}
+    for classification, bases in (
+        ("network", NETWORK_COMMANDS),
+        ("destructive", DESTRUCTIVE_COMMANDS),
+        ("read_only", READ_ONLY_COMMANDS),
+        ("write_non_destructive", WRITE_NON_DESTRUCTIVE),
+    ):
+        for base in bases:
+            trie.setdefault(base, []).append((frozenset(), classification))
+    for rule in RULES:
+        trie.setdefault(rule.base, []).append((rule.all_of, rule.classification))
+    priority = {name: idx for idx, name in enumerate(_PRIORITY)}
+    return {base: tuple(sorted(branches, key=lambda branch: priority[branch[1]])) for base, branches in trie.items()}
+
+
+_TRIE = _compile_rules()
+
+
 def classify_command(command: str) -> str:
-    cleaned = command.strip()
-    if not cleaned:
-        return "destructive"
-    if _has_command_chain(cleaned):
-        classifications = [classify_command(part) for part in _split_chain(cleaned)]
-        return _combine_classifications(classifications)
+    """Classify ``command``; token analysis is cached, redirect targets are checked on disk every call.
 
-    lower = cleaned.lower()
-    tokens = _tokenize(lower)
-    if not tokens:
+    Only surrounding whitespace is normalized for the cache key: newlines
+    separate commands and spacing inside quotes is part of a word.
+    """
+    segments = _analyze(command.strip())
+    if not segments:
         return "destructive"
-
-    base = tokens[0]
-    if _is_network_command(base, tokens):
-        return "network"
-    if _is_destructive_command(base, tokens, cleaned):
-        return "destructive"
-    if _is_read_only_command(base, tokens):
-        return "read_only"
-    if base in WRITE_NON_DESTRUCTIVE:
-        return "write_non_destructive"
-    if _has_safe_redirect(cleaned):
-        return "write_non_destructive"
-    return "destructive"
+    return _combine_classifications([_resolve(segment) for segment in segments])
 
 
-def _tokenize(command: str) -> list[str]:
-    try:
-        return shlex.split(command)
-    except ValueError:
-        return command.split()
-
-
-def _is_network_command(base: str, tokens: list[str]) -> bool:
-    if base in NETWORK_COMMANDS:
-        return True
-    if base == "pip" and "install" in tokens:
-        return True
-    if base == "npm" and "install" in tokens:
-        return True
-    return False
+def classifier_cache_info() -> Any:
+    return _analyze.cache_info()
 
 
-def _is_destructive_command(base: str, tokens: list[str], command: str) -> bool:
-    if base in DESTRUCTIVE_COMMANDS:
-        return True
-    if base == "git" and ("reset" in tokens and "--hard" in tokens):
-        return True
-    if base == "git" and ("clean" in tokens and "-fdx" in tokens):
-        return True
-    return _has_overwrite_redirect(command)
+def clear_classifier_cache() -> None:
+    _analyze.cache_clear()
 
 
-def _is_read_only_command(base: str, tokens: list[str]) -> bool:
-    if base in READ_ONLY_COMMANDS:
-        return True
-    if base == "git" and ("status" in tokens or "diff" in tokens):
-        return True
-    if base in {"python", "python3"}:
-        if "-m" in tokens and "unittest" in tokens:
-            return True
-        if "-c" in tokens:
-            return True
-    return False
+@lru_cache(maxsize=CACHE_SIZE)
+def _analyze(command: str) -> Tuple[_Segment, ...]:
+    try:
+        commands = parse(command)
+    except ShellSyntaxError:
+        return (_Segment("destructive", None),)
+    return tuple(_analyze_segment(simple) for simple in commands)
+
+
+def _analyze_segment(simple: SimpleCommand) -> _Segment:
+    targets = tuple(
+        redirect.target
+        for redirect in simple.redirects
+        if redirect.op in _OVERWRITE_OPS
+        and redirect.target != _NULL_DEVICE
+        and not (redirect.op == ">&" and (redirect.target.isdigit() or redirect.target == "-"))
+    )
+    redirects = targets or None
+    if simple.opaque:
+        return _Segment("destructive", redirects)
+    tokens = [word.lower() for word in simple.words]
+    if not tokens:
+        return _Segment(None, redirects)
+    token_set = frozenset(tokens)
+    for required, classification in _TRIE.get(tokens[0], ()):
+        if required <= token_set:
+            return _Segment(classification, redirects)
+    return _Segment(None, redirects)
+
+
+def _resolve(segment: _Segment) -> str:
+    if segment.verdict in _FINAL:
+        return segment.verdict  # type: ignore[return-value]
+    targets = segment.redirect_targets
+    if targets is not None and _has_overwrite_redirect(targets):
+        return "destructive"
+    if segment.verdict is not None:
+        return segment.verdict
+    if targets is not None and _has_safe_redirect(targets):
+        return "write_non_destructive"
+    return "destructive"
 
 
-def _has_overwrite_redirect(command: str) -> bool:
-    if ">" not in command:
-        return False
-    if ">>" in command:
-        return False
-    targets = re.findall(r">\s*([^\s]+)", command)
-    if not targets:
-        return True
+def _has_overwrite_redirect(targets: Tuple[str, ...]) -> bool:
     for target in targets:
-        path = Path(target.strip().strip('"').strip("'"))
+        path = Path(target)
         if path.exists() and not _is_temp_path(path):
             return True
     return False
 
 
-def _has_safe_redirect(command: str) -> bool:
-    if ">" not in command:
-        return False
-    if ">>" in command:
-        return False
-    targets = re.findall(r">\s*([^\s]+)", command)
-    if not targets:
-        return False
+def _has_safe_redirect(targets: Tuple[str, ...]) -> bool:
     for target in targets:
-        path = Path(target.strip().strip('"').strip("'"))
+        path = Path(target)
         if _is_temp_path(path) and not path.exists():
             return True
     return False
@@ -137,15 +184,6 @@ def _is_temp_path(path: Path) -> bool:
     return any(str(resolved).startswith(str(root)) for root in tmp_roots)
 
 
-def _has_command_chain(command: str) -> bool:
-    return any(token in command for token in ("&&", ";", "|"))
-
-
-def _split_chain(command: str) -> list[str]:
-    parts = re.split(r"(?:&&|;|\|)", command)
-    return [part.strip() for part in parts if part.strip()]
-
-
 def _combine_classifications(classifications: list[str]) -> str:
     if not classifications:
         return "destructive"
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import subprocess
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
 from .classifier import classify_command
+from .streaming import DEFAULT_MAX_OUTPUT_BYTES, OutputStream, ResourceLimits
 
 
 def execute_command(
@@ -14,36 +15,31 @@ def execute_command(
     *,
     approval_token: Optional[str] = None,
     timeout: float = 10.0,
+    max_output_bytes: Optional[int] = None,
+    limits: Optional[ResourceLimits] = None,
 ) -> Dict[str, Any]:
-    classification = classify_command(command)
-    approved = _is_approved(command, approval_token)
-    allowed = classification in {"read_only", "write_non_destructive"} or approved
+    """Run ``command`` if it passes gating.
 
-    if classification in {"destructive", "network"} and not approved:
-        return {
-            "command": command,
-            "classification": classification,
-            "approved": False,
-            "allowed": False,
-            "status": "blocked",
-            "stdout": "",
-            "stderr": f"Blocked {classification} command without approval token.",
-            "exit_code": None,
-            "duration": 0.0,
-        }
-
-    if not allowed:
-        return {
-            "command": command,
-            "classification": classification,
-            "approved": approved,
-            "allowed": False,
-            "status": "blocked",
-            "stdout": "",
-            "stderr": "Command not allowed without approval token.",
-            "exit_code": None,
-            "duration": 0.0,
-        }
+    With ``max_output_bytes`` or ``limits`` the command runs through
+    ``stream_command``: output is capped (head and tail kept), a timeout gives
+    ``status`` "timeout" instead of raising, and the result gains a
+    ``truncation`` entry.
+    """
+    if max_output_bytes is not None or limits is not None:
+        stream = stream_command(
+            command,
+            approval_token=approval_token,
+            timeout=timeout,
+            max_output_bytes=DEFAULT_MAX_OUTPUT_BYTES if max_output_bytes is None else max_output_bytes,
+            limits=limits,
+        )
+        for _ in stream:
+            pass
+        return stream.result
+
+    result = gate_command(command, approval_token)
+    if not result["allowed"]:
+        return result
 
     start = time.monotonic()
     completed = subprocess.run(
@@ -54,17 +50,117 @@ def execute_command(
         timeout=timeout,
     )
     duration = time.monotonic() - start
-    return {
+    result.update(
+        status="executed",
+        stdout=completed.stdout,
+        stderr=completed.stderr,
+        exit_code=completed.returncode,
+        duration=duration,
+    )
+    return result
+
+
+class CommandStream:
+    """Iterate to receive ``(name, bytes)`` chunks, name being "stdout" or "stderr", as they arrive.
+
+    The command starts when iteration begins and runs once. ``result`` is the
+    ``execute_command`` dict; its output fields, ``exit_code`` and
+    ``truncation`` stats are filled in once iteration finishes or the stream
+    is closed. Use it as a context manager (or call ``close``) to kill a
+    command whose output is not read to the end. Blocked commands yield
+    nothing.
+    """
+
+    def __init__(self, result: Dict[str, Any], start: Optional[Callable[[], OutputStream]]) -> None:
+        self.result = result
+        self._start = start
+        self._stream: Optional[OutputStream] = None
+        self._finished = False
+
+    def __enter__(self) -> "CommandStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Tuple[str, bytes]]:
+        if self._start is None:
+            return
+        start, self._start = self._start, None
+        self._stream = start()
+        try:
+            yield from self._stream
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._start = None
+        stream = self._stream
+        if stream is None or self._finished:
+            return
+        self._finished = True
+        stream.close()
+        self.result.update(
+            status="timeout" if stream.timed_out else "executed",
+            stdout=stream.text("stdout"),
+            stderr=stream.text("stderr"),
+            exit_code=stream.returncode,
+            duration=stream.duration,
+            truncation=stream.truncation(),
+        )
+
+
+def stream_command(
+    command: str,
+    *,
+    approval_token: Optional[str] = None,
+    timeout: float = 10.0,
+    max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+    head_ratio: float = 0.5,
+    limits: Optional[ResourceLimits] = None,
+) -> CommandStream:
+    """Gate ``command`` and, if allowed, return a stream that runs it with capped output.
+
+    At most ``max_output_bytes`` per stream are kept for the result:
+    ``head_ratio`` of them from the start, the rest from the end.
+    """
+    result = gate_command(command, approval_token)
+    if not result["allowed"]:
+        return CommandStream(result, None)
+    return CommandStream(
+        result,
+        lambda: OutputStream(
+            command, timeout=timeout, max_output_bytes=max_output_bytes, head_ratio=head_ratio, limits=limits
+        ),
+    )
+
+
+def gate_command(command: str, approval_token: Optional[str] = None) -> Dict[str, Any]:
+    """Classify and gate ``command``; returns the result skeleton shared by all executors.
+
+    Blocked commands come back complete (``allowed`` false, ``status`` "blocked");
+    for allowed commands the executor fills in ``status``, output, ``exit_code``
+    and ``duration``.
+    """
+    classification = classify_command(command)
+    approved = _is_approved(command, approval_token)
+    allowed = classification in {"read_only", "write_non_destructive"} or approved
+    result: Dict[str, Any] = {
         "command": command,
         "classification": classification,
         "approved": approved,
-        "allowed": True,
-        "status": "executed",
-        "stdout": completed.stdout,
-        "stderr": completed.stderr,
-        "exit_code": completed.returncode,
-        "duration": duration,
+        "allowed": allowed,
+        "status": "blocked",
+        "stdout": "",
+        "stderr": "",
+        "exit_code": None,
+        "duration": 0.0,
     }
+    if classification in {"destructive", "network"} and not approved:
+        result["stderr"] = f"Blocked {classification} command without approval token."
+    elif not allowed:
+        result["stderr"] = "Command not allowed without approval token."
+    return result
 
 
 def _normalize_command(command: str) -> str:
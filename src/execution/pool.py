@@ -0,0 +1,233 @@
+"""Pooled executor backed by long-lived POSIX shell workers."""
+
+from __future__ import annotations
+
+import os
+import queue
+import selectors
+import signal
+import subprocess
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .gateway import gate_command
+
+DEFAULT_SHELL = "/bin/sh"
+_READ_SIZE = 65536
+
+
+def _quote(command: str) -> str:
+    return "'" + command.replace("'", "'\\''") + "'"
+
+
+class _ShellWorker:
+    """One ``/bin/sh`` reading scripts from stdin.
+
+    Each command runs as ``( eval '<command>' ) </dev/null`` so it cannot change
+    the worker's directory or environment, cannot read the worker's script
+    stream, and a syntax error only ends the subshell. A random sentinel line
+    on stdout (carrying ``$?``) and on stderr marks the end of its output.
+    """
+
+    def __init__(self, shell: str, cwd: Optional[str], env: Optional[Dict[str, str]]) -> None:
+        self.process = subprocess.Popen(
+            [shell],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+            start_new_session=True,  # own process group, so a timeout kills the command's children too
+        )
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def run(self, command: str, timeout: float) -> Tuple[str, str, Optional[int], str]:
+        """Returns ``(stdout, stderr, exit_code, status)``; status is "executed", "timeout" or "error"."""
+        assert self.process.stdin and self.process.stdout and self.process.stderr
+        marker = f"__liber8_done_{uuid.uuid4().hex}__"
+        script = (
+            f"( eval {_quote(command)} ) </dev/null\n"
+            f"__liber8_status=$?\n"
+            f"printf '\\n{marker} %d\\n' \"$__liber8_status\"\n"
+            f"printf '\\n{marker}\\n' >&2\n"
+        )
+        try:
+            self.process.stdin.write(script.encode("utf-8"))
+            self.process.stdin.flush()
+        except BrokenPipeError:
+            return "", "", None, "error"
+
+        stdout_marker = f"\n{marker} ".encode("ascii")
+        stderr_marker = f"\n{marker}\n".encode("ascii")
+        buffers = {"stdout": bytearray(), "stderr": bytearray()}
+        done = {"stdout": False, "stderr": False}
+        deadline = time.monotonic() + timeout
+        with selectors.DefaultSelector() as selector:
+            selector.register(self.process.stdout, selectors.EVENT_READ, "stdout")
+            selector.register(self.process.stderr, selectors.EVENT_READ, "stderr")
+            while not (done["stdout"] and done["stderr"]):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return self._decode(buffers, "stdout"), self._decode(buffers, "stderr"), None, "timeout"
+                for key, _ in selector.select(remaining):
+                    name = key.data
+                    chunk = os.read(key.fd, _READ_SIZE)
+                    if not chunk:  # the worker itself died
+                        return self._decode(buffers, "stdout"), self._decode(buffers, "stderr"), None, "error"
+                    buffers[name].extend(chunk)
+                    marker_bytes = stdout_marker if name == "stdout" else stderr_marker
+                    if name == "stdout":
+                        done[name] = buffers[name].find(marker_bytes) != -1 and buffers[name].endswith(b"\n")
+                    else:
+                        done[name] = buffers[name].endswith(marker_bytes)
+                    if done[name]:
+                        selector.unregister(key.fileobj)
+
+        out = bytes(buffers["stdout"])
+        cut = out.rfind(stdout_marker)
+        exit_code = int(out[cut + len(stdout_marker) :].strip())
+        err = bytes(buffers["stderr"])[: -len(stderr_marker)]
+        return out[:cut].decode("utf-8", "replace"), err.decode("utf-8", "replace"), exit_code, "executed"
+
+    @staticmethod
+    def _decode(buffers: Dict[str, bytearray], name: str) -> str:
+        return bytes(buffers[name]).decode("utf-8", "replace")
+
+    def kill(self) -> None:
+        if self.alive:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout, self.process.stderr):
+            if stream is not None:
+                stream.close()
+
+
+class ShellWorkerPool:
+    """Runs gated commands on ``size`` persistent shell workers.
+
+    Commands are gated exactly like ``execute_command`` and return the same
+    result dict. A command that exceeds its timeout gets ``status`` "timeout";
+    its worker (and everything the command started) is killed and replaced.
+    ``execute_many`` runs commands concurrently, one per free worker, so pass
+    only commands that do not depend on each other. POSIX only.
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        *,
+        shell: str = DEFAULT_SHELL,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if os.name != "posix":
+            raise RuntimeError("ShellWorkerPool needs a POSIX shell")
+        self.size = size
+        self.shell = shell
+        self.cwd = cwd
+        self.env = env
+        self._idle: "queue.Queue[_ShellWorker]" = queue.Queue()
+        self._workers: List[_ShellWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+    def execute(
+        self,
+        command: str,
+        *,
+        approval_token: Optional[str] = None,
+        timeout: float = 10.0,
+    ) -> Dict[str, Any]:
+        result = gate_command(command, approval_token)
+        if not result["allowed"]:
+            return result
+        worker = self._acquire()
+        start = time.monotonic()
+        try:
+            stdout, stderr, exit_code, status = worker.run(command, timeout)
+        except BaseException:
+            self._replace(worker)
+            raise
+        result.update(
+            status=status,
+            stdout=stdout,
+            stderr=stderr,
+            exit_code=exit_code,
+            duration=time.monotonic() - start,
+        )
+        if status == "executed":
+            self._idle.put(worker)
+        else:
+            self._replace(worker)
+        return result
+
+    def execute_many(
+        self,
+        commands: Sequence[str],
+        *,
+        approval_tokens: Optional[Sequence[Optional[str]]] = None,
+        timeout: float = 10.0,
+    ) -> List[Dict[str, Any]]:
+        """Results are returned in ``commands`` order."""
+        tokens = list(approval_tokens) if approval_tokens is not None else [None] * len(commands)
+        if len(tokens) != len(commands):
+            raise ValueError("approval_tokens must match commands")
+        with ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="shell-pool") as executor:
+            futures = [
+                executor.submit(self.execute, command, approval_token=token, timeout=timeout)
+                for command, token in zip(commands, tokens)
+            ]
+            return [future.result() for future in futures]
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.kill()
+
+    def __enter__(self) -> "ShellWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _spawn(self) -> _ShellWorker:
+        worker = _ShellWorker(self.shell, self.cwd, self.env)
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _acquire(self) -> _ShellWorker:
+        if self._closed:
+            raise RuntimeError("ShellWorkerPool is closed")
+        worker = self._idle.get()
+        if not worker.alive:
+            self._discard(worker)
+            worker = self._spawn()
+        return worker
+
+    def _replace(self, worker: _ShellWorker) -> None:
+        self._discard(worker)
+        if not self._closed:
+            self._idle.put(self._spawn())
+
+    def _discard(self, worker: _ShellWorker) -> None:
+        worker.kill()
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
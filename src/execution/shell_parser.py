@@ -0,0 +1,313 @@
+"""Single-pass POSIX shell tokenizer that splits a command line into simple commands.
+
+It understands the parts of the grammar that decide where one command ends
+and the next begins: quoting and escapes, the list and pipeline operators
+``&&``, ``||``, ``;``, ``|``, ``|&``, ``&`` and newlines, subshells and brace
+groups, command substitution (``$(...)`` and backticks, recursively, also
+inside double quotes), redirections and here-documents. It does not expand
+anything. Commands inside substitutions are returned alongside the commands
+that contain them, because they run too.
+
+The input is read left to right exactly once, so the cost is linear in its
+length.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+_SUBSTITUTION = "$(...)"
+_RESERVED_PREFIX = {"!", "{", "}", "if", "then", "else", "elif", "fi", "do", "done", "while", "until", "time"}
+_CONTROL_HEADERS = {"for", "case", "select"}
+_REDIRECT_OPS = ("&>>", "&>", "<<<", "<<-", "<<", "<&", "<>", "<", ">>", ">|", ">&", ">")
+_HEREDOC_OPS = {"<<", "<<-"}
+
+
+class ShellSyntaxError(ValueError):
+    """Raised for input the tokenizer cannot delimit (unterminated quotes, unbalanced parentheses)."""
+
+
+@dataclass
+class Redirect:
+    op: str
+    target: str
+    fd: Optional[int] = None
+
+
+@dataclass
+class SimpleCommand:
+    """One command with its words (quotes removed, substitutions shown as ``$(...)``) and redirects.
+
+    ``opaque`` marks a command the tokenizer could not fully see into, such as
+    an unquoted here-document whose body contains command substitutions.
+    """
+
+    words: List[str] = field(default_factory=list)
+    redirects: List[Redirect] = field(default_factory=list)
+    text: str = ""
+    opaque: bool = False
+
+
+def parse(command: str) -> List[SimpleCommand]:
+    try:
+        return _Parser(command).parse_list(None)
+    except RecursionError as exc:
+        raise ShellSyntaxError("command nests too deeply") from exc
+
+
+def split_commands(command: str) -> List[str]:
+    """Source text of every simple command in ``command``."""
+    return [simple.text for simple in parse(command)]
+
+
+@dataclass
+class _Heredoc:
+    delimiter: str
+    quoted: bool
+    strip_tabs: bool
+    owner: SimpleCommand
+
+
+class _Builder:
+    def __init__(self, start: int) -> None:
+        self.start = start
+        self.words: List[str] = []
+        self.redirects: List[Redirect] = []
+        self.word: Optional[List[str]] = None
+        self.word_quoted = False
+        self.pending_op: Optional[Tuple[str, Optional[int]]] = None
+        self.heredocs: List[Tuple[str, bool, bool]] = []
+
+    def add(self, text: str, *, quoted: bool = False) -> None:
+        if self.word is None:
+            self.word = []
+        self.word.append(text)
+        self.word_quoted = self.word_quoted or quoted
+
+    def end_word(self) -> None:
+        if self.word is None:
+            return
+        text = "".join(self.word)
+        quoted = self.word_quoted
+        self.word = None
+        self.word_quoted = False
+        if self.pending_op is None:
+            self.words.append(text)
+            return
+        op, fd = self.pending_op
+        self.pending_op = None
+        self.redirects.append(Redirect(op, text, fd))
+        if op in _HEREDOC_OPS:
+            self.heredocs.append((text, quoted, op == "<<-"))
+
+
+class _Parser:
+    def __init__(self, source: str) -> None:
+        self.src = source
+        self.pos = 0
+        self.pending_heredocs: List[_Heredoc] = []
+
+    def parse_list(self, terminator: Optional[str]) -> List[SimpleCommand]:
+        """Parse until ``terminator`` (")" for subshells and ``$(``) or end of input."""
+        src = self.src
+        commands: List[SimpleCommand] = []
+        builder = _Builder(self.pos)
+        while self.pos < len(src):
+            char = src[self.pos]
+            if char == "\n":
+                self._finish(builder, commands)
+                self.pos += 1
+                self._read_heredoc_bodies()
+                builder = _Builder(self.pos)
+            elif char in " \t":
+                builder.end_word()
+                self.pos += 1
+            elif char == "#" and builder.word is None:
+                newline = src.find("\n", self.pos)
+                self.pos = len(src) if newline == -1 else newline
+            elif char == "\\":
+                if src.startswith("\\\n", self.pos):
+                    self.pos += 2
+                else:
+                    builder.add(src[self.pos + 1 : self.pos + 2], quoted=True)
+                    self.pos += 2
+            elif char == "'":
+                end = src.find("'", self.pos + 1)
+                if end == -1:
+                    raise ShellSyntaxError("unterminated single quote")
+                builder.add(src[self.pos + 1 : end], quoted=True)
+                self.pos = end + 1
+            elif char == '"':
+                builder.add(self._read_double_quoted(commands), quoted=True)
+            elif char == "`":
+                builder.add(self._read_backticks(commands))
+            elif char == "$":
+                builder.add(self._read_dollar(commands))
+            elif char == ")":
+                if terminator != ")":
+                    raise ShellSyntaxError("unbalanced ')'")
+                self._finish(builder, commands)
+                self.pos += 1
+                return commands
+            elif char == "(":
+                self._finish(builder, commands)
+                self.pos += 1
+                commands.extend(self.parse_list(")"))
+                builder = _Builder(self.pos)
+            elif char in "&|;":
+                op = self._read_operator()
+                if op in {"&>", "&>>"}:
+                    self._start_redirect(builder, op)
+                    continue
+                self._finish(builder, commands)
+                builder = _Builder(self.pos)
+            elif char in "<>":
+                self._start_redirect(builder, self._read_operator())
+            else:
+                builder.add(char)
+                self.pos += 1
+        if terminator is not None:
+            raise ShellSyntaxError(f"missing '{terminator}'")
+        self._finish(builder, commands)
+        self._read_heredoc_bodies()
+        return commands
+
+    def _read_operator(self) -> str:
+        src = self.src
+        for op in ("&&", "||", ";;", "|&", *_REDIRECT_OPS, "&", "|", ";"):
+            if src.startswith(op, self.pos):
+                self.pos += len(op)
+                return op
+        raise ShellSyntaxError(f"unexpected {src[self.pos]!r}")  # pragma: no cover - callers check first
+
+    def _start_redirect(self, builder: _Builder, op: str) -> None:
+        fd = None
+        word = builder.word
+        if word is not None and not builder.word_quoted and "".join(word).isdigit():
+            fd = int("".join(word))
+            builder.word = None
+        else:
+            builder.end_word()
+        if builder.pending_op is not None:
+            raise ShellSyntaxError(f"missing redirect target before {op!r}")
+        builder.pending_op = (op, fd)
+
+    def _finish(self, builder: _Builder, commands: List[SimpleCommand]) -> None:
+        builder.end_word()
+        if builder.pending_op is not None:
+            raise ShellSyntaxError(f"missing redirect target after {builder.pending_op[0]!r}")
+        words = builder.words
+        while words and words[0] in _RESERVED_PREFIX:
+            words = words[1:]
+        if words and words[0] in _CONTROL_HEADERS:
+            return
+        if not words and not builder.redirects:
+            return
+        simple = SimpleCommand(words, builder.redirects, self.src[builder.start : self.pos].strip(" \t\n;&|"))
+        commands.append(simple)
+        for delimiter, quoted, strip_tabs in builder.heredocs:
+            self.pending_heredocs.append(_Heredoc(delimiter, quoted, strip_tabs, simple))
+
+    def _read_heredoc_bodies(self) -> None:
+        src = self.src
+        while self.pending_heredocs:
+            heredoc = self.pending_heredocs.pop(0)
+            body_start = self.pos
+            while self.pos < len(src):
+                newline = src.find("\n", self.pos)
+                line_end = len(src) if newline == -1 else newline
+                line = src[self.pos : line_end]
+                self.pos = line_end + 1 if newline != -1 else line_end
+                if (line.lstrip("\t") if heredoc.strip_tabs else line) == heredoc.delimiter:
+                    break
+            body = src[body_start : self.pos]
+            if not heredoc.quoted and ("$(" in body or "`" in body):
+                heredoc.owner.opaque = True
+
+    def _read_double_quoted(self, commands: List[SimpleCommand]) -> str:
+        src = self.src
+        self.pos += 1
+        parts: List[str] = []
+        while self.pos < len(src):
+            char = src[self.pos]
+            if char == '"':
+                self.pos += 1
+                return "".join(parts)
+            if char == "\\" and src[self.pos + 1 : self.pos + 2] in {"$", "`", '"', "\\", "\n"}:
+                if src[self.pos + 1] != "\n":
+                    parts.append(src[self.pos + 1])
+                self.pos += 2
+            elif char == "`":
+                parts.append(self._read_backticks(commands))
+            elif char == "$":
+                parts.append(self._read_dollar(commands))
+            else:
+                parts.append(char)
+                self.pos += 1
+        raise ShellSyntaxError("unterminated double quote")
+
+    def _read_backticks(self, commands: List[SimpleCommand]) -> str:
+        src = self.src
+        self.pos += 1
+        inner: List[str] = []
+        while self.pos < len(src):
+            char = src[self.pos]
+            if char == "`":
+                self.pos += 1
+                commands.extend(parse("".join(inner)))
+                return _SUBSTITUTION
+            if char == "\\" and src[self.pos + 1 : self.pos + 2] in {"$", "`", "\\"}:
+                inner.append(src[self.pos + 1])
+                self.pos += 2
+            else:
+                inner.append(char)
+                self.pos += 1
+        raise ShellSyntaxError("unterminated backtick")
+
+    def _read_dollar(self, commands: List[SimpleCommand]) -> str:
+        src = self.src
+        if src.startswith("$((", self.pos):
+            return self._skip_balanced(commands, self.pos + 3, "(", ")", depth=2)
+        if src.startswith("$(", self.pos):
+            self.pos += 2
+            commands.extend(self.parse_list(")"))
+            return _SUBSTITUTION
+        if src.startswith("${", self.pos):
+            return self._skip_balanced(commands, self.pos + 2, "{", "}", depth=1)
+        self.pos += 1
+        return "$"
+
+    def _skip_balanced(
+        self, commands: List[SimpleCommand], index: int, opener: str, closer: str, *, depth: int
+    ) -> str:
+        """Return the raw text of an arithmetic or parameter expansion, ending after its closer(s).
+
+        Substitutions nested inside it are parsed into ``commands`` like any other.
+        """
+        src = self.src
+        start = self.pos
+        while index < len(src):
+            char = src[index]
+            if char == "\\":
+                index += 2
+                continue
+            if char == "$" and src.startswith(("$(", "${"), index):
+                self.pos = index
+                self._read_dollar(commands)
+                index = self.pos
+                continue
+            if char == "`":
+                self.pos = index
+                self._read_backticks(commands)
+                index = self.pos
+                continue
+            if char == opener:
+                depth += 1
+            elif char == closer:
+                depth -= 1
+                if depth == 0:
+                    self.pos = index + 1
+                    return src[start : self.pos]
+            index += 1
+        raise ShellSyntaxError(f"missing '{closer}'")
@@ -0,0 +1,186 @@
+"""Streaming subprocess output with bounded retention and child resource limits."""
+
+from __future__ import annotations
+
+import os
+import selectors
+import signal
+import subprocess
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+try:  # POSIX
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+DEFAULT_MAX_OUTPUT_BYTES = 1024 * 1024
+_READ_SIZE = 65536
+
+
+@dataclass
+class ResourceLimits:
+    """Per-command rlimits applied in the child before ``exec``.
+
+    ``cpu_seconds`` maps to RLIMIT_CPU, ``memory_bytes`` to RLIMIT_AS (the
+    portable stand-in for RSS, which Linux does not enforce) and ``open_files``
+    to RLIMIT_NOFILE. ``None`` leaves a limit unchanged.
+    """
+
+    cpu_seconds: Optional[int] = None
+    memory_bytes: Optional[int] = None
+    open_files: Optional[int] = None
+
+    def preexec_fn(self) -> Optional[Callable[[], None]]:
+        if resource is None:
+            raise RuntimeError("resource limits need the POSIX resource module")
+        limits = [
+            (resource.RLIMIT_CPU, self.cpu_seconds),
+            (resource.RLIMIT_AS, self.memory_bytes),
+            (resource.RLIMIT_NOFILE, self.open_files),
+        ]
+        limits = [(kind, value) for kind, value in limits if value is not None]
+        if not limits:
+            return None
+
+        def apply() -> None:
+            for kind, value in limits:
+                _, hard = resource.getrlimit(kind)
+                cap = value if hard == resource.RLIM_INFINITY else min(value, hard)
+                resource.setrlimit(kind, (cap, cap))
+
+        return apply
+
+
+class CappedBuffer:
+    """Keeps the first ``head_bytes`` and last ``tail_bytes`` of a byte stream."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_OUTPUT_BYTES, *, head_ratio: float = 0.5) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        if not 0.0 <= head_ratio <= 1.0:
+            raise ValueError("head_ratio must be between 0 and 1")
+        self.head_bytes = int(max_bytes * head_ratio)
+        self.tail_bytes = max_bytes - self.head_bytes
+        self.total_bytes = 0
+        self._head = bytearray()
+        self._tail = bytearray()
+
+    def write(self, chunk: bytes) -> None:
+        self.total_bytes += len(chunk)
+        room = self.head_bytes - len(self._head)
+        if room > 0:
+            self._head.extend(chunk[:room])
+            chunk = chunk[room:]
+        if chunk and self.tail_bytes:
+            self._tail.extend(chunk)
+            if len(self._tail) > self.tail_bytes:
+                del self._tail[: len(self._tail) - self.tail_bytes]
+
+    @property
+    def kept_bytes(self) -> int:
+        return len(self._head) + len(self._tail)
+
+    @property
+    def truncated(self) -> bool:
+        return self.total_bytes > self.kept_bytes
+
+    def text(self) -> str:
+        if not self.truncated:
+            return (bytes(self._head) + bytes(self._tail)).decode("utf-8", "replace")
+        marker = f"\n... [{self.total_bytes - self.kept_bytes} bytes truncated] ...\n"
+        return bytes(self._head).decode("utf-8", "replace") + marker + bytes(self._tail).decode("utf-8", "replace")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "total_bytes": self.total_bytes,
+            "kept_bytes": self.kept_bytes,
+            "dropped_bytes": self.total_bytes - self.kept_bytes,
+            "truncated": self.truncated,
+        }
+
+
+class OutputStream:
+    """Runs a shell command and yields ``(stream_name, chunk)`` as output arrives.
+
+    Everything read is also fed to a ``CappedBuffer`` per stream; once
+    iteration ends ``returncode`` and ``timed_out`` are set. On timeout, or if
+    the consumer stops early and calls ``close``, the command's whole process
+    group is killed.
+    """
+
+    def __init__(
+        self,
+        command: str,
+        *,
+        timeout: float = 10.0,
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+        head_ratio: float = 0.5,
+        limits: Optional[ResourceLimits] = None,
+    ) -> None:
+        self.command = command
+        self.timeout = timeout
+        self.buffers = {
+            "stdout": CappedBuffer(max_output_bytes, head_ratio=head_ratio),
+            "stderr": CappedBuffer(max_output_bytes, head_ratio=head_ratio),
+        }
+        self.returncode: Optional[int] = None
+        self.timed_out = False
+        self.started = time.monotonic()
+        self.duration = 0.0
+        self.process = subprocess.Popen(
+            command,
+            shell=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+            preexec_fn=limits.preexec_fn() if limits is not None else None,
+        )
+
+    def __iter__(self) -> Iterator[Tuple[str, bytes]]:
+        assert self.process.stdout is not None and self.process.stderr is not None
+        deadline = self.started + self.timeout
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(self.process.stdout, selectors.EVENT_READ, "stdout")
+                selector.register(self.process.stderr, selectors.EVENT_READ, "stderr")
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.timed_out = True
+                        break
+                    for key, _ in selector.select(remaining):
+                        chunk = os.read(key.fd, _READ_SIZE)
+                        if not chunk:
+                            selector.unregister(key.fileobj)
+                            continue
+                        self.buffers[key.data].write(chunk)
+                        yield key.data, chunk
+            if not self.timed_out:
+                try:
+                    self.returncode = self.process.wait(max(deadline - time.monotonic(), 0))
+                except subprocess.TimeoutExpired:
+                    self.timed_out = True
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self.process.poll() is None:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            self.process.wait()
+        for stream in (self.process.stdout, self.process.stderr):
+            if stream is not None:
+                stream.close()
+        if not self.duration:
+            self.duration = time.monotonic() - self.started
+
+    def text(self, name: str) -> str:
+        return self.buffers[name].text()
+
+    def truncation(self) -> Dict[str, Dict[str, Any]]:
+        return {name: buffer.stats() for name, buffer in self.buffers.items()}
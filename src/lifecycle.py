@@ -0,0 +1,230 @@
+"""Memory lane lifecycle: expire, merge and promote blocks, then rewrite the store atomically."""
+
+from __future__ import annotations
+
+import json
+import re
+import statistics
+import time
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Optional, Protocol, Tuple
+
+from .contracts import MemoryBlock, TagSet
+from .retrieval import _parse_time, is_expired
+
+LIFECYCLE_SOURCE = "lifecycle"
+READ_SAMPLES = 5
+_DIGITS = re.compile(r"\d+")
+_SPACE = re.compile(r"\s+")
+
+
+class LifecycleStore(Protocol):
+    def read(self, tags: TagSet) -> List[MemoryBlock]: ...
+
+    def scan(self) -> Iterator[MemoryBlock]: ...
+
+    def replace(self, blocks: Iterable[MemoryBlock]) -> int: ...
+
+    def disk_usage(self) -> int: ...
+
+    def exclusive(self) -> ContextManager[None]: ...
+
+
+@dataclass
+class LifecyclePolicy:
+    """What a lifecycle pass keeps, merges and promotes.
+
+    Episodic blocks not updated for ``episodic_ttl_hours`` expire (``None``
+    keeps them); any block past its ``valid_until`` always does. Episodes with
+    the same ``episode_key`` are merged into the newest one. Once a merged
+    episode has occurred ``promote_after`` times with at least
+    ``min_confidence`` it becomes a semantic block, and a procedural one at
+    ``procedural_after`` occurrences; later repeats of a promoted episode are
+    folded into its block straight away.
+    """
+
+    episodic_ttl_hours: Optional[float] = None
+    promote_after: int = 3
+    procedural_after: int = 10
+    min_confidence: float = 0.5
+
+    def __post_init__(self) -> None:
+        if self.episodic_ttl_hours is not None and self.episodic_ttl_hours <= 0:
+            raise ValueError("episodic_ttl_hours must be positive")
+        if self.promote_after < 2:
+            raise ValueError("promote_after must be at least 2")
+        if self.procedural_after < self.promote_after:
+            raise ValueError("procedural_after must not be below promote_after")
+        if not 0.0 <= self.min_confidence <= 1.0:
+            raise ValueError("min_confidence must be between 0 and 1")
+
+
+@dataclass
+class LifecycleReport:
+    blocks_before: int = 0
+    blocks_after: int = 0
+    expired: int = 0
+    merged: int = 0
+    promoted: int = 0
+    bytes_before: int = 0
+    bytes_after: Optional[int] = None
+    bytes_reclaimed: int = 0
+    read_seconds_before: float = 0.0
+    read_seconds_after: Optional[float] = None
+    dry_run: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def episode_key(block: MemoryBlock) -> str:
+    """Blocks with equal keys record the same episode: content up to case, spacing and numbers, plus tags."""
+    content = _SPACE.sub(" ", _DIGITS.sub("#", block.content.lower())).strip()
+    return json.dumps([content, block.tags.tags], sort_keys=True, default=str)
+
+
+def apply_lifecycle(
+    blocks: Iterable[MemoryBlock],
+    policy: LifecyclePolicy,
+    now: datetime,
+    report: Optional[LifecycleReport] = None,
+) -> List[MemoryBlock]:
+    """The store contents after one lifecycle pass over ``blocks`` (given in write order).
+
+    Surviving blocks keep their relative order; a merged or promoted episode
+    takes the position of its newest member.
+    """
+    report = report if report is not None else LifecycleReport()
+    ttl = timedelta(hours=policy.episodic_ttl_hours) if policy.episodic_ttl_hours is not None else None
+    slots: List[Optional[MemoryBlock]] = []
+    episodes: Dict[str, List[Tuple[int, MemoryBlock]]] = {}
+    promoted: Dict[str, int] = {}
+    for block in blocks:
+        if is_expired(block, now) or (ttl is not None and block.lane == "episodic" and _is_stale(block, now, ttl)):
+            report.expired += 1
+            continue
+        if block.lane == "episodic":
+            episodes.setdefault(episode_key(block), []).append((len(slots), block))
+        elif block.provenance.get("source") == LIFECYCLE_SOURCE and "episode_key" in block.provenance:
+            promoted[block.provenance["episode_key"]] = len(slots)
+        slots.append(block)
+
+    for key, members in episodes.items():
+        for member_position, _ in members:
+            slots[member_position] = None
+        position, survivor = _merge(members, report)
+        occurrences = int(survivor.provenance.get("occurrences", 1))
+        below_threshold = occurrences < policy.promote_after and key not in promoted
+        if below_threshold or survivor.confidence < policy.min_confidence:
+            slots[position] = survivor
+            continue
+        report.promoted += 1
+        if key in promoted:
+            slots[promoted[key]] = _promote(slots[promoted[key]], survivor, key, policy, now)
+        else:
+            slots[position] = _promote(None, survivor, key, policy, now)
+    return [block for block in slots if block is not None]
+
+
+def run_lifecycle(
+    adapter: LifecycleStore,
+    policy: Optional[LifecyclePolicy] = None,
+    *,
+    now: Optional[datetime] = None,
+    dry_run: bool = False,
+    read_samples: int = READ_SAMPLES,
+) -> LifecycleReport:
+    """Run one lifecycle pass over ``adapter`` and rewrite it unless ``dry_run``.
+
+    Writers are held off from the scan until the rewrite, so no block written
+    in between is lost. Read latency is the median of ``read_samples``
+    unfiltered reads before and after the rewrite.
+    """
+    policy = policy or LifecyclePolicy()
+    now = now or datetime.now(timezone.utc)
+    report = LifecycleReport(dry_run=dry_run)
+    report.read_seconds_before = _time_reads(adapter, read_samples)
+    with adapter.exclusive():
+        blocks = list(adapter.scan())
+        report.blocks_before = len(blocks)
+        report.bytes_before = adapter.disk_usage()
+        survivors = apply_lifecycle(blocks, policy, now, report)
+        report.blocks_after = len(survivors)
+        if dry_run:
+            return report
+        report.bytes_reclaimed = adapter.replace(survivors)
+        report.bytes_after = adapter.disk_usage()
+    report.read_seconds_after = _time_reads(adapter, read_samples)
+    return report
+
+
+def _is_stale(block: MemoryBlock, now: datetime, ttl: timedelta) -> bool:
+    updated = _parse_time(block.updated_at)
+    return updated is not None and updated + ttl <= now
+
+
+def _merge(members: List[Tuple[int, MemoryBlock]], report: LifecycleReport) -> Tuple[int, MemoryBlock]:
+    position, newest = max(members, key=lambda member: (member[1].updated_at, member[0]))
+    if len(members) == 1:
+        return position, newest
+    report.merged += len(members) - 1
+    merged_ids = list(newest.provenance.get("merged_ids", []))
+    occurrences = 0
+    for _, block in members:
+        occurrences += int(block.provenance.get("occurrences", 1))
+        if block is not newest:
+            merged_ids.append(block.id)
+            merged_ids.extend(block.provenance.get("merged_ids", []))
+    provenance = {**newest.provenance, "occurrences": occurrences, "merged_ids": merged_ids}
+    confidence = max(block.confidence for _, block in members)
+    return position, replace(newest, provenance=provenance, confidence=confidence)
+
+
+def _promote(
+    existing: Optional[MemoryBlock],
+    episode: MemoryBlock,
+    key: str,
+    policy: LifecyclePolicy,
+    now: datetime,
+) -> MemoryBlock:
+    episode_ids = [episode.id, *episode.provenance.get("merged_ids", [])]
+    occurrences = int(episode.provenance.get("occurrences", 1))
+    if existing is not None:
+        occurrences += int(existing.provenance.get("occurrences", 0))
+        episode_ids = [*existing.provenance.get("promoted_from", []), *episode_ids]
+    provenance = {
+        "source": LIFECYCLE_SOURCE,
+        "episode_key": key,
+        "promoted_from": episode_ids,
+        "occurrences": occurrences,
+    }
+    lane = "procedural" if occurrences >= policy.procedural_after else "semantic"
+    stamp = now.isoformat()
+    if existing is None:
+        return MemoryBlock(
+            content=episode.content,
+            tags=episode.tags,
+            provenance=provenance,
+            lane=lane,
+            confidence=episode.confidence,
+            created_at=stamp,
+            updated_at=stamp,
+        )
+    return replace(
+        existing,
+        content=episode.content,
+        provenance={**existing.provenance, **provenance},
+        lane="procedural" if existing.lane == "procedural" else lane,
+        confidence=max(existing.confidence, episode.confidence),
+        updated_at=stamp,
+    )
+
+
+def _time_reads(adapter: LifecycleStore, samples: int) -> float:
+    timings = []
+    for _ in range(max(samples, 1)):
+        start = time.perf_counter()
+        adapter.read(TagSet(schema_version="v0", tags={}))
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
@@ -2,39 +2,144 @@
 
 from __future__ import annotations
 
-import json
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Protocol, Tuple
 
 from .contracts import MemoryBlock, QueryPlan, TagSet
+from .eventlog import _locked
+from .retrieval import rank_blocks
+from .serialization import Codec, append_payloads, iter_payloads, read_header, resolve_codec, write_store
+from .text_index import HybridIndex
+
+
+class MemoryStore(Protocol):
+    """What the router and agents need from a memory store."""
+
+    def read(self, tags: TagSet, query_plan: Optional[QueryPlan] = None) -> List[MemoryBlock]: ...
+
+    def write(self, block: MemoryBlock) -> None: ...
+
+    def io_counters(self) -> Tuple[int, int]: ...
 
 
 class FileSystemMemoryAdapter:
-    def __init__(self, path: Path) -> None:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        validate_reads: bool = True,
+        codec: Optional[Codec] = None,
+        text_index: Optional[HybridIndex] = None,
+    ) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.validate_reads = validate_reads
+        self.codec = resolve_codec(self.path, codec)
+        self.text_index = text_index
+        self._text_index_loaded = False
+        self._lock = threading.RLock()  # guards appends and the text index across threads
+        # Writers in every process lock this sidecar file; ``replace`` swaps the store's inode.
+        self._lock_path = self.path.with_name(self.path.name + ".lock")
+        self._file_locked = False
+        self._io = threading.local()
         self.last_query_plan: Optional[QueryPlan] = None
 
+    def io_counters(self) -> Tuple[int, int]:
+        """Bytes (read, written) by the calling thread; threads sharing the adapter count separately."""
+        return getattr(self._io, "read", 0), getattr(self._io, "written", 0)
+
+    def _count(self, read: int = 0, written: int = 0) -> None:
+        self._io.read = getattr(self._io, "read", 0) + read
+        self._io.written = getattr(self._io, "written", 0) + written
+
     def read(self, tags: TagSet, query_plan: Optional[QueryPlan] = None) -> List[MemoryBlock]:
         self.last_query_plan = query_plan
         if not self.path.exists():
             return []
 
-        blocks: List[MemoryBlock] = []
-        with self.path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                if line.strip():
-                    blocks.append(MemoryBlock.from_dict(json.loads(line)))
+        with self.path.open("rb") as handle:
+            codec, _ = read_header(handle)
+            blocks = [
+                MemoryBlock.from_dict(payload, validate=self.validate_reads)
+                for frame in codec.iter_frames(handle)
+                for payload in codec.decode(frame)
+            ]
+            self._count(read=handle.tell())
 
-        filtered = blocks if not tags.tags else [block for block in blocks if _tags_overlap(block.tags, tags)]
+        text_scores = self._search_text(query_plan)
+        if not tags.tags:
+            filtered = blocks
+        else:
+            matched = text_scores or {}
+            filtered = [block for block in blocks if _tags_overlap(block.tags, tags) or block.id in matched]
         if query_plan is None:
             return filtered
-        return filtered[: query_plan.limits]
+        return rank_blocks(filtered, tags, query_plan, text_scores=text_scores)
 
     def write(self, block: MemoryBlock) -> None:
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(block.to_dict()))
-            handle.write("\n")
+        with self._lock, self._file_lock():
+            self._load_text_index()
+            with self.path.open("ab") as handle:
+                start = handle.tell()
+                append_payloads(handle, self.codec, [block.to_dict()])
+                self._count(written=handle.tell() - start)
+            if self.text_index is not None:
+                self.text_index.add(block.id, block.content)
+
+    def scan(self) -> Iterator[MemoryBlock]:
+        """Every stored block in write order, without tag filtering or ranking."""
+        for payload in iter_payloads(self.path):
+            yield MemoryBlock.from_dict(payload, validate=self.validate_reads)
+
+    def replace(self, blocks: Iterable[MemoryBlock]) -> int:
+        """Atomically swap the store's contents for ``blocks``; returns bytes reclaimed."""
+        payloads = [block.to_dict() for block in blocks]
+        with self._lock, self._file_lock():
+            before = self.disk_usage()
+            write_store(self.path, self.codec, payloads)
+            if self.text_index is not None:
+                self.text_index.clear()
+                self._text_index_loaded = False
+            return before - self.disk_usage()
+
+    def disk_usage(self) -> int:
+        return self.path.stat().st_size if self.path.exists() else 0
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """Hold off writers in this and other processes, e.g. between ``scan`` and ``replace``."""
+        with self._lock, self._file_lock():
+            yield
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        if self._file_locked:  # already held by this thread through ``exclusive``
+            yield
+            return
+        with self._lock_path.open("ab") as handle, _locked(handle):
+            self._file_locked = True
+            try:
+                yield
+            finally:
+                self._file_locked = False
+
+    def _search_text(self, query_plan: Optional[QueryPlan]) -> Optional[Dict[str, float]]:
+        if self.text_index is None or query_plan is None:
+            return None
+        query = query_plan.filters.get("query")
+        if not isinstance(query, str) or not query.strip():
+            return None
+        with self._lock:
+            self._load_text_index()
+            return self.text_index.search(query, expand="synonyms" in query_plan.expansion_rules)
+
+    def _load_text_index(self) -> None:
+        if self.text_index is None or self._text_index_loaded:
+            return
+        self._text_index_loaded = True
+        self.text_index.add_many([(payload["id"], payload["content"]) for payload in iter_payloads(self.path)])
 
 
 def _tags_overlap(left: TagSet, right: TagSet) -> bool:
@@ -0,0 +1,95 @@
+"""Per-stage timing for router runs and percentile summaries over event logs."""
+
+from __future__ import annotations
+
+import math
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Protocol, Sequence, Tuple
+
+from .contracts import EventRecord
+
+PERCENTILES = (50, 95, 99)
+
+
+class IOCounting(Protocol):
+    def io_counters(self) -> Tuple[int, int]:
+        """Bytes (read, written) by the calling thread so far."""
+
+
+class StageTimer:
+    """Records monotonic wall time, and optionally adapter I/O, per named stage.
+
+    ``to_dict`` is stored as ``provenance["stages"]``::
+
+        {"tag_extraction": {"seconds": 0.002, "bytes_read": 0, "bytes_written": 0}, ...}
+    """
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, Dict[str, float]] = {}
+
+    @contextmanager
+    def stage(self, name: str, io: Optional[IOCounting] = None) -> Iterator[None]:
+        read_before, written_before = io.io_counters() if io is not None else (0, 0)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            read_after, written_after = io.io_counters() if io is not None else (0, 0)
+            entry = self.stages.setdefault(name, {"seconds": 0.0, "bytes_read": 0, "bytes_written": 0})
+            entry["seconds"] += elapsed
+            entry["bytes_read"] += read_after - read_before
+            entry["bytes_written"] += written_after - written_before
+
+    @property
+    def total(self) -> float:
+        return sum(entry["seconds"] for entry in self.stages.values())
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        return {name: dict(entry) for name, entry in self.stages.items()}
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Linearly interpolated ``q``-th percentile (0-100) of ``values``."""
+    if not values:
+        raise ValueError("percentile of an empty sequence")
+    if not 0 <= q <= 100:
+        raise ValueError("q must be between 0 and 100")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize_stages(
+    events: Iterable[EventRecord], percentiles: Sequence[float] = PERCENTILES
+) -> Dict[str, Dict[str, Any]]:
+    """Aggregate ``provenance["stages"]`` across events.
+
+    Returns ``{stage: {"count", "p50", "p95", "p99", "bytes_read", "bytes_written"}}``
+    with seconds for the percentiles and byte totals. Event ``latency`` is
+    reported under the ``"total"`` stage.
+    """
+    seconds: Dict[str, List[float]] = {}
+    io: Dict[str, List[int]] = {}
+    for event in events:
+        stages = event.provenance.get("stages")
+        if not isinstance(stages, dict):
+            continue
+        for name, entry in stages.items():
+            seconds.setdefault(name, []).append(float(entry.get("seconds", 0.0)))
+            totals = io.setdefault(name, [0, 0])
+            totals[0] += int(entry.get("bytes_read", 0))
+            totals[1] += int(entry.get("bytes_written", 0))
+        seconds.setdefault("total", []).append(event.latency)
+        io.setdefault("total", [0, 0])
+    summary: Dict[str, Dict[str, Any]] = {}
+    for name, values in seconds.items():
+        row: Dict[str, Any] = {"count": len(values)}
+        for q in percentiles:
+            row[f"p{q:g}"] = percentile(values, q)
+        row["bytes_read"], row["bytes_written"] = io[name]
+        summary[name] = row
+    return summary
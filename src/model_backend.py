@@ -0,0 +1,238 @@
+"""HTTP client for the tag-extraction model endpoint.
+
+Request body (JSON POST to the endpoint URL)::
+
+    {"schema_version": "v0", "tasks": ["task text", ...]}
+
+Response body::
+
+    {"results": [{"tags": {...}, "uncertainty": {...}, "cost": 0.001}, ...], "cost": 0.002}
+
+``results`` must have one entry per task, in order. A per-result ``cost`` wins
+over an even split of the top-level ``cost``.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class BackendError(RuntimeError):
+    """Raised when the model backend fails; ``failure_class`` follows failure_classes_v0."""
+
+    failure_class = "unknown"
+
+
+class BackendUnavailable(BackendError):
+    failure_class = "backend_unavailable"
+
+
+class BackendTimeout(BackendError):
+    failure_class = "timeout"
+
+
+@dataclass
+class BackendResult:
+    payload: Dict[str, Any]
+    latency: float
+    cost: float
+    batch_size: int
+
+
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+_STOP = object()  # queued by ``close`` to wake the batcher
+
+
+class HttpModelBackend:
+    """Keep-alive HTTP client with a connection pool and request micro-batching.
+
+    ``extract_many`` sends the given tasks in chunks of ``max_batch``. ``submit``
+    is for concurrent single-task callers: requests arriving within
+    ``batch_window`` seconds of each other share one HTTP call. ``timeout`` bounds
+    every call, including connection set-up.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        timeout: float = 10.0,
+        pool_size: int = 4,
+        max_batch: int = 16,
+        batch_window: float = 0.005,
+        schema_version: str = "v0",
+    ) -> None:
+        parts = urlsplit(endpoint)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise ValueError(f"unsupported model endpoint: {endpoint}")
+        if pool_size < 1 or max_batch < 1:
+            raise ValueError("pool_size and max_batch must be at least 1")
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.schema_version = schema_version
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._pending: "queue.Queue[Any]" = queue.Queue()
+        self._batcher: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def extract_many(self, tasks: List[str]) -> List[BackendResult]:
+        results: List[BackendResult] = []
+        for start in range(0, len(tasks), self.max_batch):
+            results.extend(self._call(tasks[start : start + self.max_batch]))
+        return results
+
+    def submit(self, task: str) -> BackendResult:
+        future: Future = Future()
+        self._enqueue(task, future)
+        return future.result()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            executor = self._executor
+        if self._batcher is not None:
+            self._pending.put(_STOP)
+            self._batcher.join()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        # Requests queued after the batcher stopped would otherwise wait forever.
+        while True:
+            try:
+                item = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                item[1].set_exception(BackendUnavailable("backend closed"))
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _call(self, tasks: List[str]) -> List[BackendResult]:
+        body = json.dumps({"schema_version": self.schema_version, "tasks": tasks}).encode("utf-8")
+        start = time.monotonic()
+        with self._slots:
+            status, raw = self._post(body)
+        latency = time.monotonic() - start
+        if status >= 500:
+            raise BackendUnavailable(f"model endpoint returned HTTP {status}")
+        if status >= 400:
+            raise BackendError(f"model endpoint returned HTTP {status}")
+        try:
+            response = json.loads(raw)
+            results = response["results"]
+        except (ValueError, KeyError, TypeError) as exc:
+            raise BackendError("model endpoint returned a malformed response") from exc
+        if not isinstance(results, list) or len(results) != len(tasks):
+            raise BackendError("model endpoint returned the wrong number of results")
+        shared_cost = float(response.get("cost", 0.0)) / len(tasks)
+        return [
+            BackendResult(
+                payload=result,
+                latency=latency,
+                cost=float(result.get("cost", shared_cost)) if isinstance(result, dict) else shared_cost,
+                batch_size=len(tasks),
+            )
+            for result in results
+        ]
+
+    def _post(self, body: bytes) -> Tuple[int, bytes]:
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        for attempt in range(2):
+            connection, reused = self._acquire()
+            try:
+                connection.request("POST", self._path, body=body, headers=headers)
+                response = connection.getresponse()
+                raw = response.read()
+            except (socket.timeout, TimeoutError) as exc:
+                connection.close()
+                raise BackendTimeout(f"model endpoint timed out after {self.timeout}s") from exc
+            except _STALE_CONNECTION_ERRORS as exc:
+                connection.close()
+                if reused and attempt == 0:
+                    continue  # the server closed an idle keep-alive connection
+                raise BackendUnavailable(f"model endpoint unavailable: {exc}") from exc
+            except (OSError, http.client.HTTPException) as exc:
+                connection.close()
+                raise BackendUnavailable(f"model endpoint unavailable: {exc}") from exc
+            if response.will_close:
+                connection.close()
+            else:
+                self._idle.put(connection)
+            return response.status, raw
+        raise BackendUnavailable("model endpoint unavailable")  # pragma: no cover
+
+    def _acquire(self) -> Tuple[http.client.HTTPConnection, bool]:
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            pass
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(self._host, self._port, timeout=self.timeout), False
+        return http.client.HTTPConnection(self._host, self._port, timeout=self.timeout), False
+
+    def _enqueue(self, task: str, future: Future) -> None:
+        # Under the lock so nothing is queued after ``close`` has drained the queue.
+        with self._lock:
+            if self._closed:
+                raise BackendError("model backend is closed")
+            if self._batcher is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="model-backend")
+                self._batcher = threading.Thread(target=self._run_batcher, name="model-batcher", daemon=True)
+                self._batcher.start()
+            self._pending.put((task, future))
+
+    def _run_batcher(self) -> None:
+        assert self._executor is not None
+        while True:
+            first = self._pending.get()
+            if first is _STOP:
+                return
+            batch = [first]
+            stopping = False
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._pending.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._executor.submit(self._dispatch, batch)
+            if stopping:
+                return
+
+    def _dispatch(self, batch: List[Tuple[str, Future]]) -> None:
+        try:
+            results = self._call([task for task, _ in batch])
+        except BaseException as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
@@ -0,0 +1,84 @@
+"""Asyncio router for running many tasks against one storage directory."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from ..contracts import EventRecord
+from ..eventlog import EventLogWriter
+from ..memory_adapter import MemoryStore
+from .router import RouterState, build_event, open_memory, synthesize_and_write, tag_and_retrieve
+
+DEFAULT_CONCURRENCY = 8
+
+
+async def run_router_async(
+    task: str,
+    storage_dir: Path,
+    *,
+    fake_backend: bool = False,
+    model_endpoint: Optional[str] = None,
+    text_index: bool = False,
+) -> EventRecord:
+    events = await run_many(
+        [task], storage_dir, fake_backend=fake_backend, model_endpoint=model_endpoint, text_index=text_index
+    )
+    return events[0]
+
+
+async def run_many(
+    tasks: Sequence[str],
+    storage_dir: Path,
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    fake_backend: bool = False,
+    model_endpoint: Optional[str] = None,
+    memory_adapter: Optional[MemoryStore] = None,
+    event_writer: Optional[EventLogWriter] = None,
+    text_index: bool = False,
+) -> List[EventRecord]:
+    """Route ``tasks`` with at most ``concurrency`` tag/retrieve stages in flight.
+
+    Tag extraction and memory reads overlap across tasks, so a task only sees
+    memory written before its own read stage ran. Synthesis, writeback and the
+    event log run in task order: task ``i`` is written strictly after task
+    ``i - 1``. One adapter and one log writer are shared by the batch; pass
+    ``memory_adapter``/``event_writer`` to reuse long-lived instances (the caller
+    then owns closing the writer). ``text_index`` enables text matching of the
+    task text (see ``build_text_index``) when the adapter is created here.
+    Events are returned in task order.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    storage_dir = Path(storage_dir)
+    storage_dir.mkdir(parents=True, exist_ok=True)
+    adapter = memory_adapter or open_memory(storage_dir, text_index=text_index)
+    writer = event_writer or EventLogWriter(storage_dir / "eventlog.jsonl")
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+    turns = [loop.create_future() for _ in tasks]
+
+    async def route(index: int, task: str) -> EventRecord:
+        try:
+            state = RouterState(task, fake_backend=fake_backend, model_endpoint=model_endpoint)
+            async with semaphore:
+                await asyncio.to_thread(tag_and_retrieve, state, adapter)
+            if index:
+                await turns[index - 1]
+            await asyncio.to_thread(synthesize_and_write, state, adapter)
+            event = build_event(state)
+            writer.append(event)
+            return event
+        finally:
+            if not turns[index].done():
+                turns[index].set_result(None)
+
+    try:
+        return list(await asyncio.gather(*(route(index, task) for index, task in enumerate(tasks))))
+    finally:
+        if event_writer is None:
+            writer.close()
+        else:
+            writer.flush()
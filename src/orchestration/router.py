@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from ..agents import retrieval_agent, synthesis_agent, tagger_agent, writeback_agent
-from ..contracts import EventRecord, QueryPlan, TagSet, ValidationError
+from ..contracts import EventRecord, MemoryBlock, QueryPlan, TagSet, ValidationError
 from ..eventlog import EventLog
-from ..memory_adapter import FileSystemMemoryAdapter
+from ..memory_adapter import FileSystemMemoryAdapter, MemoryStore
+from ..metrics import StageTimer
+from ..model_backend import BackendError
+from ..segment_store import CURRENT_FILE, RUN_STORE_DIR, SegmentMemoryAdapter
+from ..text_index import HashingEmbedder, HybridIndex
+
+
+SYNONYMS_FILE = "synonyms.json"
 
 
 def _fallback_tags() -> TagSet:
@@ -19,69 +28,152 @@ def _fallback_query_plan() -> QueryPlan:
     return QueryPlan(filters={}, limits=0, recency_bias=0.0)
 
 
-def run_router(
-    task: str,
-    storage_dir: Path,
-    *,
-    fake_backend: bool = False,
-    model_endpoint: Optional[str] = None,
-) -> EventRecord:
-    storage_dir = Path(storage_dir)
-    storage_dir.mkdir(parents=True, exist_ok=True)
-    memory_adapter = FileSystemMemoryAdapter(storage_dir / "memory.jsonl")
-    actions: List[str] = []
-    tool_calls: List[dict] = []
-    retrieved_ids: List[str] = []
-    tags: TagSet = _fallback_tags()
-    query_plan: QueryPlan = _fallback_query_plan()
+@dataclass
+class RouterState:
+    """Per-task state threaded through the router stages."""
+
+    task: str
+    fake_backend: bool = False
+    model_endpoint: Optional[str] = None
+    actions: List[str] = field(default_factory=list)
+    tool_calls: List[dict] = field(default_factory=list)
+    retrieved: List[MemoryBlock] = field(default_factory=list)
+    tags: TagSet = field(default_factory=_fallback_tags)
+    query_plan: QueryPlan = field(default_factory=_fallback_query_plan)
+    outcome: str = "success"
     failure_class: Optional[str] = None
-    outcome = "success"
-    provenance = {}
+    provenance: Dict[str, Any] = field(default_factory=dict)
+    cost: float = 0.0
+    timer: StageTimer = field(default_factory=StageTimer)
+
+    @property
+    def failed(self) -> bool:
+        return self.outcome != "success"
+
+    def fail(self, exc: Exception) -> None:
+        if isinstance(exc, ValidationError):
+            self.failure_class = "validation_error"
+        elif isinstance(exc, BackendError):
+            self.failure_class = exc.failure_class
+        else:
+            self.failure_class = "unknown"
+        self.outcome = "failure"
+        self.provenance = {"error": str(exc)}
+
 
+def tag_and_retrieve(state: RouterState, memory_adapter: MemoryStore) -> RouterState:
+    """Tag extraction and memory read; safe to run concurrently for different tasks."""
+    if state.failed:
+        return state
     try:
-        tags = tagger_agent.extract_tags(task, fake_backend=fake_backend, model_endpoint=model_endpoint)
-        actions.append("tag_extraction")
-        tool_calls.append({"name": "tagger", "fake": fake_backend})
+        with state.timer.stage("tag_extraction"):
+            tag_result = tagger_agent.extract(
+                state.task, fake_backend=state.fake_backend, model_endpoint=state.model_endpoint
+            )
+        state.tags = tag_result.tags
+        state.actions.append("tag_extraction")
+        state.tool_calls.append(tag_result.to_tool_call(fake=state.fake_backend))
+        state.cost += tag_result.cost
 
-        retrieved, query_plan = retrieval_agent.retrieve(tags, memory_adapter)
-        actions.append("memory_read")
-        retrieved_ids = [block.id for block in retrieved]
+        with state.timer.stage("memory_read", memory_adapter):
+            state.retrieved, state.query_plan = retrieval_agent.retrieve(
+                state.tags, memory_adapter, query=state.task
+            )
+        state.actions.append("memory_read")
+    except Exception as exc:  # noqa: BLE001 - classified by RouterState.fail
+        state.fail(exc)
+    return state
 
-        synthesis, writeback = synthesis_agent.synthesize(task, tags, retrieved)
-        actions.append("synthesis")
 
-        writeback_id = writeback_agent.write_memory(synthesis, tags, memory_adapter)
-        actions.append("memory_write")
+def synthesize_and_write(state: RouterState, memory_adapter: MemoryStore) -> RouterState:
+    """Synthesis and memory writeback; callers run this in task order."""
+    if state.failed:
+        return state
+    try:
+        with state.timer.stage("synthesis"):
+            synthesis, writeback = synthesis_agent.synthesize(state.task, state.tags, state.retrieved)
+        state.actions.append("synthesis")
+
+        with state.timer.stage("memory_write", memory_adapter):
+            writeback_id = writeback_agent.write_memory(synthesis, state.tags, memory_adapter)
+        state.actions.append("memory_write")
 
-        provenance = {
+        state.provenance = {
             "writeback": writeback.to_dict(),
             "writeback_id": writeback_id,
-            "query_plan": query_plan.to_dict(),
+            "query_plan": state.query_plan.to_dict(),
         }
-    except ValidationError as exc:
-        outcome = "failure"
-        failure_class = "validation_error"
-        provenance = {"error": str(exc)}
-    except Exception as exc:  # pragma: no cover - defensive guard
-        outcome = "failure"
-        failure_class = "unknown"
-        provenance = {"error": str(exc)}
-
-    actions.append("event_log")
-    event = EventRecord(
-        task=task,
-        tags=tags,
-        query_plan=query_plan,
-        retrieved_ids=retrieved_ids,
-        actions=actions,
-        tool_calls=tool_calls,
+    except Exception as exc:  # noqa: BLE001 - classified by RouterState.fail
+        state.fail(exc)
+    return state
+
+
+def build_event(state: RouterState) -> EventRecord:
+    """``latency`` is the summed stage time; the event log append itself is not timed."""
+    state.actions.append("event_log")
+    state.provenance["stages"] = state.timer.to_dict()
+    return EventRecord(
+        task=state.task,
+        tags=state.tags,
+        query_plan=state.query_plan,
+        retrieved_ids=[block.id for block in state.retrieved],
+        actions=state.actions,
+        tool_calls=state.tool_calls,
         validations=["contracts_v0"],
-        outcome=outcome,
-        failure_class=failure_class,
+        outcome=state.outcome,
+        failure_class=state.failure_class,
         retries=0,
-        cost=0.0,
-        latency=0.0,
-        provenance=provenance,
+        cost=state.cost,
+        latency=state.timer.total,
+        provenance=state.provenance,
     )
+
+
+def open_memory(storage_dir: Path, *, text_index: bool = False) -> MemoryStore:
+    """The run directory's memory store, optionally with a hybrid text index (see ``build_text_index``).
+
+    Once ``migrate-memory`` has written a segment store to ``memory/`` it is used
+    instead of ``memory.jsonl``, so tag-filtered reads decode only matching blocks.
+    """
+    storage_dir = Path(storage_dir)
+    index = build_text_index(storage_dir) if text_index else None
+    segments = storage_dir / RUN_STORE_DIR
+    if (segments / CURRENT_FILE).exists():
+        return SegmentMemoryAdapter(segments, validate_reads=False, text_index=index)
+    return FileSystemMemoryAdapter(storage_dir / "memory.jsonl", validate_reads=False, text_index=index)
+
+
+def build_text_index(storage_dir: Path) -> HybridIndex:
+    """BM25 fused with ``HashingEmbedder`` similarity, expanded through the run's ``synonyms.json``.
+
+    ``synonyms.json`` maps a term to a list of alternatives; it feeds the
+    "synonyms" expansion rule of router query plans.
+    """
+    path = Path(storage_dir) / SYNONYMS_FILE
+    synonyms = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    if not isinstance(synonyms, dict) or not all(
+        isinstance(alternatives, list) and all(isinstance(word, str) for word in alternatives)
+        for alternatives in synonyms.values()
+    ):
+        raise ValueError(f"{path} must map terms to lists of alternatives")
+    return HybridIndex(embedder=HashingEmbedder(), synonyms=synonyms)
+
+
+def run_router(
+    task: str,
+    storage_dir: Path,
+    *,
+    fake_backend: bool = False,
+    model_endpoint: Optional[str] = None,
+    text_index: bool = False,
+) -> EventRecord:
+    """Route one task; with ``text_index`` memory is also matched against the task text."""
+    storage_dir = Path(storage_dir)
+    storage_dir.mkdir(parents=True, exist_ok=True)
+    memory_adapter = open_memory(storage_dir, text_index=text_index)
+    state = RouterState(task, fake_backend=fake_backend, model_endpoint=model_endpoint)
+    tag_and_retrieve(state, memory_adapter)
+    synthesize_and_write(state, memory_adapter)
+    event = build_event(state)
     EventLog(storage_dir / "eventlog.jsonl").append(event)
     return event
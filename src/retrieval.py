@@ -0,0 +1,164 @@
+"""Scoring and top-k selection of memory blocks for a QueryPlan."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .contracts import MemoryBlock, QueryPlan, TagSet
+
+
+DEFAULT_HALF_LIFE_HOURS = 24.0
+DEFAULT_DIVERSITY_PENALTY = 0.5
+DEFAULT_TEXT_WEIGHT = 0.5
+DEFAULT_LANE_WEIGHTS = {"procedural": 1.0, "semantic": 0.95, "episodic": 0.85}
+
+
+@dataclass
+class ScoringWeights:
+    """Weights derived from a QueryPlan.
+
+    ``relevance`` and ``freshness`` come from ``scoring_knobs`` when present and
+    otherwise split according to ``recency_bias``. Freshness decays by half every
+    ``half_life_hours``. ``diversity_penalty``, in (0, 1], multiplies a block's score
+    once per already selected block that shares its provenance source. When content search
+    scores are available, ``text`` is their share of the relevance term.
+    """
+
+    relevance: float = 1.0
+    freshness: float = 0.0
+    half_life_hours: float = DEFAULT_HALF_LIFE_HOURS
+    diversity_penalty: float = DEFAULT_DIVERSITY_PENALTY
+    text: float = DEFAULT_TEXT_WEIGHT
+    lane_weights: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_LANE_WEIGHTS))
+
+    def __post_init__(self) -> None:
+        # Selection relies on penalties never raising a score or zeroing it out.
+        if not 0.0 < self.diversity_penalty <= 1.0:
+            raise ValueError("diversity_penalty must be greater than 0 and at most 1")
+
+    @classmethod
+    def from_plan(cls, plan: QueryPlan) -> "ScoringWeights":
+        knobs = plan.scoring_knobs
+        bias = float(plan.recency_bias)
+        lane_weights = dict(DEFAULT_LANE_WEIGHTS)
+        lane_weights.update(knobs.get("lane_weights", {}))
+        return cls(
+            relevance=float(knobs.get("relevance", 1.0 - bias)),
+            freshness=float(knobs.get("freshness", bias)),
+            half_life_hours=float(knobs.get("half_life_hours", DEFAULT_HALF_LIFE_HOURS)),
+            diversity_penalty=float(knobs.get("diversity_penalty", DEFAULT_DIVERSITY_PENALTY)),
+            text=float(knobs.get("text", DEFAULT_TEXT_WEIGHT)),
+            lane_weights=lane_weights,
+        )
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def is_expired(block: MemoryBlock, now: datetime) -> bool:
+    valid_until = _parse_time(block.valid_until)
+    return valid_until is not None and valid_until <= now
+
+
+def tag_relevance(block_tags: TagSet, query: TagSet) -> float:
+    """Fraction of query tag key/values that the block carries (1.0 for an empty query)."""
+    if not query.tags:
+        return 1.0
+    tags = block_tags.tags
+    hits = sum(1 for key, value in query.tags.items() if key in tags and tags[key] == value)
+    return hits / len(query.tags)
+
+
+def freshness(block: MemoryBlock, now: datetime, half_life_hours: float) -> float:
+    created = _parse_time(block.created_at)
+    if created is None or half_life_hours <= 0:
+        return 0.0
+    age_hours = max((now - created).total_seconds() / 3600.0, 0.0)
+    return math.pow(0.5, age_hours / half_life_hours)
+
+
+def score_block(
+    block: MemoryBlock,
+    query: TagSet,
+    weights: ScoringWeights,
+    now: datetime,
+    text_score: Optional[float] = None,
+) -> float:
+    relevance = tag_relevance(block.tags, query)
+    if text_score is not None:
+        relevance = (1.0 - weights.text) * relevance + weights.text * text_score
+    base = weights.relevance * relevance
+    if weights.freshness:
+        base += weights.freshness * freshness(block, now, weights.half_life_hours)
+    lane_weight = weights.lane_weights.get(block.lane, 1.0)
+    return base * lane_weight * (0.5 + 0.5 * float(block.confidence))
+
+
+def _source_key(block: MemoryBlock) -> str:
+    source = block.provenance.get("source")
+    return source if isinstance(source, str) else repr(source)
+
+
+def rank_blocks(
+    blocks: Iterable[MemoryBlock],
+    query: TagSet,
+    plan: QueryPlan,
+    *,
+    now: Optional[datetime] = None,
+    text_scores: Optional[Dict[str, float]] = None,
+) -> List[MemoryBlock]:
+    """Return the top ``plan.limits`` unexpired blocks by score, best first.
+
+    Candidates are heapified once and selected lazily: with ``unique_sources``
+    a popped block whose source was picked since it was scored is re-scored and
+    pushed back, so only about ``limits`` pops are needed instead of a full sort.
+    ``unique_content`` drops blocks whose content was already selected. Ties go
+    to the most recently written block. ``text_scores`` (block id -> 0..1 from a
+    content index) are blended into relevance when given.
+    """
+    if plan.limits <= 0:
+        return []
+    now = now or datetime.now(timezone.utc)
+    weights = ScoringWeights.from_plan(plan)
+    diversify_sources = "unique_sources" in plan.diversity_rules
+    unique_content = "unique_content" in plan.diversity_rules
+
+    heap: List[Tuple[float, int, int, MemoryBlock]] = []
+    for seq, block in enumerate(blocks):
+        if is_expired(block, now):
+            continue
+        text_score = text_scores.get(block.id, 0.0) if text_scores is not None else None
+        heap.append((-score_block(block, query, weights, now, text_score), -seq, 0, block))
+    heapq.heapify(heap)
+
+    selected: List[MemoryBlock] = []
+    source_counts: Dict[str, int] = {}
+    seen_content: set[str] = set()
+    while heap and len(selected) < plan.limits:
+        negative_score, negative_seq, penalized_for, block = heapq.heappop(heap)
+        if unique_content and block.content in seen_content:
+            continue
+        if diversify_sources:
+            source = _source_key(block)
+            count = source_counts.get(source, 0)
+            if count != penalized_for:
+                rescored = negative_score * math.pow(weights.diversity_penalty, count - penalized_for)
+                heapq.heappush(heap, (rescored, negative_seq, count, block))
+                continue
+            source_counts[source] = count + 1
+        selected.append(block)
+        seen_content.add(block.content)
+    return selected
@@ -0,0 +1,366 @@
+"""Segmented, indexed memory store."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .contracts import MemoryBlock, QueryPlan, TagSet
+from .retrieval import rank_blocks
+from .serialization import iter_payloads
+from .text_index import HybridIndex
+
+
+DEFAULT_SEGMENT_BYTES = 4 * 1024 * 1024
+CURRENT_FILE = "CURRENT"
+RUN_STORE_DIR = "memory"  # a run directory's segment store, preferred over its memory.jsonl
+
+
+@dataclass
+class _IndexEntry:
+    segment: int
+    offset: int
+    length: int
+    tag_keys: List[str]
+    seq: int = 0
+
+
+def _tag_key(key: str, value: Any) -> str:
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return f"{key}\x1f{json.dumps(value, sort_keys=True)}"
+
+
+def _tag_keys(tags: TagSet) -> List[str]:
+    return [_tag_key(key, value) for key, value in tags.tags.items()]
+
+
+class SegmentMemoryAdapter:
+    """Memory adapter backed by rolled segment files plus offset and tag indexes.
+
+    Blocks are appended to ``segment-gGGGG-NNNNN.jsonl`` files in ``directory``.
+    Every write also appends one line to ``index-gGGGG.jsonl`` recording where the
+    block lives and which tag keys it carries, so a reader only decodes the blocks
+    it returns. ``CURRENT`` names the live generation; ``compact`` writes a new
+    generation and switches to it atomically. As with ``FileSystemMemoryAdapter``,
+    a ``text_index`` also matches blocks on content; building it decodes every
+    block once.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        validate_reads: bool = True,
+        text_index: Optional[HybridIndex] = None,
+    ) -> None:
+        if segment_bytes <= 0:
+            raise ValueError("segment_bytes must be positive")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.validate_reads = validate_reads
+        self.text_index = text_index
+        self._text_index_loaded = False
+        self.last_query_plan: Optional[QueryPlan] = None
+        self._lock = threading.RLock()
+        self._io = threading.local()
+        self._generation = self._read_generation()
+        self._entries: Dict[str, _IndexEntry] = {}
+        self._postings: Dict[str, Dict[str, None]] = {}
+        self._active_segment = 0
+        self._next_seq = 0
+        self._load_index()
+
+    def io_counters(self) -> Tuple[int, int]:
+        """Bytes (read, written) by the calling thread; threads sharing the adapter count separately."""
+        return getattr(self._io, "read", 0), getattr(self._io, "written", 0)
+
+    def _count(self, read: int = 0, written: int = 0) -> None:
+        self._io.read = getattr(self._io, "read", 0) + read
+        self._io.written = getattr(self._io, "written", 0) + written
+
+    def read(self, tags: TagSet, query_plan: Optional[QueryPlan] = None) -> List[MemoryBlock]:
+        self.last_query_plan = query_plan
+        with self._lock:
+            text_scores = self._search_text(query_plan)
+            ids = self._matching_ids(tags)
+            if text_scores and tags.tags:
+                matched = dict.fromkeys(ids)
+                matched.update((block_id, None) for block_id in text_scores if block_id in self._entries)
+                ids = sorted(matched, key=lambda block_id: self._entries[block_id].seq)
+            blocks = self._load_blocks(ids)
+        if query_plan is None:
+            return blocks
+        return rank_blocks(blocks, tags, query_plan, text_scores=text_scores)
+
+    def write(self, block: MemoryBlock) -> None:
+        line = (json.dumps(block.to_dict()) + "\n").encode("utf-8")
+        with self._lock:
+            self._load_text_index()
+            segment_path = self._segment_path(self._generation, self._active_segment)
+            offset = segment_path.stat().st_size if segment_path.exists() else 0
+            if offset and offset + len(line) > self.segment_bytes:
+                self._active_segment += 1
+                segment_path = self._segment_path(self._generation, self._active_segment)
+                offset = 0
+            with segment_path.open("ab") as handle:
+                handle.write(line)
+            entry = _IndexEntry(self._active_segment, offset, len(line), _tag_keys(block.tags))
+            index_line = (json.dumps(_entry_to_dict(block.id, entry)) + "\n").encode("utf-8")
+            with self._index_path(self._generation).open("ab") as handle:
+                handle.write(index_line)
+            self._add_entry(block.id, entry)
+            self._count(written=len(line) + len(index_line))
+            if self.text_index is not None:
+                self.text_index.add(block.id, block.content)
+
+    def scan(self) -> Iterator[MemoryBlock]:
+        with self._lock:
+            ids = list(self._entries)
+        for start in range(0, len(ids), 256):
+            with self._lock:
+                blocks = self._load_blocks(ids[start : start + 256])
+            yield from blocks
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def compact(self) -> int:
+        """Rewrite live blocks into a fresh generation and drop superseded data.
+
+        Returns the number of bytes reclaimed on disk.
+        """
+        with self._lock:
+            live = list(self._entries)
+            return self._rewrite(
+                (block_id, raw, self._entries[block_id].tag_keys) for block_id, raw in self._iter_raw(live)
+            )
+
+    def replace(self, blocks: Iterable[MemoryBlock]) -> int:
+        """Atomically swap the store's contents for ``blocks``; returns bytes reclaimed."""
+        items = [
+            (block.id, (json.dumps(block.to_dict()) + "\n").encode("utf-8"), _tag_keys(block.tags))
+            for block in blocks
+        ]
+        with self._lock:
+            reclaimed = self._rewrite(iter(items))
+            if self.text_index is not None:
+                self.text_index.clear()
+                self._text_index_loaded = False
+            return reclaimed
+
+    def disk_usage(self) -> int:
+        with self._lock:
+            return self._disk_usage(self._generation)
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """Hold off writers on this adapter, e.g. between ``scan`` and ``replace``."""
+        with self._lock:
+            yield
+
+    def _rewrite(self, items: Iterator[tuple[str, bytes, List[str]]]) -> int:
+        """Write ``items`` as a new generation and switch to it; the caller holds ``_lock``."""
+        before = self._disk_usage(self._generation)
+        old_generation = self._generation
+        new_generation = old_generation + 1
+        entries: Dict[str, _IndexEntry] = {}
+        segment = 0
+        offset = 0
+        segment_handle = self._segment_path(new_generation, segment).open("wb")
+        try:
+            with self._index_path(new_generation).open("w", encoding="utf-8") as index_handle:
+                for block_id, raw, tag_keys in items:
+                    if offset and offset + len(raw) > self.segment_bytes:
+                        segment_handle.close()
+                        segment += 1
+                        offset = 0
+                        segment_handle = self._segment_path(new_generation, segment).open("wb")
+                    segment_handle.write(raw)
+                    entry = _IndexEntry(segment, offset, len(raw), tag_keys)
+                    index_handle.write(json.dumps(_entry_to_dict(block_id, entry)))
+                    index_handle.write("\n")
+                    entries[block_id] = entry
+                    offset += len(raw)
+        finally:
+            segment_handle.close()
+        self._write_generation(new_generation)
+        self._generation = new_generation
+        self._entries = {}
+        self._postings = {}
+        for block_id, entry in entries.items():
+            self._add_entry(block_id, entry)
+        self._active_segment = segment
+        self._remove_generation(old_generation)
+        return before - self._disk_usage(new_generation)
+
+    def _search_text(self, query_plan: Optional[QueryPlan]) -> Optional[Dict[str, float]]:
+        if self.text_index is None or query_plan is None:
+            return None
+        query = query_plan.filters.get("query")
+        if not isinstance(query, str) or not query.strip():
+            return None
+        self._load_text_index()
+        return self.text_index.search(query, expand="synonyms" in query_plan.expansion_rules)
+
+    def _load_text_index(self) -> None:
+        if self.text_index is None or self._text_index_loaded:
+            return
+        self._text_index_loaded = True
+        self.text_index.add_many(
+            [(block_id, json.loads(raw)["content"]) for block_id, raw in self._iter_raw(list(self._entries))]
+        )
+
+    def _matching_ids(self, tags: TagSet) -> List[str]:
+        if not tags.tags:
+            return list(self._entries)
+        matched: Dict[str, None] = {}
+        for key in _tag_keys(tags):
+            matched.update(self._postings.get(key, {}))
+        return sorted(matched, key=lambda block_id: self._entries[block_id].seq)
+
+    def _load_blocks(self, ids: List[str]) -> List[MemoryBlock]:
+        raw_by_id = dict(self._iter_raw(ids))
+        return [
+            MemoryBlock.from_dict(json.loads(raw_by_id[block_id]), validate=self.validate_reads) for block_id in ids
+        ]
+
+    def _iter_raw(self, ids: List[str]) -> Iterator[tuple[str, bytes]]:
+        by_segment: Dict[int, List[str]] = {}
+        for block_id in ids:
+            by_segment.setdefault(self._entries[block_id].segment, []).append(block_id)
+        for segment, segment_ids in sorted(by_segment.items()):
+            segment_ids.sort(key=lambda block_id: self._entries[block_id].offset)
+            with self._segment_path(self._generation, segment).open("rb") as handle:
+                for block_id in segment_ids:
+                    entry = self._entries[block_id]
+                    handle.seek(entry.offset)
+                    raw = handle.read(entry.length)
+                    self._count(read=len(raw))
+                    yield block_id, raw
+
+    def _add_entry(self, block_id: str, entry: _IndexEntry) -> None:
+        previous = self._entries.pop(block_id, None)
+        if previous is not None:
+            for key in previous.tag_keys:
+                postings = self._postings.get(key)
+                if postings is not None:
+                    postings.pop(block_id, None)
+                    if not postings:
+                        del self._postings[key]
+        entry.seq = self._next_seq
+        self._next_seq += 1
+        self._entries[block_id] = entry
+        for key in entry.tag_keys:
+            self._postings.setdefault(key, {})[block_id] = None
+        self._active_segment = max(self._active_segment, entry.segment)
+
+    def _load_index(self) -> None:
+        index_path = self._index_path(self._generation)
+        if index_path.exists():
+            with index_path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    if line.strip():
+                        block_id, entry = _entry_from_dict(json.loads(line))
+                        self._add_entry(block_id, entry)
+        self._recover_unindexed()
+
+    def _recover_unindexed(self) -> None:
+        """Index blocks that reached a segment but not the index (e.g. after a crash)."""
+        indexed_end: Dict[int, int] = {}
+        for entry in self._entries.values():
+            indexed_end[entry.segment] = max(indexed_end.get(entry.segment, 0), entry.offset + entry.length)
+        segment = max(indexed_end) if indexed_end else 0
+        recovered: List[tuple[str, _IndexEntry]] = []
+        while self._segment_path(self._generation, segment).exists():
+            offset = indexed_end.get(segment, 0)
+            with self._segment_path(self._generation, segment).open("rb") as handle:
+                handle.seek(offset)
+                for raw in handle:
+                    if not raw.endswith(b"\n"):
+                        break
+                    if raw.strip():
+                        payload = json.loads(raw)
+                        block = MemoryBlock.from_dict(payload)
+                        recovered.append((block.id, _IndexEntry(segment, offset, len(raw), _tag_keys(block.tags))))
+                    offset += len(raw)
+            segment += 1
+        if not recovered:
+            return
+        with self._index_path(self._generation).open("a", encoding="utf-8") as handle:
+            for block_id, entry in recovered:
+                handle.write(json.dumps(_entry_to_dict(block_id, entry)))
+                handle.write("\n")
+                self._add_entry(block_id, entry)
+
+    def _segment_path(self, generation: int, segment: int) -> Path:
+        return self.directory / f"segment-g{generation:04d}-{segment:05d}.jsonl"
+
+    def _index_path(self, generation: int) -> Path:
+        return self.directory / f"index-g{generation:04d}.jsonl"
+
+    def _generation_files(self, generation: int) -> Iterable[Path]:
+        yield from self.directory.glob(f"segment-g{generation:04d}-*.jsonl")
+        index_path = self._index_path(generation)
+        if index_path.exists():
+            yield index_path
+
+    def _disk_usage(self, generation: int) -> int:
+        return sum(path.stat().st_size for path in self._generation_files(generation))
+
+    def _remove_generation(self, generation: int) -> None:
+        for path in list(self._generation_files(generation)):
+            path.unlink()
+
+    def _read_generation(self) -> int:
+        current = self.directory / CURRENT_FILE
+        if not current.exists():
+            return 0
+        return int(current.read_text(encoding="utf-8").strip() or 0)
+
+    def _write_generation(self, generation: int) -> None:
+        current = self.directory / CURRENT_FILE
+        tmp_path = current.with_name(CURRENT_FILE + ".tmp")
+        tmp_path.write_text(f"{generation}\n", encoding="utf-8")
+        os.replace(tmp_path, current)
+
+
+def _entry_to_dict(block_id: str, entry: _IndexEntry) -> Dict[str, Any]:
+    return {
+        "id": block_id,
+        "segment": entry.segment,
+        "offset": entry.offset,
+        "length": entry.length,
+        "tags": entry.tag_keys,
+    }
+
+
+def _entry_from_dict(payload: Dict[str, Any]) -> tuple[str, _IndexEntry]:
+    entry = _IndexEntry(
+        segment=payload["segment"],
+        offset=payload["offset"],
+        length=payload["length"],
+        tag_keys=payload.get("tags", []),
+    )
+    return payload["id"], entry
+
+
+def migrate_jsonl_store(
+    source: Path,
+    target_dir: Path,
+    *,
+    segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+) -> SegmentMemoryAdapter:
+    """Copy a ``FileSystemMemoryAdapter`` store (any codec) into a segment store and compact it."""
+    adapter = SegmentMemoryAdapter(target_dir, segment_bytes=segment_bytes)
+    for payload in iter_payloads(Path(source)):
+        adapter.write(MemoryBlock.from_dict(payload))
+    adapter.compact()
+    return adapter
@@ -0,0 +1,337 @@
+"""Record codecs for the event log and memory stores.
+
+Two on-disk formats are supported:
+
+* ``jsonl`` (default): one JSON object per line, no header. Existing stores are
+  in this format.
+* ``binary``: a header (``MAGIC``, a 2-byte length and a JSON description of the
+  codec) followed by frames. A frame is a 4-byte big-endian length, a body and
+  the same length again, so files can be walked in both directions. A body holds
+  one or more newline-separated compact JSON records and may be compressed with
+  ``zlib`` or, when the ``zstandard`` package is installed, ``zstd``. Batched
+  writes become a single frame, so compression works on whole blocks.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Protocol, Sequence, Tuple
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+
+MAGIC = b"L8CF"
+FORMAT_VERSION = 1
+COMPRESSIONS = ("none", "zlib", "zstd")
+REVERSE_BLOCK_SIZE = 64 * 1024
+
+_LENGTH = struct.Struct(">I")
+_HEADER_LENGTH = struct.Struct(">H")
+
+
+class Codec(Protocol):
+    name: str
+
+    @property
+    def spec(self) -> str: ...
+
+    def header(self) -> bytes: ...
+
+    def encode(self, payloads: Sequence[Dict[str, Any]]) -> bytes: ...
+
+    def decode(self, frame: bytes) -> List[Dict[str, Any]]: ...
+
+    def iter_frames(self, handle: IO[bytes]) -> Iterator[bytes]: ...
+
+    def iter_frames_reverse(
+        self, handle: IO[bytes], start: int, block_size: int = REVERSE_BLOCK_SIZE
+    ) -> Iterator[bytes]: ...
+
+
+class JsonLinesCodec:
+    name = "jsonl"
+
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, payloads: Sequence[Dict[str, Any]]) -> bytes:
+        return b"".join(json.dumps(payload).encode("utf-8") + b"\n" for payload in payloads)
+
+    def decode(self, frame: bytes) -> List[Dict[str, Any]]:
+        return [json.loads(frame)]
+
+    def iter_frames(self, handle: IO[bytes]) -> Iterator[bytes]:
+        for line in handle:
+            if line.strip():
+                yield line
+
+    def iter_frames_reverse(
+        self, handle: IO[bytes], start: int, block_size: int = REVERSE_BLOCK_SIZE
+    ) -> Iterator[bytes]:
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        position = handle.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > start:
+            step = min(block_size, position - start)
+            position -= step
+            handle.seek(position)
+            chunk = handle.read(step) + remainder
+            lines = chunk.split(b"\n")
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield line
+        if remainder.strip():
+            yield remainder
+
+    @property
+    def spec(self) -> str:
+        return self.name
+
+
+class BinaryCodec:
+    name = "binary"
+
+    def __init__(self, compression: str = "none", level: Optional[int] = None) -> None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"compression must be one of {', '.join(COMPRESSIONS)}")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requires the zstandard package")
+        self.compression = compression
+        self.level = level
+
+    def header(self) -> bytes:
+        description = json.dumps(
+            {"codec": self.name, "compression": self.compression, "version": FORMAT_VERSION},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        return MAGIC + _HEADER_LENGTH.pack(len(description)) + description
+
+    def encode(self, payloads: Sequence[Dict[str, Any]]) -> bytes:
+        if not payloads:
+            return b""
+        body = b"\n".join(json.dumps(payload, separators=(",", ":")).encode("utf-8") for payload in payloads)
+        body = self._compress(body)
+        length = _LENGTH.pack(len(body))
+        return length + body + length
+
+    def decode(self, frame: bytes) -> List[Dict[str, Any]]:
+        body = self._decompress(frame[_LENGTH.size : -_LENGTH.size])
+        return [json.loads(line) for line in body.split(b"\n")]
+
+    def iter_frames(self, handle: IO[bytes]) -> Iterator[bytes]:
+        while True:
+            prefix = handle.read(_LENGTH.size)
+            if len(prefix) < _LENGTH.size:
+                return
+            (length,) = _LENGTH.unpack(prefix)
+            rest = handle.read(length + _LENGTH.size)
+            if len(rest) < length + _LENGTH.size or rest[-_LENGTH.size :] != prefix:
+                return  # torn trailing write
+            yield prefix + rest
+
+    def iter_frames_reverse(
+        self, handle: IO[bytes], start: int, block_size: int = REVERSE_BLOCK_SIZE
+    ) -> Iterator[bytes]:
+        position = handle.seek(0, os.SEEK_END)
+        if not self._ends_with_frame(handle, start, position):
+            position = self._intact_end(handle, start)  # torn trailing write, skipped as by ``iter_frames``
+        while position - start >= 2 * _LENGTH.size:
+            handle.seek(position - _LENGTH.size)
+            suffix = handle.read(_LENGTH.size)
+            (length,) = _LENGTH.unpack(suffix)
+            frame_start = position - length - 2 * _LENGTH.size
+            if frame_start < start:
+                raise ValueError("corrupt frame trailer")
+            handle.seek(frame_start)
+            frame = handle.read(position - frame_start)
+            if frame[: _LENGTH.size] != suffix:
+                raise ValueError("corrupt frame trailer")
+            yield frame
+            position = frame_start
+
+    @staticmethod
+    def _ends_with_frame(handle: IO[bytes], start: int, end: int) -> bool:
+        if end == start:
+            return True
+        if end - start < 2 * _LENGTH.size:
+            return False
+        handle.seek(end - _LENGTH.size)
+        suffix = handle.read(_LENGTH.size)
+        frame_start = end - _LENGTH.unpack(suffix)[0] - 2 * _LENGTH.size
+        if frame_start < start:
+            return False
+        handle.seek(frame_start)
+        return handle.read(_LENGTH.size) == suffix
+
+    @staticmethod
+    def _intact_end(handle: IO[bytes], start: int) -> int:
+        """Offset just past the last complete frame, found by walking the length prefixes."""
+        end = handle.seek(0, os.SEEK_END)
+        position = start
+        while position + 2 * _LENGTH.size <= end:
+            handle.seek(position)
+            prefix = handle.read(_LENGTH.size)
+            frame_end = position + _LENGTH.unpack(prefix)[0] + 2 * _LENGTH.size
+            if frame_end > end:
+                break
+            handle.seek(frame_end - _LENGTH.size)
+            if handle.read(_LENGTH.size) != prefix:
+                break
+            position = frame_end
+        return position
+
+    @property
+    def spec(self) -> str:
+        return self.name if self.compression == "none" else f"{self.name}+{self.compression}"
+
+    def _compress(self, body: bytes) -> bytes:
+        if self.compression == "zlib":
+            return zlib.compress(body, self.level if self.level is not None else 6)
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=self.level or 3).compress(body)
+        return body
+
+    def _decompress(self, body: bytes) -> bytes:
+        if self.compression == "zlib":
+            return zlib.decompress(body)
+        if self.compression == "zstd":
+            return zstandard.ZstdDecompressor().decompress(body)
+        return body
+
+
+def get_codec(spec: str) -> Codec:
+    """Return a codec for ``"jsonl"``, ``"binary"`` or ``"binary+<compression>"``."""
+    name, _, compression = spec.partition("+")
+    if name == JsonLinesCodec.name and not compression:
+        return JsonLinesCodec()
+    if name == BinaryCodec.name:
+        return BinaryCodec(compression or "none")
+    raise ValueError(f"unknown codec: {spec}")
+
+
+def read_header(handle: IO[bytes]) -> Tuple[Codec, int]:
+    """Detect the codec of an open file; returns the codec and the header length."""
+    handle.seek(0)
+    magic = handle.read(len(MAGIC))
+    if magic != MAGIC:
+        handle.seek(0)
+        return JsonLinesCodec(), 0
+    (length,) = _HEADER_LENGTH.unpack(handle.read(_HEADER_LENGTH.size))
+    description = json.loads(handle.read(length))
+    if description.get("codec") != BinaryCodec.name:
+        raise ValueError(f"unsupported codec in header: {description.get('codec')}")
+    if description.get("version", FORMAT_VERSION) > FORMAT_VERSION:
+        raise ValueError(f"unsupported codec version: {description['version']}")
+    return BinaryCodec(description.get("compression", "none")), len(MAGIC) + _HEADER_LENGTH.size + length
+
+
+def detect_codec(path: Path) -> Optional[Codec]:
+    """Return the codec of an existing, non-empty file, or ``None``."""
+    path = Path(path)
+    if not path.exists() or path.stat().st_size == 0:
+        return None
+    with path.open("rb") as handle:
+        return read_header(handle)[0]
+
+
+def resolve_codec(path: Path, codec: Optional[Codec]) -> Codec:
+    """Pick the codec for ``path``: the file's own codec wins over the requested one."""
+    existing = detect_codec(path)
+    if existing is None:
+        return codec if codec is not None else JsonLinesCodec()
+    if codec is not None and codec.spec != existing.spec:
+        raise ValueError(f"{path} uses codec {existing.spec}, not {codec.spec}; convert it with convert_store")
+    return existing
+
+
+def append_payloads(handle: IO[bytes], codec: Codec, payloads: Sequence[Dict[str, Any]]) -> None:
+    """Append encoded payloads to a handle opened in ``ab`` mode, writing the header first if empty."""
+    data = codec.encode(payloads)
+    if os.fstat(handle.fileno()).st_size == 0:
+        data = codec.header() + data
+    handle.write(data)
+
+
+def iter_payloads(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield every decoded payload of a store in file order."""
+    path = Path(path)
+    if not path.exists():
+        return
+    with path.open("rb") as handle:
+        codec, _ = read_header(handle)
+        for frame in codec.iter_frames(handle):
+            yield from codec.decode(frame)
+
+
+def iter_payloads_reverse(path: Path, block_size: int = REVERSE_BLOCK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Yield every decoded payload of a store, newest first."""
+    path = Path(path)
+    if not path.exists():
+        return
+    with path.open("rb") as handle:
+        codec, start = read_header(handle)
+        for frame in codec.iter_frames_reverse(handle, start, block_size):
+            yield from reversed(codec.decode(frame))
+
+
+def convert_store(source: Path, target: Path, codec: Codec, *, batch_size: int = 256) -> int:
+    """Rewrite ``source`` into ``target`` using ``codec``; returns the record count.
+
+    ``target`` may equal ``source``: the new file is written next to it and moved
+    into place atomically. ``target`` gets the permissions of ``source``.
+    """
+    return write_store(target, codec, iter_payloads(source), batch_size=batch_size, mode_from=source)
+
+
+def write_store(
+    target: Path,
+    codec: Codec,
+    payloads: Iterable[Dict[str, Any]],
+    *,
+    batch_size: int = 256,
+    mode_from: Optional[Path] = None,
+) -> int:
+    """Write ``payloads`` to a fresh file and atomically move it over ``target``; returns the record count.
+
+    The file keeps the permissions of ``mode_from`` (default: ``target``) when that exists.
+    """
+    target = Path(target)
+    mode_source = Path(mode_from) if mode_from is not None else target
+    target.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{target.name}.", dir=target.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(codec.header())
+            for batch in _batched(payloads, batch_size):
+                handle.write(codec.encode(batch))
+                count += len(batch)
+        if mode_source.exists():
+            shutil.copymode(mode_source, tmp_name)
+        os.replace(tmp_name, target)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return count
+
+
+def _batched(payloads: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch: List[Dict[str, Any]] = []
+    for payload in payloads:
+        batch.append(payload)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
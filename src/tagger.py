@@ -2,32 +2,191 @@
 
 from __future__ import annotations
 
+import copy
 import os
-from typing import Any, Dict
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .contracts import TagSet
+from .model_backend import HttpModelBackend
+
+
+SCHEMA_VERSION = "v0"
+
+
+def normalize_task(task: str) -> str:
+    return " ".join(task.split())
+
+
+@dataclass
+class TagResult:
+    tags: TagSet
+    latency: float = 0.0
+    cost: float = 0.0
+    cached: bool = False
+    batch_size: int = 1
+
+    def to_tool_call(self, **extra: Any) -> Dict[str, Any]:
+        return {
+            "name": "tagger",
+            **extra,
+            "latency": self.latency,
+            "cost": self.cost,
+            "cached": self.cached,
+            "batch_size": self.batch_size,
+        }
 
 
 class Tagger:
-    def __init__(self, fake_backend: bool = False) -> None:
+    def __init__(
+        self,
+        fake_backend: bool = False,
+        model_endpoint: Optional[str] = None,
+        *,
+        timeout: float = 10.0,
+    ) -> None:
         self.fake_backend = fake_backend
-        self.model_endpoint = os.getenv("LIBR8_MODEL_ENDPOINT")
+        self.model_endpoint = model_endpoint or os.getenv("LIBR8_MODEL_ENDPOINT")
         if not self.fake_backend and not self.model_endpoint:
             raise RuntimeError("LIBR8_MODEL_ENDPOINT must be set when not using fake backend")
+        self.timeout = timeout
+        self._backend: Optional[HttpModelBackend] = None
+        self._backend_lock = threading.Lock()
+
+    @property
+    def backend(self) -> HttpModelBackend:
+        with self._backend_lock:
+            if self._backend is None or self._backend.endpoint != self.model_endpoint:
+                assert self.model_endpoint is not None
+                self._backend = HttpModelBackend(
+                    self.model_endpoint, timeout=self.timeout, schema_version=SCHEMA_VERSION
+                )
+            return self._backend
 
     def extract_tags(self, task: str) -> TagSet:
+        return self.extract([task])[0].tags
+
+    def extract_tags_many(self, tasks: List[str]) -> List[TagSet]:
+        return [result.tags for result in self.extract(tasks)]
+
+    def extract(self, tasks: List[str]) -> List[TagResult]:
         if self.fake_backend:
-            tags: Dict[str, Any] = {
-                "intent": "fake",
-                "task_length": len(task),
-                "task_prefix": task[:12],
-            }
-            return TagSet(schema_version="v0", tags=tags, uncertainty={"intent": 0.0})
-        # NOTE: Backend integration is a stub unless an HTTP call is implemented.
-        tags = {
-            "intent": "backend_stub",
-            "backend": "stub",
-            "endpoint": self.model_endpoint,
+            return [TagResult(tags=self._fake_tags(task)) for task in tasks]
+        backend = self.backend
+        if len(tasks) == 1:
+            responses = [backend.submit(tasks[0])]
+        else:
+            responses = backend.extract_many(tasks)
+        return [
+            TagResult(
+                tags=TagSet(
+                    schema_version=SCHEMA_VERSION,
+                    tags=response.payload.get("tags", {}),
+                    uncertainty=response.payload.get("uncertainty"),
+                ),
+                latency=response.latency,
+                cost=response.cost,
+                batch_size=response.batch_size,
+            )
+            for response in responses
+        ]
+
+    def close(self) -> None:
+        with self._backend_lock:
+            if self._backend is not None:
+                self._backend.close()
+                self._backend = None
+
+    def _fake_tags(self, task: str) -> TagSet:
+        tags: Dict[str, Any] = {
+            "intent": "fake",
             "task_length": len(task),
+            "task_prefix": task[:12],
         }
-        return TagSet(schema_version="v0", tags=tags, uncertainty={"intent": 0.2})
+        return TagSet(schema_version=SCHEMA_VERSION, tags=tags, uncertainty={"intent": 0.0})
+
+
+class TaggerService:
+    """Long-lived Tagger with a bounded LRU/TTL cache of extracted tags.
+
+    Cache keys are the whitespace-normalized task text plus the schema version,
+    and the tagger always sees the normalized text, so results do not depend on
+    whether a lookup hit. Callers get their own copy of each cached TagSet.
+    """
+
+    def __init__(self, tagger: Tagger, *, maxsize: int = 1024, ttl: Optional[float] = 3600.0) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.tagger = tagger
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, TagSet]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def model_endpoint(self) -> Optional[str]:
+        return self.tagger.model_endpoint
+
+    def extract_tags(self, task: str) -> TagSet:
+        return self.extract([task])[0].tags
+
+    def extract_tags_many(self, tasks: Iterable[str]) -> List[TagSet]:
+        return [result.tags for result in self.extract(tasks)]
+
+    def extract(self, tasks: Iterable[str]) -> List[TagResult]:
+        keys = [(normalize_task(task), SCHEMA_VERSION) for task in tasks]
+        found: Dict[Tuple[str, str], TagResult] = {}
+        missing: Dict[Tuple[str, str], None] = {}
+        with self._lock:
+            now = time.monotonic()
+            for key in keys:
+                if key in found or key in missing:
+                    continue
+                cached = self._cache.get(key)
+                if cached is not None and (self.ttl is None or now - cached[0] < self.ttl):
+                    self._cache.move_to_end(key)
+                    found[key] = TagResult(tags=cached[1], cached=True, batch_size=0)
+                    self.hits += 1
+                else:
+                    missing[key] = None
+                    self.misses += 1
+        if missing:
+            extracted = self.tagger.extract([text for text, _ in missing])
+            with self._lock:
+                now = time.monotonic()
+                for key, result in zip(missing, extracted):
+                    found[key] = result
+                    self._cache[key] = (now, result.tags)
+                    self._cache.move_to_end(key)
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+                    self.evictions += 1
+        results: List[TagResult] = []
+        for key in keys:
+            result = found[key]
+            results.append(replace(result, tags=copy.deepcopy(result.tags)))
+            # Only the first occurrence of a miss paid for the backend call.
+            if not result.cached:
+                found[key] = TagResult(tags=result.tags, cached=True, batch_size=0)
+        return results
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._cache),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,210 @@
+"""Local lexical + dense hybrid index over MemoryBlock content."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+
+EmbeddingFunction = Callable[[Sequence[str]], List[List[float]]]
+
+_TOKEN_RE = re.compile(r"\w+")
+SYNONYM_WEIGHT = 0.5
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class HashingEmbedder:
+    """Deterministic bag-of-words embedder for offline use (signed feature hashing)."""
+
+    def __init__(self, dim: int = 256) -> None:
+        if dim <= 0:
+            raise ValueError("dim must be positive")
+        self.dim = dim
+
+    def __call__(self, texts: Sequence[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+
+    def _embed(self, text: str) -> List[float]:
+        vector = [0.0] * self.dim
+        for token in tokenize(text):
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "big")
+            vector[value % self.dim] += 1.0 if value >> 63 else -1.0
+        norm = math.sqrt(sum(component * component for component in vector))
+        return [component / norm for component in vector] if norm else vector
+
+
+class BM25Index:
+    def __init__(self, *, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._doc_terms: Dict[str, Dict[str, int]] = {}
+        self._doc_lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def add(self, doc_id: str, text: str) -> None:
+        self.remove(doc_id)
+        counts: Dict[str, int] = {}
+        for token in tokenize(text):
+            counts[token] = counts.get(token, 0) + 1
+        for token, count in counts.items():
+            self._postings.setdefault(token, {})[doc_id] = count
+        self._doc_terms[doc_id] = counts
+        length = sum(counts.values())
+        self._doc_lengths[doc_id] = length
+        self._total_length += length
+
+    def remove(self, doc_id: str) -> None:
+        counts = self._doc_terms.pop(doc_id, None)
+        if counts is None:
+            return
+        for token in counts:
+            postings = self._postings[token]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[token]
+        self._total_length -= self._doc_lengths.pop(doc_id)
+
+    def search(self, weighted_terms: Dict[str, float]) -> Dict[str, float]:
+        if not self._doc_lengths:
+            return {}
+        doc_count = len(self._doc_lengths)
+        average_length = self._total_length / doc_count or 1.0
+        scores: Dict[str, float] = {}
+        for term, weight in weighted_terms.items():
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1.0 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                norm = self.k1 * (1.0 - self.b + self.b * self._doc_lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight * idf * frequency * (self.k1 + 1.0) / (
+                    frequency + norm
+                )
+        return scores
+
+
+class DenseIndex:
+    """Row-per-document vector matrix; uses NumPy when it is installed."""
+
+    def __init__(self, embedder: EmbeddingFunction) -> None:
+        self.embedder = embedder
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._rows: List[List[float]] = []
+        self._matrix = None
+
+    def add_many(self, items: Sequence[Tuple[str, str]]) -> None:
+        if not items:
+            return
+        vectors = self.embedder([text for _, text in items])
+        for (doc_id, _), vector in zip(items, vectors):
+            position = self._positions.get(doc_id)
+            if position is None:
+                self._positions[doc_id] = len(self._ids)
+                self._ids.append(doc_id)
+                self._rows.append(list(vector))
+            else:
+                self._rows[position] = list(vector)
+        self._matrix = None
+
+    def search(self, query: str) -> Dict[str, float]:
+        if not self._ids:
+            return {}
+        query_vector = self.embedder([query])[0]
+        if np is not None:
+            if self._matrix is None:
+                self._matrix = np.asarray(self._rows, dtype=np.float32)
+            similarities = self._matrix @ np.asarray(query_vector, dtype=np.float32)
+            return {doc_id: float(similarities[idx]) for idx, doc_id in enumerate(self._ids)}
+        return {
+            doc_id: sum(left * right for left, right in zip(row, query_vector))
+            for doc_id, row in zip(self._ids, self._rows)
+        }
+
+
+class HybridIndex:
+    """BM25 plus optional dense similarity, fused into a single 0..1 score.
+
+    The lexical score is normalized by the best hit; the dense score is the cosine
+    similarity clipped at zero. ``dense_weight`` sets the dense share of the fused
+    score. With ``expand=True`` query terms are widened through ``synonyms`` (a
+    term -> alternatives map) at ``SYNONYM_WEIGHT``.
+    """
+
+    def __init__(
+        self,
+        *,
+        embedder: Optional[EmbeddingFunction] = None,
+        dense_weight: float = 0.3,
+        synonyms: Optional[Dict[str, Iterable[str]]] = None,
+    ) -> None:
+        if not 0.0 <= dense_weight <= 1.0:
+            raise ValueError("dense_weight must be between 0 and 1")
+        self.lexical = BM25Index()
+        self.dense = DenseIndex(embedder) if embedder is not None else None
+        self.dense_weight = dense_weight if embedder is not None else 0.0
+        self.synonyms: Dict[str, List[str]] = {}
+        for term, alternatives in (synonyms or {}).items():
+            self.add_synonyms(term, alternatives)
+
+    def __len__(self) -> int:
+        return len(self.lexical)
+
+    def add_synonyms(self, term: str, alternatives: Iterable[str]) -> None:
+        """Register symmetric synonyms for ``term``."""
+        group = [token for word in [term, *alternatives] for token in tokenize(word)]
+        for token in group:
+            known = self.synonyms.setdefault(token, [])
+            known.extend(other for other in group if other != token and other not in known)
+
+    def add(self, doc_id: str, text: str) -> None:
+        self.add_many([(doc_id, text)])
+
+    def clear(self) -> None:
+        self.lexical = BM25Index(k1=self.lexical.k1, b=self.lexical.b)
+        if self.dense is not None:
+            self.dense = DenseIndex(self.dense.embedder)
+
+    def add_many(self, items: Sequence[Tuple[str, str]]) -> None:
+        for doc_id, text in items:
+            self.lexical.add(doc_id, text)
+        if self.dense is not None:
+            self.dense.add_many(items)
+
+    def expand(self, query: str) -> Dict[str, float]:
+        weighted: Dict[str, float] = {}
+        for token in tokenize(query):
+            weighted[token] = 1.0
+        for token in list(weighted):
+            for synonym in self.synonyms.get(token, []):
+                weighted.setdefault(synonym, SYNONYM_WEIGHT)
+        return weighted
+
+    def search(self, query: str, *, expand: bool = False) -> Dict[str, float]:
+        terms = self.expand(query) if expand else {token: 1.0 for token in tokenize(query)}
+        lexical = self.lexical.search(terms)
+        best = max(lexical.values(), default=0.0)
+        fused: Dict[str, float] = {}
+        if best > 0:
+            for doc_id, score in lexical.items():
+                fused[doc_id] = (1.0 - self.dense_weight) * score / best
+        if self.dense is not None and self.dense_weight:
+            for doc_id, similarity in self.dense.search(query).items():
+                if similarity > 0:
+                    fused[doc_id] = fused.get(doc_id, 0.0) + self.dense_weight * min(similarity, 1.0)
+        return fused
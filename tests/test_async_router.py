@@ -0,0 +1,65 @@
+import asyncio
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.agents import tagger_agent
+from src.eventlog import EventLog
+from src.orchestration.async_router import run_many, run_router_async
+
+
+class TestAsyncRouter(unittest.TestCase):
+    def tearDown(self) -> None:
+        tagger_agent.reset_tagger_services()
+
+    def test_run_many_keeps_task_order_for_writeback_and_log(self) -> None:
+        tasks = [f"task {idx}" for idx in range(12)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage_dir = Path(tmpdir) / "run"
+            events = asyncio.run(run_many(tasks, storage_dir, concurrency=4, fake_backend=True))
+
+            self.assertEqual([event.task for event in events], tasks)
+            self.assertTrue(all(event.outcome == "success" for event in events))
+            self.assertEqual([event.task for event in EventLog(storage_dir / "eventlog.jsonl").read_all()], tasks)
+            with (storage_dir / "memory.jsonl").open(encoding="utf-8") as handle:
+                contents = [json.loads(line)["content"] for line in handle]
+            self.assertEqual([content.split(" (")[0] for content in contents], [f"SYNTHESIS: {t}" for t in tasks])
+
+    def test_read_stages_overlap_up_to_concurrency(self) -> None:
+        real_extract = tagger_agent.extract
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_extract(task: str, **kwargs: object):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return real_extract(task, **kwargs)
+
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.object(tagger_agent, "extract", slow_extract):
+            asyncio.run(run_many([f"t{idx}" for idx in range(9)], Path(tmpdir), concurrency=3, fake_backend=True))
+        self.assertEqual(peak, 3)
+
+    def test_run_router_async_matches_sync_actions(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            event = asyncio.run(run_router_async("hello async", Path(tmpdir), fake_backend=True))
+        self.assertEqual(
+            event.actions, ["tag_extraction", "memory_read", "synthesis", "memory_write", "event_log"]
+        )
+
+    def test_invalid_concurrency(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir, self.assertRaises(ValueError):
+            asyncio.run(run_many(["x"], Path(tmpdir), concurrency=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
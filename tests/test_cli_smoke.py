@@ -1,10 +1,15 @@
 import io
+import json
+import socket
 import tempfile
 import unittest
 from contextlib import redirect_stdout
 from pathlib import Path
+from unittest import mock
 
+from src.agents import tagger_agent
 from src.cli import main
+from src.eventlog import EventLog
 
 
 class TestCliSmoke(unittest.TestCase):
@@ -27,6 +32,90 @@ class TestCliSmoke(unittest.TestCase):
             self.assertTrue((storage_dir / "eventlog.jsonl").exists())
             self.assertTrue((storage_dir / "memory.jsonl").exists())
 
+    def test_show_runs_lists_latest_event(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage_dir = Path(tmpdir) / "run"
+            with redirect_stdout(io.StringIO()):
+                main(["run", "first", "--storage", str(storage_dir), "--fake"])
+                main(["run", "second", "--storage", str(storage_dir), "--fake", "--print-json"])
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                exit_code = main(["show-runs", "--storage", tmpdir])
+            self.assertEqual(exit_code, 0)
+            lines = stdout.getvalue().splitlines()
+            self.assertEqual(len(lines), 1)
+            self.assertTrue(lines[0].endswith(f"success {storage_dir}"))
+
+    def test_convert_store_rejects_unavailable_codecs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = Path(tmpdir) / "memory.jsonl"
+            store.write_text("")
+            for codec in ("xml", "binary+lz4"):
+                with self.subTest(codec=codec):
+                    stdout = io.StringIO()
+                    with redirect_stdout(stdout):
+                        exit_code = main(["convert-store", str(store), "--codec", codec])
+                    self.assertEqual(exit_code, 2)
+                    self.assertTrue(stdout.getvalue().startswith("invalid codec:"))
+
+    def test_run_batch_reads_jsonl_and_text_lines(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "tasks.jsonl"
+            source.write_text('{"task": "first"}\n"second"\n\nplain third\n', encoding="utf-8")
+            storage_dir = Path(tmpdir) / "batch"
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                exit_code = main(
+                    [
+                        "run-batch",
+                        str(source),
+                        "--storage",
+                        str(storage_dir),
+                        "--fake",
+                        "--parallelism",
+                        "2",
+                        "--chunk-size",
+                        "2",
+                        "--print-json",
+                    ]
+                )
+            self.assertEqual(exit_code, 0)
+            summary = json.loads(stdout.getvalue())
+            self.assertEqual(summary["tasks"], 3)
+            self.assertEqual(summary["failures"], {})
+            tasks = [event.task for event in EventLog(storage_dir / "eventlog.jsonl").read_all()]
+            self.assertEqual(tasks, ["first", "second", "plain third"])
+
+    def test_run_batch_skips_blank_tasks_and_malformed_objects(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "tasks.jsonl"
+            source.write_text('{"task": " "}\n" "\n{"foo": 1}\n{"task": "kept"}\n{"task": 5}\n', encoding="utf-8")
+            storage_dir = Path(tmpdir) / "batch"
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                exit_code = main(["run-batch", str(source), "--storage", str(storage_dir), "--fake", "--print-json"])
+            self.assertEqual(exit_code, 0)
+            summary = json.loads(stdout.getvalue())
+            self.assertEqual((summary["tasks"], summary["skipped_lines"]), (1, [3, 5]))
+            tasks = [event.task for event in EventLog(storage_dir / "eventlog.jsonl").read_all()]
+            self.assertEqual(tasks, ["kept"])
+
+    def test_run_batch_from_stdin_counts_failures(self) -> None:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stdout = io.StringIO()
+            with mock.patch("sys.stdin", io.StringIO("a\nb\n")), redirect_stdout(stdout):
+                exit_code = main(
+                    ["run-batch", "-", "--storage", tmpdir, "--model-endpoint", f"http://127.0.0.1:{port}/tags"]
+                )
+            tagger_agent.reset_tagger_services()
+            self.assertEqual(exit_code, 0)
+            lines = stdout.getvalue().splitlines()
+            self.assertIn("2 tasks in", lines[0])
+            self.assertEqual(lines[1].strip(), "backend_unavailable: 2")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from benchmarks.bench_startup import measure_import
+from src import cli
+from src.orchestration.async_router import DEFAULT_CONCURRENCY
+from src.segment_store import DEFAULT_SEGMENT_BYTES
+
+# Modules that only specific subcommands need; importing the CLI must not load them.
+_DEFERRED = (
+    "asyncio",
+    "http.client",
+    "src.agents.tagger_agent",
+    "src.daemon",
+    "src.lifecycle",
+    "src.memory_adapter",
+    "src.orchestration.router",
+    "src.segment_store",
+    "src.tagger",
+    "src.text_index",
+)
+
+
+class TestCliStartup(unittest.TestCase):
+    def test_import_defers_heavy_modules(self) -> None:
+        timings = measure_import("src.cli")
+        self.assertIn("src.cli", timings)
+        self.assertEqual([name for name in _DEFERRED if name in timings], [])
+
+    def test_parser_defaults_match_their_modules(self) -> None:
+        self.assertEqual(cli.DEFAULT_PARALLELISM, DEFAULT_CONCURRENCY)
+        self.assertEqual(cli.DEFAULT_SEGMENT_BYTES, DEFAULT_SEGMENT_BYTES)
+
+
+if __name__ == "__main__":
+    unittest.main()
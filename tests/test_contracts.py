@@ -6,6 +6,7 @@ from src.contracts import (
     MemoryBlock,
     QueryPlan,
     TagSet,
+    ValidationError,
     WritebackPackage,
 )
 
@@ -56,6 +57,28 @@ class ContractsTest(unittest.TestCase):
         payload = package.to_dict()
         json.dumps(payload)
 
+    def test_trusted_from_dict_matches_validated(self) -> None:
+        tags = TagSet(schema_version="v0", tags={"intent": "trusted"}, uncertainty={"intent": 0.3})
+        block = MemoryBlock(
+            content="note",
+            tags=tags,
+            provenance={"source": "unit_test"},
+            lane="semantic",
+            confidence=0.7,
+        )
+        package = WritebackPackage(episode="episode", distilled_facts=["fact"], tags=tags, evaluation_outcome="ok")
+        for contract in (tags, block, package):
+            payload = contract.to_dict()
+            trusted = type(contract).from_dict(payload, validate=False)
+            self.assertEqual(trusted, type(contract).from_dict(payload))
+            self.assertEqual(trusted.to_dict(), payload)
+
+    def test_trusted_from_dict_skips_validation(self) -> None:
+        payload = {"schema_version": "", "tags": {}, "uncertainty": {"intent": 5.0}}
+        with self.assertRaises(ValidationError):
+            TagSet.from_dict(payload)
+        self.assertEqual(TagSet.from_dict(payload, validate=False).schema_version, "")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,80 @@
+import io
+import json
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from src.agents import tagger_agent
+from src.cli import main
+from src.daemon import DaemonClient, DaemonError, RouterDaemon
+from src.eventlog import EventLog
+
+
+class TestRouterDaemon(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.storage_dir = Path(self._tmp.name) / "store"
+        self.socket_path = Path(self._tmp.name) / "d.sock"
+        self.daemon = RouterDaemon(self.storage_dir, self.socket_path, fake_backend=True)
+        self.thread = threading.Thread(target=self.daemon.serve_forever, daemon=True)
+        self.thread.start()
+        self.assertTrue(self.daemon.ready.wait(5))
+
+    def tearDown(self) -> None:
+        self.daemon.stop()
+        self.thread.join(5)
+        tagger_agent.reset_tagger_services()
+        self._tmp.cleanup()
+
+    def test_runs_tasks_over_one_connection_and_logs_them(self) -> None:
+        with DaemonClient(self.socket_path) as client:
+            self.assertEqual(client.ping()["storage"], str(self.storage_dir))
+            first = client.run(["alpha", "beta"])
+            second = client.run(["gamma"])
+            with self.assertRaises(DaemonError):
+                client.request({"op": "nope"})
+        self.assertEqual([event.task for event in first + second], ["alpha", "beta", "gamma"])
+        self.assertEqual(second[0].actions[-1], "event_log")
+        logged = [event.task for event in EventLog(self.storage_dir / "eventlog.jsonl").read_all()]
+        self.assertEqual(logged, ["alpha", "beta", "gamma"])
+
+    def test_cli_run_forwards_to_daemon_and_shutdown_removes_socket(self) -> None:
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            exit_code = main(["run", "via daemon", "--daemon", "--socket", str(self.socket_path), "--print-json"])
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(json.loads(stdout.getvalue())["task"], "via daemon")
+
+        DaemonClient(self.socket_path).shutdown()
+        self.thread.join(5)
+        self.assertFalse(self.thread.is_alive())
+        self.assertFalse(self.socket_path.exists())
+
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(["run", "x", "--daemon", "--socket", str(self.socket_path)]), 1)
+
+
+    def test_cli_run_finds_daemon_by_storage_and_rejects_serve_options(self) -> None:
+        storage_dir = Path(self._tmp.name) / "other"
+        daemon = RouterDaemon(storage_dir, fake_backend=True)
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(daemon.stop)
+        self.assertTrue(daemon.ready.wait(5))
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            exit_code = main(["run", "by storage", "--daemon", "--storage", str(storage_dir)])
+        self.assertEqual(exit_code, 0)
+        self.assertTrue(stdout.getvalue().strip().endswith(str(storage_dir)))
+
+        for option in (["--text-index"], ["--fake"], ["--model-endpoint", "http://x"]):
+            with self.subTest(option=option), redirect_stdout(io.StringIO()):
+                self.assertEqual(main(["run", "x", "--daemon", "--socket", str(self.socket_path), *option]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
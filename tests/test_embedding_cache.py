@@ -0,0 +1,136 @@
+import importlib.util
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from typing import Generic, List, TypeVar
+from unittest import mock
+
+_PATH = Path(__file__).resolve().parents[1] / "beast-integration" / "role-system" / "rag" / "embeddings" / "cache.py"
+
+
+def _load_cache_module() -> types.ModuleType:
+    """Load cache.py from its file, standing in for chromadb and crewai when they are not installed."""
+    replaced = {}
+    try:
+        import chromadb  # noqa: F401
+    except ImportError:
+        T = TypeVar("T")
+
+        class EmbeddingFunction(Generic[T]):
+            pass
+
+        replaced["chromadb"] = types.SimpleNamespace(
+            Documents=List[str], EmbeddingFunction=EmbeddingFunction, Embeddings=List[List[float]]
+        )
+    try:
+        import crewai.utilities.paths  # noqa: F401
+    except ImportError:
+        paths = types.SimpleNamespace(db_storage_path=tempfile.gettempdir)
+        replaced["crewai"] = types.SimpleNamespace()
+        replaced["crewai.utilities"] = types.SimpleNamespace(paths=paths)
+        replaced["crewai.utilities.paths"] = paths
+    spec = importlib.util.spec_from_file_location("role_system_embedding_cache", _PATH)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict("sys.modules", replaced):
+        spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+cache_module = _load_cache_module()
+
+
+class _Embedder:
+    def __init__(self, model_name: str = "tiny", dimensions: int = 3) -> None:
+        self.model_name = model_name
+        self.dimensions = dimensions
+        self.api_key = "secret"
+        self.batches: List[List[str]] = []
+
+    def __call__(self, texts: List[str]) -> List[List[float]]:
+        self.batches.append(list(texts))
+        return [[float(len(text)), 0.5, -1.0] for text in texts]
+
+
+class TestEmbeddingCache(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = str(Path(tmpdir.name) / "embeddings.db")
+
+    def _cache(self, max_entries: int = 100) -> "cache_module.EmbeddingCache":
+        cache = cache_module.EmbeddingCache(self.path, max_entries=max_entries)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_round_trip_is_namespaced_and_persistent(self) -> None:
+        self._cache().put_many("a", {"h1": [0.25, 1.0]})
+        reopened = self._cache()
+        self.assertEqual(reopened.get_many("a", ["h1", "h2"]), {"h1": [0.25, 1.0]})
+        self.assertEqual(reopened.get_many("b", ["h1"]), {})
+
+    def test_evicts_down_to_max_entries(self) -> None:
+        cache = self._cache(max_entries=3)
+        cache.put_many("ns", {f"h{idx}": [float(idx)] for idx in range(5)})
+        cache.put_many("other", {"h9": [9.0]})
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["evictions"]), (3, 3))
+        self.assertIn("h9", cache.get_many("other", ["h9"]))
+
+    def test_eviction_keeps_recently_read_entries(self) -> None:
+        cache = self._cache(max_entries=2)
+        with mock.patch.object(cache_module.time, "time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.put_many("ns", {"first": [1.0]})
+            cache.put_many("ns", {"second": [2.0]})
+            cache.get_many("ns", ["first"])
+            cache.put_many("ns", {"third": [3.0]})
+        self.assertEqual(sorted(cache.get_many("ns", ["first", "second", "third"])), ["first", "third"])
+
+    def test_stats_count_every_lookup(self) -> None:
+        cache = self._cache()
+        cache.put_many("ns", {"h1": [1.0]})
+        cache.get_many("ns", ["h1", "h1", "h2"])
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+        self.assertEqual(self._cache().stats()["hit_rate"], 0.0)
+
+
+class TestCachedEmbeddingFunction(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.cache = cache_module.EmbeddingCache(str(Path(tmpdir.name) / "embeddings.db"))
+        self.addCleanup(self.cache.close)
+
+    def test_embeds_only_misses_in_one_batch(self) -> None:
+        embedder = _Embedder()
+        function = cache_module.CachedEmbeddingFunction(embedder, "ns", self.cache)
+        first = function(["alpha", "beta", "alpha"])
+        second = function(["beta", "gamma", "delta", "gamma"])
+        self.assertEqual(embedder.batches, [["alpha", "beta"], ["gamma", "delta"]])
+        self.assertEqual(first, [[5.0, 0.5, -1.0], [4.0, 0.5, -1.0], [5.0, 0.5, -1.0]])
+        self.assertEqual(second[0], first[1])
+        self.assertEqual(len(second), 4)
+        self.assertEqual(function(["alpha", "delta"]), [first[0], second[2]])
+        self.assertEqual(len(embedder.batches), 2)
+
+    def test_namespaces_separate_models(self) -> None:
+        namespace = cache_module.embedder_namespace
+        custom = lambda embedder, **extra: {"provider": "custom", "config": {"embedder": embedder}, **extra}  # noqa: E731
+        used = _Embedder()
+        used(["warm up"])
+        self.assertEqual(namespace(custom(_Embedder())), namespace(custom(used)))
+        self.assertNotEqual(namespace(custom(_Embedder("tiny"))), namespace(custom(_Embedder("large"))))
+        self.assertNotEqual(namespace(custom(_Embedder(dimensions=3))), namespace(custom(_Embedder(dimensions=8))))
+        rotated = _Embedder()
+        rotated.api_key = "rotated"
+        self.assertEqual(namespace(custom(_Embedder())), namespace(custom(rotated)))
+        self.assertEqual(namespace(custom(_Embedder("tiny"), cache_namespace="mine-v2")), "custom:mine-v2")
+        openai = {"provider": "openai", "config": {"model": "text-embedding-3-large", "api_key": "one"}}
+        self.assertEqual(namespace(openai), namespace({**openai, "config": {**openai["config"], "api_key": "two"}}))
+        self.assertNotEqual(namespace(openai), namespace(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
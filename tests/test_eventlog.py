@@ -1,9 +1,33 @@
+import multiprocessing
 import tempfile
+import time
 import unittest
 from pathlib import Path
 
 from src.contracts import EventRecord, QueryPlan, TagSet
-from src.eventlog import EventLog
+from src.eventlog import EventLog, EventLogWriter, write_event_records
+
+
+def _record(task: str = "log") -> EventRecord:
+    tags = TagSet(schema_version="v0", tags={"intent": "eventlog"})
+    query_plan = QueryPlan(filters={}, limits=0, recency_bias=0.0)
+    return EventRecord(
+        task=task,
+        tags=tags,
+        query_plan=query_plan,
+        retrieved_ids=[],
+        actions=["event_log"],
+        tool_calls=[],
+        validations=["contracts_v0"],
+        outcome="success",
+        provenance={"source": "unit_test", "padding": "x" * 2048},
+    )
+
+
+def _write_many(path: str, prefix: str, count: int) -> None:
+    with EventLogWriter(Path(path), max_batch=7, flush_interval=None) as writer:
+        for idx in range(count):
+            writer.append(_record(f"{prefix}-{idx}"))
 
 
 class EventLogTest(unittest.TestCase):
@@ -31,6 +55,102 @@ class EventLogTest(unittest.TestCase):
         self.assertEqual(len(records), 1)
         self.assertEqual(records[0].task, "log")
 
+    def test_read_last_and_reverse_iteration(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "eventlog.jsonl"
+            log = EventLog(log_path)
+            self.assertEqual(log.read_last(3), [])
+            write_event_records(log_path, [_record(f"task-{idx}") for idx in range(5)])
+
+            self.assertEqual([r.task for r in log.read_last(2)], ["task-3", "task-4"])
+            self.assertEqual(len(log.read_last(10)), 5)
+            reverse = [r.task for r in log.iter_reverse(block_size=100)]
+            self.assertEqual(reverse, [f"task-{idx}" for idx in range(4, -1, -1)])
+
+    def test_iter_filters_before_building_records(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "eventlog.jsonl"
+            ok = _record("ok")
+            ok.timestamp = "2026-01-01T00:00:00+00:00"
+            failed = _record("failed")
+            failed.outcome = "failure"
+            failed.failure_class = "timeout"
+            failed.timestamp = "2026-01-02T00:00:00+00:00"
+            failed.tags = TagSet(schema_version="v0", tags={"intent": "other"})
+            write_event_records(log_path, [ok, failed])
+            log = EventLog(log_path)
+
+            self.assertEqual([r.task for r in log.iter(outcome="failure")], ["failed"])
+            self.assertEqual([r.task for r in log.iter(failure_class="timeout")], ["failed"])
+            self.assertEqual([r.task for r in log.iter(tags={"intent": "eventlog"})], ["ok"])
+            self.assertEqual([r.task for r in log.iter(since="2026-01-01T12:00:00+00:00")], ["failed"])
+            self.assertEqual([r.task for r in log.iter(until="2026-01-02T00:00:00Z")], ["ok"])
+
+    def test_time_filters_skip_unparseable_timestamps(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "eventlog.jsonl"
+            ok = _record("ok")
+            ok.timestamp = "2026-01-02T00:00:00+00:00"
+            corrupt = _record("corrupt")
+            corrupt.timestamp = "yesterday"
+            write_event_records(log_path, [corrupt, ok])
+            log = EventLog(log_path)
+
+            self.assertEqual([r.task for r in log.iter(since="2026-01-01T00:00:00Z")], ["ok"])
+            self.assertEqual([r.task for r in log.iter(until="2027-01-01T00:00:00Z")], ["ok"])
+            self.assertEqual([r.task for r in log.iter()], ["corrupt", "ok"])
+
+    def test_iter_without_validation_matches_validated_records(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "eventlog.jsonl"
+            write_event_records(log_path, [_record("a"), _record("b")])
+            log = EventLog(log_path)
+            self.assertEqual(list(log.iter(validate=False)), log.read_all())
+
+    def test_writer_flushes_on_batch_size_and_close(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "eventlog.jsonl"
+            writer = EventLogWriter(log_path, max_batch=3, flush_interval=None)
+            writer.append(_record("a"))
+            writer.append(_record("b"))
+            self.assertEqual(EventLog(log_path).read_all(), [])
+            writer.append(_record("c"))
+            self.assertEqual(len(EventLog(log_path).read_all()), 3)
+            writer.append(_record("d"))
+            writer.close()
+            self.assertEqual([r.task for r in EventLog(log_path).read_all()], ["a", "b", "c", "d"])
+            with self.assertRaises(ValueError):
+                writer.append(_record("e"))
+
+    def test_writer_flushes_on_interval(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "eventlog.jsonl"
+            with EventLogWriter(log_path, max_batch=100, flush_interval=0.05, durability="batch") as writer:
+                writer.append(_record())
+                deadline = time.monotonic() + 2.0
+                while not EventLog(log_path).read_all() and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                self.assertEqual(len(EventLog(log_path).read_all()), 1)
+
+    def test_writer_rejects_unknown_durability(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(ValueError):
+                EventLogWriter(Path(tmpdir) / "eventlog.jsonl", durability="sometimes")
+
+    def test_concurrent_processes_do_not_interleave_lines(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "eventlog.jsonl"
+            processes = [
+                multiprocessing.Process(target=_write_many, args=(str(log_path), f"p{idx}", 40)) for idx in range(3)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+            write_event_records(log_path, [_record("tail")])
+            records = EventLog(log_path).read_all()
+        self.assertEqual(len(records), 121)
+
 
 if __name__ == "__main__":
     unittest.main()
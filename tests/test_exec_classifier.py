@@ -1,6 +1,8 @@
+import tempfile
 import unittest
+from pathlib import Path
 
-from src.execution.classifier import classify_command
+from src.execution.classifier import classifier_cache_info, classify_command, clear_classifier_cache
 
 
 class TestExecClassifier(unittest.TestCase):
@@ -18,6 +20,24 @@ class TestExecClassifier(unittest.TestCase):
         self.assertEqual(classify_command("git reset --hard"), "destructive")
         self.assertEqual(classify_command("ls && rm -rf /tmp/test"), "destructive")
 
+    def test_repeated_commands_hit_the_cache(self) -> None:
+        clear_classifier_cache()
+        for _ in range(3):
+            self.assertEqual(classify_command("git status"), "read_only")
+        classify_command("  git status\n")
+        info = classifier_cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 3))
+
+    def test_redirect_targets_are_checked_on_every_call(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "out.txt"
+            command = f"echo hi > {target}"
+            self.assertEqual(classify_command(command), "write_non_destructive")
+            target.write_text("existing", encoding="utf-8")
+            self.assertEqual(classify_command(command), "destructive")
+        self.assertEqual(classify_command("echo hi >> notes.txt"), "destructive")
+        self.assertEqual(classify_command("curl https://example.com > out.html"), "network")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,7 +10,7 @@ class TestExecGateway(unittest.TestCase):
         self.assertEqual(result["status"], "blocked")
 
     def test_allows_read_only_command(self) -> None:
-        result = execute_command('python -c "print(1)"')
+        result = execute_command("ls")
         self.assertTrue(result["allowed"])
         self.assertEqual(result["exit_code"], 0)
 
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+from src.execution.pool import ShellWorkerPool
+
+
+@unittest.skipUnless(os.name == "posix", "ShellWorkerPool needs a POSIX shell")
+class TestShellWorkerPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = ShellWorkerPool(size=2)
+
+    def tearDown(self) -> None:
+        self.pool.close()
+
+    def test_delimits_output_and_exit_code(self) -> None:
+        command = 'python -c "import sys; print(1); sys.stderr.write(\'warn\'); sys.exit(3)"'
+        result = self.pool.execute(command, approval_token=f"APPROVE:{command}")
+        self.assertEqual(result["status"], "executed")
+        self.assertEqual(result["stdout"], "1\n")
+        self.assertEqual(result["stderr"], "warn")
+        self.assertEqual(result["exit_code"], 3)
+
+        no_newline = self.pool.execute("cat /dev/null")
+        self.assertEqual((no_newline["stdout"], no_newline["exit_code"]), ("", 0))
+
+    def test_commands_are_isolated_from_the_worker(self) -> None:
+        command = "cd / && echo \"it's $(pwd)\""
+        first = self.pool.execute(command, approval_token=f"APPROVE:{command}")
+        self.assertEqual(first["stdout"], "it's /\n")
+        unterminated = 'echo "oops'
+        broken = self.pool.execute(unterminated, approval_token=f"APPROVE:{unterminated}")
+        self.assertEqual(broken["status"], "executed")
+        self.assertNotEqual(broken["exit_code"], 0)
+        after = self.pool.execute("pwd", approval_token="APPROVE:pwd")
+        self.assertEqual(after["stdout"].strip(), os.getcwd())
+
+    def test_gating_matches_execute_command(self) -> None:
+        result = self.pool.execute("rm -rf /tmp/should-not-run")
+        self.assertEqual(result["status"], "blocked")
+        self.assertFalse(result["allowed"])
+
+    def test_timeout_replaces_worker(self) -> None:
+        command = "sleep 5"
+        result = self.pool.execute(command, approval_token=f"APPROVE:{command}", timeout=0.2)
+        self.assertEqual(result["status"], "timeout")
+        self.assertIsNone(result["exit_code"])
+        self.assertEqual(self.pool.execute("ls /")["status"], "executed")
+
+    def test_execute_many_runs_concurrently_in_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Each command prints when it started and finished; overlapping intervals prove concurrency.
+            stamp = 'python -c "import time; print(time.time())"'
+            commands = [f"{stamp} && sleep 0.3 && {stamp}" for _ in range(2)]
+            commands.append(f"ls {tmpdir}")
+            tokens = [f"APPROVE:{command}" for command in commands[:2]] + [None]
+            results = self.pool.execute_many(commands, approval_tokens=tokens)
+        self.assertEqual([result["exit_code"] for result in results], [0, 0, 0])
+        self.assertEqual(results[2]["stdout"], "")
+        (first_start, first_end), (second_start, second_end) = (
+            [float(value) for value in result["stdout"].split()] for result in results[:2]
+        )
+        self.assertLess(first_start, second_end)
+        self.assertLess(second_start, first_end)
+
+if __name__ == "__main__":
+    unittest.main()
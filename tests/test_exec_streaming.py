@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.execution.gateway import execute_command, stream_command
+from src.execution.streaming import CappedBuffer, ResourceLimits
+
+
+class TestCappedBuffer(unittest.TestCase):
+    def test_keeps_head_and_tail(self) -> None:
+        buffer = CappedBuffer(8)
+        for chunk in [b"abc", b"defgh", b"ijklmnop"]:
+            buffer.write(chunk)
+        self.assertEqual(buffer.stats(), {"total_bytes": 16, "kept_bytes": 8, "dropped_bytes": 8, "truncated": True})
+        self.assertEqual(buffer.text(), "abcd\n... [8 bytes truncated] ...\nmnop")
+
+    def test_small_output_is_untouched(self) -> None:
+        buffer = CappedBuffer(8, head_ratio=1.0)
+        buffer.write(b"short")
+        self.assertFalse(buffer.truncated)
+        self.assertEqual(buffer.text(), "short")
+
+
+@unittest.skipUnless(os.name == "posix", "streaming executor tests use a POSIX shell")
+class TestStreamCommand(unittest.TestCase):
+    def test_yields_chunks_and_reports_truncation(self) -> None:
+        command = "cat /dev/zero | head -c 200000"
+        stream = stream_command(command, approval_token=f"APPROVE:{command}", max_output_bytes=1000)
+        received = sum(len(chunk) for name, chunk in stream if name == "stdout")
+        result = stream.result
+        self.assertEqual(received, 200000)
+        self.assertEqual(result["status"], "executed")
+        self.assertEqual(result["exit_code"], 0)
+        self.assertEqual(result["truncation"]["stdout"]["dropped_bytes"], 199000)
+        self.assertIn("bytes truncated", result["stdout"])
+        self.assertFalse(result["truncation"]["stderr"]["truncated"])
+
+    def test_blocked_command_yields_nothing(self) -> None:
+        stream = stream_command("rm -rf /tmp/should-not-run")
+        self.assertEqual(list(stream), [])
+        self.assertEqual(stream.result["status"], "blocked")
+
+    def test_command_starts_only_when_iterated(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            marker = Path(tmpdir) / "ran"
+            command = f"touch {marker}"
+            with stream_command(command, approval_token=f"APPROVE:{command}") as stream:
+                pass
+            self.assertFalse(marker.exists())
+            self.assertEqual(list(stream), [])
+            self.assertIsNone(stream.result["exit_code"])
+
+    def test_closing_early_kills_command(self) -> None:
+        command = "echo start; sleep 5"
+        with stream_command(command, approval_token=f"APPROVE:{command}") as stream:
+            for name, chunk in stream:
+                break
+        self.assertEqual((name, chunk), ("stdout", b"start\n"))
+        self.assertEqual(stream.result["stdout"], "start\n")
+        self.assertLess(stream.result["duration"], 2.0)
+
+    def test_timeout_kills_command(self) -> None:
+        command = "sleep 5"
+        result = execute_command(command, approval_token=f"APPROVE:{command}", timeout=0.2, max_output_bytes=100)
+        self.assertEqual(result["status"], "timeout")
+        self.assertIsNone(result["exit_code"])
+        self.assertLess(result["duration"], 2.0)
+
+    def test_resource_limits_apply_in_child(self) -> None:
+        limited = execute_command("ulimit -n", approval_token="APPROVE:ulimit -n", limits=ResourceLimits(open_files=32))
+        self.assertEqual(limited["stdout"].strip(), "32")
+        default = execute_command("ulimit -n", approval_token="APPROVE:ulimit -n")
+        self.assertNotEqual(default["stdout"].strip(), "32")
+
+
+if __name__ == "__main__":
+    unittest.main()
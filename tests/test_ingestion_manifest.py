@@ -0,0 +1,145 @@
+import importlib.util
+import json
+import os
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from typing import List
+from unittest import mock
+
+_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "beast-integration"
+    / "role-system"
+    / "knowledge"
+    / "storage"
+    / "ingestion_manifest.py"
+)
+
+
+def _load_manifest_module() -> types.ModuleType:
+    """Load ingestion_manifest.py from its file, standing in for crewai when it is not installed."""
+    replaced = {}
+    try:
+        import crewai.utilities.chromadb  # noqa: F401
+    except ImportError:
+        chromadb_utils = types.SimpleNamespace(sanitize_collection_name=lambda name: name)
+        constants = types.SimpleNamespace(KNOWLEDGE_DIRECTORY="knowledge")
+        paths = types.SimpleNamespace(db_storage_path=tempfile.gettempdir)
+        replaced["crewai"] = types.SimpleNamespace()
+        replaced["crewai.utilities"] = types.SimpleNamespace(chromadb=chromadb_utils, constants=constants, paths=paths)
+        replaced["crewai.utilities.chromadb"] = chromadb_utils
+        replaced["crewai.utilities.constants"] = constants
+        replaced["crewai.utilities.paths"] = paths
+    spec = importlib.util.spec_from_file_location("role_system_ingestion_manifest", _PATH)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict("sys.modules", replaced):
+        spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+manifest_module = _load_manifest_module()
+
+
+class _Collection:
+    def __init__(self, documents: int) -> None:
+        self.documents = documents
+
+    def count(self) -> int:
+        return self.documents
+
+
+class _Storage:
+    def __init__(self, documents: int) -> None:
+        self.collection = _Collection(documents)
+        self.cleared = 0
+
+    def clear(self) -> int:
+        self.cleared += 1
+        return self.collection.documents
+
+
+class TestIngestionManifest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.root = Path(tmpdir.name)
+        self.manifest_path = self.root / "manifests" / "knowledge_docs.json"
+
+    def _file(self, name: str, text: str) -> Path:
+        path = self.root / name
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def _saved(self, files: List[Path]) -> "manifest_module.IngestionManifest":
+        manifest = manifest_module.IngestionManifest.load(self.manifest_path)
+        for path in files:
+            manifest.record(path, [manifest_module.chunk_id(path, path.read_text())])
+        manifest.save()
+        return manifest_module.IngestionManifest.load(self.manifest_path)
+
+    def test_load_reports_whether_a_manifest_existed(self) -> None:
+        self.assertFalse(manifest_module.IngestionManifest.load(self.manifest_path).existed)
+        self.assertTrue(self._saved([self._file("a.txt", "alpha")]).existed)
+        self.manifest_path.write_text(json.dumps({"version": 0, "files": {}}), encoding="utf-8")
+        self.assertFalse(manifest_module.IngestionManifest.load(self.manifest_path).existed)
+        self.manifest_path.write_text("{", encoding="utf-8")
+        self.assertFalse(manifest_module.IngestionManifest.load(self.manifest_path).existed)
+
+    def test_for_collection_uses_the_knowledge_directory(self) -> None:
+        with mock.patch.object(manifest_module, "db_storage_path", lambda: str(self.root)):
+            manifest = manifest_module.IngestionManifest.for_collection("docs")
+        self.assertEqual(manifest.path, self.root / "knowledge" / "manifests" / "knowledge_docs.json")
+
+    def test_is_current_tracks_content_not_timestamps(self) -> None:
+        path = self._file("a.txt", "alpha")
+        manifest = self._saved([path])
+        self.assertTrue(manifest.is_current(path))
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        self.assertTrue(manifest.is_current(path))
+        self.assertEqual(manifest.files[str(path.resolve())]["mtime"], path.stat().st_mtime)
+        path.write_text("omega", encoding="utf-8")
+        os.utime(path, (stat.st_atime, stat.st_mtime + 20))
+        self.assertFalse(manifest.is_current(path))
+        path.write_text("longer text", encoding="utf-8")
+        self.assertFalse(manifest.is_current(path))
+        self.assertFalse(manifest.is_current(self._file("new.txt", "new")))
+
+    def test_commit_returns_chunks_that_are_gone(self) -> None:
+        path = self._file("a.txt", "alpha")
+        manifest = manifest_module.IngestionManifest.load(self.manifest_path)
+        self.assertEqual(manifest.commit(path, ["c1", "c2", "c2"]), [])
+        self.assertEqual(manifest.chunk_ids(path), ["c1", "c2"])
+        self.assertEqual(manifest.commit(path, ["c2", "c3"]), ["c1"])
+        self.assertEqual(manifest.chunk_ids(path), ["c2", "c3"])
+
+    def test_prune_drops_files_not_seen_since_load(self) -> None:
+        kept = self._file("kept.txt", "kept")
+        gone = self._file("gone.txt", "gone")
+        manifest = self._saved([kept, gone])
+        manifest.is_current(kept)
+        self.assertEqual(manifest.prune(), [manifest_module.chunk_id(gone, "gone")])
+        self.assertEqual(list(manifest.files), [str(kept.resolve())])
+        self.assertEqual(manifest.prune(), [])
+
+    def test_chunk_ids_differ_between_files(self) -> None:
+        first, second = self._file("a.txt", "same"), self._file("b.txt", "same")
+        self.assertNotEqual(manifest_module.chunk_id(first, "same"), manifest_module.chunk_id(second, "same"))
+        self.assertEqual(manifest_module.chunk_id(first, "same"), manifest_module.chunk_id(first, "same"))
+
+    def test_clear_unmanaged_only_clears_filled_collections_without_a_manifest(self) -> None:
+        missing = manifest_module.IngestionManifest.load(self.manifest_path)
+        for documents, cleared in ((3, 1), (0, 0)):
+            with self.subTest(documents=documents):
+                storage = _Storage(documents)
+                self.assertEqual(manifest_module.clear_unmanaged(storage, missing), bool(cleared))
+                self.assertEqual(storage.cleared, cleared)
+        storage = _Storage(3)
+        self.assertFalse(manifest_module.clear_unmanaged(storage, self._saved([self._file("a.txt", "alpha")])))
+        self.assertEqual(storage.cleared, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
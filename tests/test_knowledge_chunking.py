@@ -0,0 +1,124 @@
+import importlib.util
+import random
+import unittest
+from pathlib import Path
+
+# Loaded from its file: the vendored role-system package needs the whole crew runtime to import.
+_PATH = Path(__file__).resolve().parents[1] / "beast-integration" / "role-system" / "knowledge" / "chunking.py"
+_spec = importlib.util.spec_from_file_location("role_system_chunking", _PATH)
+chunking = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(chunking)  # type: ignore[union-attr]
+
+count = chunking.approximate_token_count
+_WORDS = ["alpha", "beta", "gamma.", "delta,", "eps!", "zeta;", "#", "\n", "\n\n", "\n## Part\n", "\n# Top\n"]
+
+
+def _chunker(max_tokens: int) -> "chunking.StructuredChunker":
+    return chunking.StructuredChunker(max_tokens, count)
+
+
+class TestStructuredChunker(unittest.TestCase):
+    def test_headings_start_chunks_and_prefix_their_path(self) -> None:
+        text = "# Guide\nIntro text.\n\n## Install\nRun the installer.\n\n## Usage\nCall it.\n"
+        self.assertEqual(
+            _chunker(64).chunk_text(text),
+            ["Guide\nIntro text.", "Guide > Install\nRun the installer.", "Guide > Usage\nCall it."],
+        )
+
+    def test_prefers_paragraph_boundaries(self) -> None:
+        first = " ".join(["one"] * 10)
+        second = " ".join(["two"] * 8)
+        third = " ".join(["three"] * 8)
+        chunks = _chunker(20).chunk_text(f"{first}\n\n{second}\n{third}\n")
+        self.assertEqual(chunks, [first, f"{second}\n{third}"])
+
+    def test_rows_are_kept_whole(self) -> None:
+        rows = [f"sku{idx},part {idx},wh{idx % 3},{idx * 7}" for idx in range(40)]
+        chunks = _chunker(40).chunk_text("\n".join(rows))
+        self.assertEqual([line for chunk in chunks for line in chunk.split("\n")], rows)
+
+    def test_oversize_lines_split_at_sentences_then_words(self) -> None:
+        sentences = ["The first sentence is here.", "A second one follows it.", "And a third."]
+        self.assertEqual(_chunker(8).chunk_text(" ".join(sentences)), sentences)
+        self.assertEqual(_chunker(12).chunk_text(" ".join(sentences)), [" ".join(sentences[:2]), sentences[2]])
+        words = " ".join(f"w{idx}" for idx in range(30))
+        self.assertEqual(_chunker(10).chunk_text(words), [" ".join(f"w{i}" for i in range(s, s + 10)) for s in (0, 10, 20)])
+
+    def test_empty_sections_keep_their_heading(self) -> None:
+        self.assertEqual(_chunker(40).chunk_text("# A\n## B\n# C\ntext\n## D\n"), ["A > B", "C\ntext", "C > D"])
+
+    def test_streamed_pieces_match_whole_text(self) -> None:
+        text = "# Title\r\nfirst line\r\n\r\nsecond paragraph here.\nrow,1\nrow,2\n"
+        for size in (1, 2, 5, 100):
+            with self.subTest(size=size):
+                pieces = [text[i : i + size] for i in range(0, len(text), size)]
+                self.assertEqual(list(_chunker(16).chunk(pieces)), _chunker(16).chunk_text(text))
+
+    def test_property_budget_and_coverage(self) -> None:
+        rng = random.Random(7)
+        for _ in range(300):
+            text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(0, 300)))
+            max_tokens = rng.randint(8, 60)
+            with self.subTest(text=text, max_tokens=max_tokens):
+                chunks = _chunker(max_tokens).chunk_text(text)
+                self.assertTrue(all(count(chunk) <= max_tokens for chunk in chunks))
+                self.assertLessEqual(set(text.split()) - {"#", "##"}, set(" ".join(chunks).split()))
+
+    def test_counts_each_line_once(self) -> None:
+        counted = 0
+
+        def counting(text: str) -> int:
+            nonlocal counted
+            counted += len(text)
+            return count(text)
+
+        paragraph = "Lorem ipsum dolor sit amet. " * 20
+        for sections in (10, 100):
+            counted = 0
+            text = "".join(f"## Section {idx}\n{paragraph}\n\n{paragraph}\n\n" for idx in range(sections))
+            chunking.StructuredChunker(64, counting).chunk_text(text)
+            with self.subTest(sections=sections):
+                self.assertLessEqual(counted, 3 * len(text))
+
+    def test_iter_lines_joins_pieces(self) -> None:
+        text = "first\r\n" + "x" * 5000 + "\n\nlast"
+        for size in (1, 3, 10000):
+            with self.subTest(size=size):
+                pieces = [text[i : i + size] for i in range(0, len(text), size)]
+                self.assertEqual(list(chunking.iter_lines(pieces)), ["first", "x" * 5000, "", "last"])
+
+    def test_long_lines_are_read_in_bounded_parts(self) -> None:
+        longest = 0
+        counted = 0
+
+        def counting(text: str) -> int:
+            nonlocal longest, counted
+            longest = max(longest, len(text))
+            counted += len(text)
+            return count(text)
+
+        words = [f"w{idx}." if idx % 7 == 6 else f"w{idx}" for idx in range(20000)]
+        line = " ".join(words)
+        for pieces in ([line], list(line)):
+            longest = counted = 0
+            with self.subTest(pieces=len(pieces)):
+                chunks = list(chunking.StructuredChunker(8, counting).chunk(pieces))
+                self.assertLessEqual(longest, 64 * 8)
+                self.assertLessEqual(counted, 3 * len(line))
+                self.assertTrue(all(count(chunk) <= 8 for chunk in chunks))
+                self.assertEqual(" ".join(chunks).split(), words)
+        self.assertEqual(
+            list(chunking._line_parts(["aaaaaaa # b\n", "# c"], 8)),
+            [("aaaaaaa", False), (" # b", True), ("# c", False)],
+        )
+
+    def test_rejects_tiny_budgets(self) -> None:
+        with self.assertRaises(ValueError):
+            chunking.StructuredChunker(4, count)
+
+    def test_fixed_size_chunks(self) -> None:
+        self.assertEqual(chunking.fixed_size_chunks("abcdefghij", 4, 1), ["abcd", "defg", "ghij", "j"])
+
+
+if __name__ == "__main__":
+    unittest.main()
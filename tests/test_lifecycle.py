@@ -0,0 +1,151 @@
+import json
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta, timezone
+from io import StringIO
+from pathlib import Path
+
+from src.cli import main
+from src.contracts import MemoryBlock, TagSet
+from src.lifecycle import LifecyclePolicy, apply_lifecycle, episode_key, run_lifecycle
+from src.memory_adapter import FileSystemMemoryAdapter
+from src.segment_store import SegmentMemoryAdapter
+
+NOW = datetime(2026, 1, 10, tzinfo=timezone.utc)
+
+
+def _block(content: str, *, lane: str = "episodic", hours_ago: float = 1.0, **fields) -> MemoryBlock:
+    stamp = (NOW - timedelta(hours=hours_ago)).isoformat()
+    values = {
+        "tags": TagSet(schema_version="v0", tags={"intent": "build"}),
+        "provenance": {"source": "router"},
+        "confidence": 0.6,
+        "created_at": stamp,
+        "updated_at": stamp,
+    }
+    values.update(fields)
+    return MemoryBlock(content=content, lane=lane, **values)
+
+
+class TestApplyLifecycle(unittest.TestCase):
+    def test_expires_by_valid_until_and_episodic_ttl(self) -> None:
+        blocks = [
+            _block("old episode", hours_ago=48),
+            _block("old fact", lane="semantic", hours_ago=48),
+            _block("lapsed", lane="semantic", valid_until=(NOW - timedelta(hours=1)).isoformat()),
+            _block("fresh episode"),
+        ]
+        policy = LifecyclePolicy(episodic_ttl_hours=24)
+        kept = apply_lifecycle(blocks, policy, NOW)
+        self.assertEqual([block.content for block in kept], ["old fact", "fresh episode"])
+
+    def test_merges_duplicates_into_newest(self) -> None:
+        first = _block("SYNTHESIS: build it (retrieved 2 memories)", hours_ago=3, confidence=0.9)
+        other = _block("unrelated")
+        second = _block("synthesis:  build it (retrieved 5 memories)", hours_ago=2)
+        self.assertEqual(episode_key(first), episode_key(second))
+
+        kept = apply_lifecycle([first, other, second], LifecyclePolicy(), NOW)
+        self.assertEqual([block.id for block in kept], [other.id, second.id])
+        merged = kept[1]
+        self.assertEqual(merged.provenance["occurrences"], 2)
+        self.assertEqual(merged.provenance["merged_ids"], [first.id])
+        self.assertEqual(merged.confidence, 0.9)
+
+    def test_promotes_repeated_episodes(self) -> None:
+        episodes = [_block("deploy service", hours_ago=10 - idx) for idx in range(3)]
+        kept = apply_lifecycle(episodes, LifecyclePolicy(promote_after=3, procedural_after=5), NOW)
+        self.assertEqual(len(kept), 1)
+        promoted = kept[0]
+        self.assertEqual(promoted.lane, "semantic")
+        self.assertEqual(promoted.provenance["source"], "lifecycle")
+        self.assertEqual(sorted(promoted.provenance["promoted_from"]), sorted(block.id for block in episodes))
+
+        later = [promoted, *(_block("deploy service") for _ in range(2))]
+        kept = apply_lifecycle(later, LifecyclePolicy(promote_after=2, procedural_after=5), NOW)
+        self.assertEqual([(block.id, block.lane) for block in kept], [(promoted.id, "procedural")])
+        self.assertEqual(kept[0].provenance["occurrences"], 5)
+
+    def test_low_confidence_episodes_are_not_promoted(self) -> None:
+        episodes = [_block("flaky step", confidence=0.2) for _ in range(4)]
+        kept = apply_lifecycle(episodes, LifecyclePolicy(), NOW)
+        self.assertEqual([block.lane for block in kept], ["episodic"])
+
+
+class TestRunLifecycle(unittest.TestCase):
+    def _populate(self, adapter) -> None:
+        for idx in range(4):
+            adapter.write(_block("repeated task", hours_ago=5 - idx))
+        adapter.write(_block("stale", hours_ago=100))
+        adapter.write(_block("keep me", lane="semantic"))
+
+    def _check(self, adapter) -> None:
+        report = run_lifecycle(adapter, LifecyclePolicy(episodic_ttl_hours=24), now=NOW, read_samples=1)
+        self.assertEqual((report.blocks_before, report.blocks_after), (6, 2))
+        self.assertEqual((report.expired, report.merged, report.promoted), (1, 3, 1))
+        self.assertGreater(report.bytes_reclaimed, 0)
+        self.assertEqual(report.bytes_after, adapter.disk_usage())
+        self.assertIsNotNone(report.read_seconds_after)
+        lanes = sorted(block.lane for block in adapter.read(TagSet(schema_version="v0", tags={})))
+        self.assertEqual(lanes, ["semantic", "semantic"])
+
+    def test_filesystem_adapter(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = FileSystemMemoryAdapter(Path(tmpdir) / "memory.jsonl")
+            self._populate(adapter)
+            self._check(adapter)
+            self.assertEqual(sorted(path.name for path in Path(tmpdir).iterdir()), ["memory.jsonl", "memory.jsonl.lock"])
+
+    def test_writers_wait_while_exclusive(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "memory.jsonl"
+            adapter = FileSystemMemoryAdapter(path)
+            self._populate(adapter)
+            # A second adapter stands in for a writer in another process: it shares only the file lock.
+            other = FileSystemMemoryAdapter(path)
+            writer = threading.Thread(target=other.write, args=(_block("late write", lane="semantic"),))
+            with adapter.exclusive():
+                writer.start()
+                writer.join(timeout=0.2)
+                self.assertTrue(writer.is_alive())
+                adapter.replace(adapter.scan())
+            writer.join(timeout=5)
+            contents = [block.content for block in adapter.scan()]
+            self.assertEqual(contents[-1], "late write")
+            self.assertEqual(len(contents), 7)
+
+    def test_segment_adapter(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = SegmentMemoryAdapter(Path(tmpdir), segment_bytes=512)
+            self._populate(adapter)
+            self._check(adapter)
+            self.assertEqual(len(SegmentMemoryAdapter(Path(tmpdir))), 2)
+
+    def test_dry_run_leaves_store_untouched(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "memory.jsonl"
+            adapter = FileSystemMemoryAdapter(path)
+            self._populate(adapter)
+            before = path.read_bytes()
+            report = run_lifecycle(adapter, now=NOW, dry_run=True, read_samples=1)
+            self.assertEqual(report.blocks_after, 3)
+            self.assertIsNone(report.bytes_after)
+            self.assertEqual(path.read_bytes(), before)
+
+    def test_cli_reports_json(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = FileSystemMemoryAdapter(Path(tmpdir) / "memory.jsonl")
+            self._populate(adapter)
+            output = StringIO()
+            with redirect_stdout(output):
+                code = main(["lifecycle", tmpdir, "--print-json"])
+            self.assertEqual(code, 0)
+            report = json.loads(output.getvalue())
+            self.assertEqual(report["promoted"], 1)
+            self.assertFalse(report["dry_run"])
+
+
+if __name__ == "__main__":
+    unittest.main()
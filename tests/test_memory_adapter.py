@@ -32,6 +32,26 @@ class TestFileSystemMemoryAdapter(unittest.TestCase):
             self.assertEqual(len(results), 1)
             self.assertEqual(results[0].content, "match")
 
+    def test_io_counters_match_bytes_moved(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("memory.jsonl", "memory.bin"):
+                with self.subTest(store=name):
+                    adapter = FileSystemMemoryAdapter(Path(tmpdir) / name)
+                    for content in ("first", "second"):
+                        adapter.write(
+                            MemoryBlock(
+                                content=content,
+                                tags=TagSet(schema_version="v0", tags={"intent": "io"}),
+                                provenance={"source": "test"},
+                                lane="episodic",
+                                confidence=0.5,
+                            )
+                        )
+                    _, written = adapter.io_counters()
+                    self.assertEqual(written, adapter.path.stat().st_size)
+                    adapter.read(TagSet(schema_version="v0", tags={}))
+                    self.assertEqual(adapter.io_counters(), (written, written))
+
     def test_query_plan_limits_results(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             adapter = FileSystemMemoryAdapter(Path(tmpdir) / "memory.jsonl")
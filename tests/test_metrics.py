@@ -0,0 +1,74 @@
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from src.cli import main
+from src.cognition_loop import run_cognition_loop
+from src.metrics import StageTimer, percentile
+from src.orchestration.router import run_router
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.read = 0
+        self.written = 0
+
+    def io_counters(self):
+        return self.read, self.written
+
+
+class TestMetrics(unittest.TestCase):
+    def test_percentile_interpolates(self) -> None:
+        values = [4.0, 1.0, 3.0, 2.0, 5.0]
+        self.assertEqual(percentile(values, 50), 3.0)
+        self.assertAlmostEqual(percentile(values, 95), 4.8)
+        self.assertEqual(percentile([7.0], 99), 7.0)
+        with self.assertRaises(ValueError):
+            percentile([], 50)
+
+    def test_stage_timer_records_seconds_and_io_deltas(self) -> None:
+        counter = _Counter()
+        timer = StageTimer()
+        with timer.stage("memory_write", counter):
+            counter.written += 120
+        with timer.stage("synthesis"):
+            pass
+        stages = timer.to_dict()
+        self.assertEqual(stages["memory_write"]["bytes_written"], 120)
+        self.assertEqual(stages["synthesis"]["bytes_read"], 0)
+        self.assertAlmostEqual(timer.total, sum(entry["seconds"] for entry in stages.values()))
+
+    def test_router_and_loop_record_stages_and_latency(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage_dir = Path(tmpdir) / "run"
+            run_router("first", storage_dir, fake_backend=True)
+            event = run_router("second", storage_dir, fake_backend=True)
+            stages = event.provenance["stages"]
+            self.assertEqual(list(stages), ["tag_extraction", "memory_read", "synthesis", "memory_write"])
+            self.assertGreater(stages["memory_read"]["bytes_read"], 0)
+            self.assertGreater(stages["memory_write"]["bytes_written"], 0)
+            self.assertGreater(event.latency, 0.0)
+
+            record = run_cognition_loop("loop", Path(tmpdir) / "loop", fake_backend=True)
+            self.assertIn("memory_write", record.provenance["stages"])
+            self.assertGreater(record.latency, 0.0)
+
+    def test_stats_command_aggregates_runs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ["a", "b"]:
+                run_router(f"task {name}", Path(tmpdir) / name, fake_backend=True)
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                exit_code = main(["stats", "--storage", tmpdir, "--print-json"])
+            self.assertEqual(exit_code, 0)
+            summary = json.loads(stdout.getvalue())
+            self.assertEqual(summary["memory_read"]["count"], 2)
+            self.assertEqual(summary["total"]["count"], 2)
+            self.assertLessEqual(summary["total"]["p50"], summary["total"]["p99"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import json
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from src.agents import tagger_agent
+from src.model_backend import BackendError, BackendTimeout, BackendUnavailable, HttpModelBackend
+from src.orchestration.router import run_router
+
+
+class _StandInModel(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests: list = []
+    connections: set = set()
+    delay = 0.0
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server API
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).requests.append(body["tasks"])
+        type(self).connections.add(self.client_address)
+        if type(self).delay:
+            time.sleep(type(self).delay)
+        results = [
+            {"tags": {"intent": "remote", "task": task}, "uncertainty": {"intent": 0.1}} for task in body["tasks"]
+        ]
+        payload = json.dumps({"results": results, "cost": 0.01 * len(results)}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class _QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request: object, client_address: object) -> None:
+        pass  # clients that time out close the socket mid-response
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestHttpModelBackend(unittest.TestCase):
+    def setUp(self) -> None:
+        _StandInModel.requests = []
+        _StandInModel.connections = set()
+        _StandInModel.delay = 0.0
+        self.server = _QuietServer(("127.0.0.1", 0), _StandInModel)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.endpoint = f"http://127.0.0.1:{self.server.server_address[1]}/tags"
+
+    def tearDown(self) -> None:
+        tagger_agent.reset_tagger_services()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_reuses_keep_alive_connection_and_splits_cost(self) -> None:
+        backend = HttpModelBackend(self.endpoint, max_batch=2)
+        try:
+            results = backend.extract_many(["a", "b", "c"])
+            backend.extract_many(["d"])
+        finally:
+            backend.close()
+        self.assertEqual([r.payload["tags"]["task"] for r in results], ["a", "b", "c"])
+        self.assertEqual(_StandInModel.requests, [["a", "b"], ["c"], ["d"]])
+        self.assertEqual(len(_StandInModel.connections), 1)
+        self.assertAlmostEqual(results[0].cost, 0.01)
+        self.assertGreater(results[0].latency, 0.0)
+
+    def test_micro_batches_concurrent_submissions(self) -> None:
+        backend = HttpModelBackend(self.endpoint, batch_window=0.2, max_batch=8)
+        results: dict = {}
+        threads = [
+            threading.Thread(target=lambda task=task: results.__setitem__(task, backend.submit(task)))
+            for task in ["t1", "t2", "t3", "t4"]
+        ]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            backend.close()
+        self.assertEqual({task: r.payload["tags"]["task"] for task, r in results.items()}, {t: t for t in results})
+        self.assertLess(len(_StandInModel.requests), 4)
+
+    def test_close_resolves_queued_submissions(self) -> None:
+        backend = HttpModelBackend(self.endpoint, batch_window=0.2, max_batch=8)
+        outcomes: dict = {}
+
+        def submit(task: str) -> None:
+            try:
+                outcomes[task] = backend.submit(task).payload["tags"]["task"]
+            except BaseException as exc:  # noqa: BLE001 - recorded for the assertion below
+                outcomes[task] = type(exc)
+
+        threads = [threading.Thread(target=submit, args=(task,)) for task in ["t1", "t2", "t3"]]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        backend.close()
+        for thread in threads:
+            thread.join(timeout=5)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        for task, outcome in outcomes.items():
+            self.assertIn(outcome, {task, BackendUnavailable})
+        self.assertEqual(len(outcomes), 3)
+        with self.assertRaises(BackendError):
+            backend.submit("late")
+
+    def test_timeout_and_unavailable_failure_classes(self) -> None:
+        _StandInModel.delay = 0.5
+        backend = HttpModelBackend(self.endpoint, timeout=0.1)
+        with self.assertRaises(BackendTimeout) as timeout:
+            backend.extract_many(["slow"])
+        backend.close()
+        self.assertEqual(timeout.exception.failure_class, "timeout")
+
+        down = HttpModelBackend(f"http://127.0.0.1:{_free_port()}/tags", timeout=0.5)
+        with self.assertRaises(BackendUnavailable) as unavailable:
+            down.extract_many(["x"])
+        down.close()
+        self.assertEqual(unavailable.exception.failure_class, "backend_unavailable")
+
+    def test_router_records_backend_latency_cost_and_failures(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            event = run_router("remote task", Path(tmpdir) / "run", model_endpoint=self.endpoint)
+            self.assertEqual(event.outcome, "success")
+            self.assertEqual(event.tags.tags["intent"], "remote")
+            self.assertAlmostEqual(event.cost, 0.01)
+            self.assertEqual(event.tool_calls[0]["name"], "tagger")
+            self.assertGreater(event.tool_calls[0]["latency"], 0.0)
+
+            down = f"http://127.0.0.1:{_free_port()}/tags"
+            failed = run_router("remote task", Path(tmpdir) / "down", model_endpoint=down)
+            self.assertEqual(failed.outcome, "failure")
+            self.assertEqual(failed.failure_class, "backend_unavailable")
+
+
+if __name__ == "__main__":
+    unittest.main()
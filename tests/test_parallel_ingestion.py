@@ -0,0 +1,233 @@
+import copy
+import importlib.util
+import tempfile
+import threading
+import types
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+from unittest import mock
+
+from tests.test_ingestion_manifest import manifest_module
+
+_PATH = Path(__file__).resolve().parents[1] / "beast-integration" / "role-system" / "knowledge" / "ingestion.py"
+
+
+def _load_ingestion_module() -> types.ModuleType:
+    """Load ingestion.py from its file; the source and storage base classes are only used as annotations."""
+    replaced = {
+        "crewai.knowledge.source.base_knowledge_source": types.SimpleNamespace(BaseKnowledgeSource=object),
+        "crewai.knowledge.storage.ingestion_manifest": manifest_module,
+        "crewai.knowledge.storage.knowledge_storage": types.SimpleNamespace(KnowledgeStorage=object),
+    }
+    for name in ("crewai", "crewai.knowledge", "crewai.knowledge.source", "crewai.knowledge.storage"):
+        replaced[name] = types.SimpleNamespace()
+    spec = importlib.util.spec_from_file_location("role_system_ingestion", _PATH)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict("sys.modules", replaced):
+        spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+ingestion = _load_ingestion_module()
+
+
+class _Source:
+    """File source whose chunks are the lines of each file."""
+
+    def __init__(self, paths: Optional[List[Path]], parsed: List[Path], yielded: List[str]) -> None:
+        self.paths = paths
+        self.parsed = parsed
+        self.yielded = yielded
+        self.storage: Any = None
+        self.manifest: Any = None
+        self.on_parse = lambda path: None
+        self.added = False
+
+    def ingestion_paths(self) -> Optional[List[Path]]:
+        return self.paths
+
+    def add(self) -> None:
+        self.added = True
+
+    def model_copy(self, update: dict) -> "_Source":
+        clone = copy.copy(self)
+        clone.__dict__.update(update)
+        return clone
+
+    def _iter_text(self, path: Path) -> Iterator[str]:
+        self.parsed.append(path)
+        self.on_parse(path)
+        yield path.read_text(encoding="utf-8")
+
+    def _chunk_stream(self, pieces: Iterator[str]) -> Iterator[str]:
+        for piece in pieces:
+            for line in piece.splitlines():
+                self.yielded.append(line)
+                yield line
+
+
+class _Storage:
+    def __init__(self) -> None:
+        self.saves: List[List[str]] = []
+        self.deleted: List[str] = []
+        self.embedded: List[List[str]] = []
+        self.block = threading.Event()
+        self.block.set()
+        self.blocked_chunk: Optional[str] = None
+        self.saved_while_yielded: List[int] = []
+        self.source: Optional[_Source] = None
+
+    def embedder(self, chunks: List[str]) -> List[List[float]]:
+        if self.blocked_chunk in chunks:
+            self.block.wait(timeout=5)
+        self.embedded.append(list(chunks))
+        return [[float(len(chunk))] for chunk in chunks]
+
+    def save(self, chunks: List[str], ids: List[str], embeddings: List[List[float]]) -> None:
+        if self.source is not None:
+            self.saved_while_yielded.append(len(self.source.yielded) - sum(map(len, self.saves)))
+        self.saves.append(list(ids))
+        assert embeddings == [[float(len(chunk))] for chunk in chunks]
+
+    def delete(self, ids: List[str]) -> None:
+        self.deleted.extend(ids)
+
+
+class _BrokenPool:
+    """Process pool whose workers have all died."""
+
+    submitted = 0
+
+    def __init__(self, max_workers: int, mp_context: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_BrokenPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+    def submit(self, fn: Any, *args: Any) -> "Future[Any]":
+        _BrokenPool.submitted += 1
+        future: "Future[Any]" = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+
+class TestParallelIngestor(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.root = Path(tmpdir.name)
+        self.parsed: List[Path] = []
+        self.yielded: List[str] = []
+
+    def _files(self, count: int, lines: int = 3) -> List[Path]:
+        paths = []
+        for idx in range(count):
+            path = self.root / f"doc-{idx}.txt"
+            path.write_text("".join(f"file {idx} line {line}\n" for line in range(lines)), encoding="utf-8")
+            paths.append(path)
+        return paths
+
+    def _ids(self, path: Path) -> List[str]:
+        return [manifest_module.chunk_id(path, line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+    def _source(self, paths: Optional[List[Path]]) -> _Source:
+        return _Source(paths, self.parsed, self.yielded)
+
+    def test_files_are_saved_in_order_within_the_pending_window(self) -> None:
+        paths = self._files(6)
+        storage = _Storage()
+        storage.block.clear()
+        storage.blocked_chunk = "file 0 line 0"
+        source = self._source(paths)
+        parsed_at_first_save: List[int] = []
+        save = storage.save
+
+        def record_first_save(chunks: List[str], ids: List[str], embeddings: Any) -> None:
+            if not storage.saves:
+                parsed_at_first_save.append(len(self.parsed))
+            save(chunks, ids=ids, embeddings=embeddings)
+
+        def release_when_window_is_full(path: Path) -> None:
+            if len(self.parsed) == 3:
+                storage.block.set()
+
+        storage.save = record_first_save  # type: ignore[method-assign]
+        source.on_parse = release_when_window_is_full
+        report = ingestion.ParallelIngestor(storage, embed_workers=4, batch_size=2, max_pending_files=3).run([source])
+
+        self.assertEqual(parsed_at_first_save, [3])
+        self.assertEqual([chunk_id for batch in storage.saves for chunk_id in batch], sum(map(self._ids, paths), []))
+        self.assertEqual(max(map(len, storage.saves)), 2)
+        self.assertEqual((report.files_total, report.files_done, report.chunks), (6, 6, 18))
+
+    def test_broken_process_pool_falls_back_to_parsing_in_process(self) -> None:
+        paths = self._files(4)
+        storage = _Storage()
+        _BrokenPool.submitted = 0
+        with mock.patch.object(ingestion, "ProcessPoolExecutor", _BrokenPool):
+            report = ingestion.ParallelIngestor(storage, parse_workers=2, max_pending_files=2).run(
+                [self._source(paths)]
+            )
+        self.assertEqual(_BrokenPool.submitted, 2)
+        self.assertEqual(self.parsed, paths)
+        self.assertEqual([chunk_id for batch in storage.saves for chunk_id in batch], sum(map(self._ids, paths), []))
+        self.assertEqual(report.files_done, 4)
+
+    def test_large_files_stream_with_bounded_batches_in_flight(self) -> None:
+        path = self._files(1, lines=40)[0]
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write("file 0 line 0\n")
+        storage = _Storage()
+        source = self._source([path])
+        storage.source = source
+        report = ingestion.ParallelIngestor(storage, embed_workers=1, batch_size=3, stream_threshold=0).run([source])
+
+        self.assertEqual([chunk_id for batch in storage.saves for chunk_id in batch], self._ids(path)[:40])
+        self.assertLessEqual(max(storage.saved_while_yielded), (2 * 1 + 1) * 3)
+        self.assertEqual((report.files_done, report.chunks, report.bytes), (1, 40, path.stat().st_size))
+
+    def test_ids_are_deterministic_and_unchanged_files_are_skipped(self) -> None:
+        paths = self._files(3)
+        manifest_path = self.root / "manifest.json"
+        first = _Storage()
+        ingestion.ParallelIngestor(first, manifest_module.IngestionManifest.load(manifest_path)).run(
+            [self._source(paths)]
+        )
+        self.assertEqual(sorted(sum(first.saves, [])), sorted(sum(map(self._ids, paths), [])))
+
+        paths[0].write_text("file 0 line 0\nrewritten\n", encoding="utf-8")
+        paths[2].unlink()
+        second = _Storage()
+        report = ingestion.ParallelIngestor(second, manifest_module.IngestionManifest.load(manifest_path)).run(
+            [self._source(paths[:2])]
+        )
+        self.assertEqual(sum(second.saves, []), self._ids(paths[0]))
+        self.assertEqual(self._ids(paths[0])[0], first.saves[0][0])
+        gone = [manifest_module.chunk_id(paths[0], f"file 0 line {line}") for line in (1, 2)]
+        removed = [manifest_module.chunk_id(paths[2], f"file 2 line {line}") for line in range(3)]
+        self.assertEqual(sorted(second.deleted), sorted(gone + removed))
+        self.assertEqual((report.files_total, report.files_skipped, report.files_done), (2, 1, 1))
+
+    def test_progress_reports_every_file_and_serial_sources_are_added(self) -> None:
+        paths = self._files(3)
+        reports: List[dict] = []
+        serial = self._source(None)
+        report = ingestion.ParallelIngestor(_Storage(), progress=lambda r: reports.append(r.to_dict())).run(
+            [serial, self._source(paths)]
+        )
+        self.assertTrue(serial.added)
+        self.assertEqual([r["files_done"] for r in reports], [1, 2, 3])
+        self.assertEqual([r["chunks"] for r in reports], [3, 6, 9])
+        self.assertEqual(reports[-1]["bytes"], sum(path.stat().st_size for path in paths))
+        self.assertEqual(report.bytes, reports[-1]["bytes"])
+        self.assertGreater(report.chunks_per_second, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import importlib.util
+import tempfile
+import time
+import types
+import unittest
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest import mock
+
+_PATH = Path(__file__).resolve().parents[1] / "beast-integration" / "role-system" / "memory" / "storage" / "rag_storage.py"
+
+
+def _load_rag_storage_module() -> types.ModuleType:
+    """Load rag_storage.py from its file, standing in for chromadb and crewai when they are not installed."""
+    replaced = {}
+    try:
+        import chromadb.api  # noqa: F401
+    except ImportError:
+        api = types.SimpleNamespace(ClientAPI=object)
+        replaced["chromadb"] = types.SimpleNamespace(api=api)
+        replaced["chromadb.api"] = api
+    try:
+        import crewai.rag.storage.base_rag_storage  # noqa: F401
+    except ImportError:
+
+        class BaseRAGStorage:
+            def __init__(self, type, allow_reset=True, embedder_config=None, crew=None):
+                self.type = type
+                self.allow_reset = allow_reset
+                self.embedder_config = embedder_config
+                self.crew = crew
+
+        modules = {
+            "crewai.rag.storage.base_rag_storage": types.SimpleNamespace(BaseRAGStorage=BaseRAGStorage),
+            "crewai.rag.embeddings.cache": types.SimpleNamespace(
+                CachedEmbeddingFunction=None, embedder_namespace=None
+            ),
+            "crewai.rag.embeddings.configurator": types.SimpleNamespace(EmbeddingConfigurator=None),
+            "crewai.utilities.chromadb": types.SimpleNamespace(create_persistent_client=None),
+            "crewai.utilities.constants": types.SimpleNamespace(MAX_FILE_NAME_LENGTH=255),
+            "crewai.utilities.paths": types.SimpleNamespace(db_storage_path=tempfile.gettempdir),
+        }
+        for name in ("crewai", "crewai.rag", "crewai.rag.storage", "crewai.rag.embeddings", "crewai.utilities"):
+            replaced[name] = types.SimpleNamespace()
+        replaced.update(modules)
+    spec = importlib.util.spec_from_file_location("role_system_rag_storage", _PATH)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict("sys.modules", replaced):
+        spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+rag_storage = _load_rag_storage_module()
+
+
+class _Collection:
+    """Records ``add`` calls and answers queries with every stored document."""
+
+    def __init__(self) -> None:
+        self.adds: List[List[str]] = []
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.fail_batches = 0
+        self.rejected = set()
+
+    def add(self, documents, metadatas, ids) -> None:
+        if len(documents) > 1 and self.fail_batches:
+            self.fail_batches -= 1
+            raise RuntimeError("embedding backend unavailable")
+        if self.rejected.intersection(documents):
+            raise RuntimeError("rejected document")
+        self.adds.append(list(documents))
+        for document, metadata, item_id in zip(documents, metadatas, ids):
+            self.documents[item_id] = {"document": document, "metadata": metadata}
+
+    def query(self, query_texts, n_results):
+        items = list(self.documents.items())[:n_results]
+        return {
+            "ids": [[item_id for item_id, _ in items]],
+            "metadatas": [[item["metadata"] for _, item in items]],
+            "documents": [[item["document"] for _, item in items]],
+            "distances": [[1.0 for _ in items]],
+        }
+
+
+class TestRAGStorage(unittest.TestCase):
+    def _storage(self, **kwargs: Any) -> "rag_storage.RAGStorage":
+        collection = _Collection()
+
+        def initialize(storage: "rag_storage.RAGStorage") -> None:
+            storage.app = None
+            storage.collection = collection
+
+        with mock.patch.object(rag_storage.RAGStorage, "_initialize_app", initialize):
+            storage = rag_storage.RAGStorage("short_term", **kwargs)
+        self.addCleanup(storage.reset)
+        return storage
+
+    def test_saves_are_written_in_batches(self) -> None:
+        storage = self._storage(batch_size=3, flush_interval=0)
+        for idx in range(7):
+            storage.save(f"item-{idx}", {"idx": idx})
+        self.assertEqual(storage.collection.adds, [["item-0", "item-1", "item-2"], ["item-3", "item-4", "item-5"]])
+        self.assertEqual(storage.flush(), 1)
+        self.assertEqual(storage.collection.adds[-1], ["item-6"])
+        self.assertEqual(storage.flush(), 0)
+
+    def test_timer_flushes_pending_saves(self) -> None:
+        storage = self._storage(batch_size=100, flush_interval=0.05)
+        storage.save("late", {})
+        deadline = time.monotonic() + 2.0
+        while not storage.collection.adds and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(storage.collection.adds, [["late"]])
+
+    def test_search_sees_pending_saves(self) -> None:
+        storage = self._storage(batch_size=100, flush_interval=0)
+        storage.save("remember me", {"agent": "a"})
+        results = storage.search("remember", score_threshold=0.0)
+        self.assertEqual([(r["context"], r["metadata"]) for r in results], [("remember me", {"agent": "a"})])
+
+    def test_failed_batches_retry_then_fall_back_to_single_adds(self) -> None:
+        storage = self._storage(batch_size=100, flush_interval=0)
+        collection = storage.collection
+        collection.fail_batches = rag_storage.MAX_FLUSH_RETRIES
+        collection.rejected = {"bad"}
+        for text in ("a", "bad", "b"):
+            storage.save(text, {})
+        with self.assertLogs(level="ERROR") as logs:
+            for _ in range(rag_storage.MAX_FLUSH_RETRIES - 1):
+                self.assertEqual(storage.flush(), 0)
+            self.assertEqual(storage.flush(), 2)
+        self.assertEqual(collection.adds, [["a"], ["b"]])
+        self.assertTrue(any("Dropping short_term memory item" in line for line in logs.output))
+        self.assertEqual(storage.flush(), 0)
+
+    def test_successful_flush_resets_the_retry_count(self) -> None:
+        storage = self._storage(batch_size=100, flush_interval=0)
+        collection = storage.collection
+        collection.fail_batches = 1
+        storage.save("a", {})
+        storage.save("b", {})
+        with self.assertLogs(level="ERROR"):
+            self.assertEqual(storage.flush(), 0)
+        self.assertEqual(storage.flush(), 2)
+        collection.fail_batches = rag_storage.MAX_FLUSH_RETRIES - 1
+        storage.save("c", {})
+        storage.save("d", {})
+        with self.assertLogs(level="ERROR"):
+            for _ in range(rag_storage.MAX_FLUSH_RETRIES - 1):
+                self.assertEqual(storage.flush(), 0)
+        self.assertEqual(storage.flush(), 2)
+        self.assertEqual(collection.adds, [["a", "b"], ["c", "d"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
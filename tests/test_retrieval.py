@@ -0,0 +1,103 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from src.contracts import MemoryBlock, QueryPlan, TagSet
+from src.memory_adapter import FileSystemMemoryAdapter
+from src.retrieval import ScoringWeights, rank_blocks
+
+NOW = datetime(2026, 1, 10, tzinfo=timezone.utc)
+
+
+def _block(
+    content: str,
+    tags: dict,
+    *,
+    age_hours: float = 0.0,
+    source: str = "test",
+    lane: str = "episodic",
+    confidence: float = 0.5,
+    valid_until: str | None = None,
+) -> MemoryBlock:
+    created = (NOW - timedelta(hours=age_hours)).isoformat()
+    return MemoryBlock(
+        content=content,
+        tags=TagSet(schema_version="v0", tags=tags),
+        provenance={"source": source},
+        lane=lane,
+        confidence=confidence,
+        created_at=created,
+        updated_at=created,
+        valid_until=valid_until,
+    )
+
+
+def _plan(limits: int, **kwargs) -> QueryPlan:
+    return QueryPlan(filters={}, limits=limits, recency_bias=kwargs.pop("recency_bias", 0.0), **kwargs)
+
+
+class TestRankBlocks(unittest.TestCase):
+    def test_prefers_tag_overlap_then_freshness(self) -> None:
+        query = TagSet(schema_version="v0", tags={"intent": "a", "domain": "b"})
+        blocks = [
+            _block("old-full", {"intent": "a", "domain": "b"}, age_hours=240),
+            _block("new-partial", {"intent": "a"}, age_hours=0),
+            _block("mid-full", {"intent": "a", "domain": "b"}, age_hours=48),
+        ]
+        relevance_only = rank_blocks(blocks, query, _plan(2), now=NOW)
+        self.assertEqual([b.content for b in relevance_only], ["mid-full", "old-full"])
+
+        fresh = rank_blocks(
+            blocks, query, _plan(2, scoring_knobs={"relevance": 0.2, "freshness": 0.8}), now=NOW
+        )
+        self.assertEqual([b.content for b in fresh], ["new-partial", "mid-full"])
+
+    def test_skips_expired_and_weighs_lane_and_confidence(self) -> None:
+        query = TagSet(schema_version="v0", tags={})
+        expired = (NOW - timedelta(hours=1)).isoformat()
+        blocks = [
+            _block("expired", {}, confidence=1.0, lane="procedural", valid_until=expired),
+            _block("episodic", {}, confidence=0.5),
+            _block("procedural", {}, confidence=0.5, lane="procedural"),
+            _block("confident", {}, confidence=1.0),
+        ]
+        ranked = rank_blocks(blocks, query, _plan(10), now=NOW)
+        self.assertEqual([b.content for b in ranked], ["confident", "procedural", "episodic"])
+
+    def test_unique_sources_penalizes_repeated_sources(self) -> None:
+        query = TagSet(schema_version="v0", tags={})
+        blocks = [_block(f"router-{idx}", {}, source="router", confidence=0.9) for idx in range(5)]
+        blocks.append(_block("loop", {}, source="cognition_loop", confidence=0.5))
+
+        plain = rank_blocks(blocks, query, _plan(2), now=NOW)
+        self.assertEqual([b.content for b in plain], ["router-4", "router-3"])
+
+        diverse = rank_blocks(blocks, query, _plan(3, diversity_rules=["unique_sources"]), now=NOW)
+        self.assertEqual([b.content for b in diverse], ["router-4", "loop", "router-3"])
+
+    def test_rejects_diversity_penalty_outside_unit_interval(self) -> None:
+        for penalty in (0.0, -0.5, 1.5, float("nan")):
+            with self.subTest(penalty=penalty):
+                with self.assertRaises(ValueError):
+                    ScoringWeights.from_plan(_plan(3, scoring_knobs={"diversity_penalty": penalty}))
+        self.assertEqual(ScoringWeights(diversity_penalty=1.0).diversity_penalty, 1.0)
+
+    def test_unique_content_drops_duplicates(self) -> None:
+        query = TagSet(schema_version="v0", tags={})
+        blocks = [_block("same", {}), _block("same", {}), _block("other", {})]
+        ranked = rank_blocks(blocks, query, _plan(3, diversity_rules=["unique_content"]), now=NOW)
+        self.assertEqual([b.content for b in ranked], ["other", "same"])
+
+    def test_adapter_returns_best_rather_than_oldest(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = FileSystemMemoryAdapter(Path(tmpdir) / "memory.jsonl")
+            adapter.write(_block("partial", {"intent": "a"}))
+            adapter.write(_block("full", {"intent": "a", "domain": "b"}))
+            query = TagSet(schema_version="v0", tags={"intent": "a", "domain": "b"})
+            results = adapter.read(query, query_plan=_plan(1))
+            self.assertEqual([b.content for b in results], ["full"])
+
+
+if __name__ == "__main__":
+    unittest.main()
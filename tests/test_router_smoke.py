@@ -1,8 +1,12 @@
+import json
 import tempfile
 import unittest
 from pathlib import Path
 
-from src.orchestration.router import run_router
+from src.contracts import MemoryBlock, TagSet
+from src.memory_adapter import FileSystemMemoryAdapter
+from src.orchestration.router import open_memory, run_router
+from src.segment_store import SegmentMemoryAdapter, migrate_jsonl_store
 
 
 class TestRouterSmoke(unittest.TestCase):
@@ -16,6 +20,81 @@ class TestRouterSmoke(unittest.TestCase):
             self.assertTrue((storage_dir / "eventlog.jsonl").exists())
             self.assertTrue((storage_dir / "memory.jsonl").exists())
 
+    def test_text_index_matches_memory_by_content(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage_dir = Path(tmpdir) / "run"
+            storage_dir.mkdir()
+            # Its tags share nothing with the fake tagger's, so only a text match can retrieve it.
+            seeded = MemoryBlock(
+                content="postgres connection pool tuning notes",
+                tags=TagSet(schema_version="v0", tags={"topic": "databases"}),
+                provenance={"source": "test"},
+                lane="semantic",
+                confidence=0.9,
+            )
+            FileSystemMemoryAdapter(storage_dir / "memory.jsonl").write(seeded)
+            task = "tune the postgres connection pool"
+
+            plain = run_router(task, storage_dir, fake_backend=True)
+            indexed = run_router(task, storage_dir, fake_backend=True, text_index=True)
+
+            self.assertNotIn(seeded.id, plain.retrieved_ids)
+            self.assertIn(seeded.id, indexed.retrieved_ids)
+
+
+    def test_text_index_uses_run_synonyms(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage_dir = Path(tmpdir) / "run"
+            storage_dir.mkdir()
+            seeded = MemoryBlock(
+                content="postgres vacuum schedule",
+                tags=TagSet(schema_version="v0", tags={"topic": "databases"}),
+                provenance={"source": "test"},
+                lane="semantic",
+                confidence=0.9,
+            )
+            FileSystemMemoryAdapter(storage_dir / "memory.jsonl").write(seeded)
+            task = "plan database maintenance"
+
+            without = run_router(task, storage_dir, fake_backend=True, text_index=True)
+            (storage_dir / "synonyms.json").write_text(json.dumps({"database": ["postgres"]}))
+            adapter = open_memory(storage_dir, text_index=True)
+            self.assertIsNotNone(adapter.text_index.dense)
+            self.assertIn("postgres", adapter.text_index.synonyms["database"])
+            with_synonyms = run_router(task, storage_dir, fake_backend=True, text_index=True)
+
+            self.assertNotIn(seeded.id, without.retrieved_ids)
+            self.assertIn(seeded.id, with_synonyms.retrieved_ids)
+
+    def test_migrated_run_reads_only_matching_blocks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bytes_read = {}
+            for name in ("jsonl", "segments"):
+                storage_dir = Path(tmpdir) / name
+                storage_dir.mkdir()
+                seed = FileSystemMemoryAdapter(storage_dir / "memory.jsonl")
+                for idx in range(50):
+                    seed.write(
+                        MemoryBlock(
+                            content=f"unrelated note {idx}",
+                            tags=TagSet(schema_version="v0", tags={"topic": f"other-{idx}"}),
+                            provenance={"source": "test"},
+                            lane="semantic",
+                            confidence=0.5,
+                        )
+                    )
+                if name == "segments":
+                    migrate_jsonl_store(storage_dir / "memory.jsonl", storage_dir / "memory")
+                    self.assertIsInstance(open_memory(storage_dir), SegmentMemoryAdapter)
+                first = run_router("hello router", storage_dir, fake_backend=True)
+                second = run_router("hello router", storage_dir, fake_backend=True)
+                self.assertEqual(first.retrieved_ids, [])
+                self.assertEqual(len(second.retrieved_ids), 1)
+                bytes_read[name] = second.provenance["stages"]["memory_read"]["bytes_read"]
+
+            self.assertGreater(bytes_read["segments"], 0)
+            self.assertLess(bytes_read["segments"] * 10, bytes_read["jsonl"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,78 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.contracts import MemoryBlock, QueryPlan, TagSet
+from src.segment_store import SegmentMemoryAdapter, migrate_jsonl_store
+
+
+def _block(content: str, tags: dict) -> MemoryBlock:
+    return MemoryBlock(
+        content=content,
+        tags=TagSet(schema_version="v0", tags=tags),
+        provenance={"source": "test"},
+        lane="episodic",
+        confidence=0.5,
+    )
+
+
+class TestSegmentMemoryAdapter(unittest.TestCase):
+    def test_read_filters_by_tags_in_write_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = SegmentMemoryAdapter(Path(tmpdir), segment_bytes=512)
+            for idx in range(6):
+                adapter.write(_block(f"entry-{idx}", {"intent": "even" if idx % 2 == 0 else "odd"}))
+
+            results = adapter.read(TagSet(schema_version="v0", tags={"intent": "even"}))
+            self.assertEqual([block.content for block in results], ["entry-0", "entry-2", "entry-4"])
+            self.assertGreater(len(list(Path(tmpdir).glob("segment-*.jsonl"))), 1)
+
+            plan = QueryPlan(filters={}, limits=2, recency_bias=0.0)
+            limited = adapter.read(TagSet(schema_version="v0", tags={}), query_plan=plan)
+            self.assertEqual([block.content for block in limited], ["entry-5", "entry-4"])
+
+    def test_index_survives_reopen_and_recovers_unindexed_tail(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = SegmentMemoryAdapter(Path(tmpdir))
+            adapter.write(_block("indexed", {"intent": "match"}))
+            orphan = _block("orphan", {"intent": "match"})
+            segment = next(Path(tmpdir).glob("segment-*.jsonl"))
+            with segment.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(orphan.to_dict()) + "\n")
+
+            reopened = SegmentMemoryAdapter(Path(tmpdir))
+            results = reopened.read(TagSet(schema_version="v0", tags={"intent": "match"}))
+            self.assertEqual([block.content for block in results], ["indexed", "orphan"])
+
+    def test_compact_drops_superseded_blocks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = SegmentMemoryAdapter(Path(tmpdir))
+            block = _block("first", {"intent": "old"})
+            adapter.write(block)
+            block.content = "second"
+            block.tags = TagSet(schema_version="v0", tags={"intent": "new"})
+            adapter.write(block)
+
+            reclaimed = adapter.compact()
+            self.assertGreater(reclaimed, 0)
+            self.assertEqual(adapter.read(TagSet(schema_version="v0", tags={"intent": "old"})), [])
+            reopened = SegmentMemoryAdapter(Path(tmpdir))
+            results = reopened.read(TagSet(schema_version="v0", tags={"intent": "new"}))
+            self.assertEqual([item.content for item in results], ["second"])
+
+    def test_migrate_jsonl_store(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "memory.jsonl"
+            with source.open("w", encoding="utf-8") as handle:
+                for idx in range(3):
+                    handle.write(json.dumps(_block(f"entry-{idx}", {"idx": idx}).to_dict()) + "\n")
+
+            adapter = migrate_jsonl_store(source, Path(tmpdir) / "store")
+            self.assertEqual(len(adapter), 3)
+            results = adapter.read(TagSet(schema_version="v0", tags={"idx": 1}))
+            self.assertEqual([block.content for block in results], ["entry-1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.contracts import EventRecord, MemoryBlock, QueryPlan, TagSet
+from src.eventlog import EventLog, EventLogWriter
+from src.memory_adapter import FileSystemMemoryAdapter
+from src.serialization import BinaryCodec, JsonLinesCodec, convert_store, detect_codec, get_codec
+
+
+def _record(task: str) -> EventRecord:
+    return EventRecord(
+        task=task,
+        tags=TagSet(schema_version="v0", tags={"intent": "codec"}),
+        query_plan=QueryPlan(filters={}, limits=0, recency_bias=0.0),
+        retrieved_ids=[],
+        actions=["event_log"],
+        tool_calls=[],
+        validations=["contracts_v0"],
+        outcome="success",
+        provenance={"source": "unit_test"},
+    )
+
+
+class TestSerialization(unittest.TestCase):
+    def test_get_codec_specs(self) -> None:
+        self.assertIsInstance(get_codec("jsonl"), JsonLinesCodec)
+        self.assertEqual(get_codec("binary+zlib").spec, "binary+zlib")
+        with self.assertRaises(ValueError):
+            get_codec("xml")
+
+    def test_binary_eventlog_roundtrip_forward_and_reverse(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "eventlog.jsonl"
+            log = EventLog(log_path, codec=BinaryCodec("zlib"))
+            log.append(_record("single"))
+            with EventLogWriter(log_path, max_batch=4, flush_interval=None) as writer:
+                writer.extend(_record(f"batch-{idx}") for idx in range(6))
+
+            self.assertEqual(detect_codec(log_path).spec, "binary+zlib")
+            reopened = EventLog(log_path)
+            tasks = [record.task for record in reopened.read_all()]
+            self.assertEqual(tasks, ["single"] + [f"batch-{idx}" for idx in range(6)])
+            self.assertEqual([record.task for record in reopened.read_last(3)], ["batch-3", "batch-4", "batch-5"])
+            with self.assertRaises(ValueError):
+                EventLog(log_path, codec=JsonLinesCodec())
+
+    def test_reverse_reads_skip_a_torn_trailing_frame(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "eventlog.bin"
+            log = EventLog(log_path, codec=BinaryCodec())
+            log.append(_record("first"))
+            log.append(_record("second"))
+            intact = log_path.read_bytes()
+            frame = BinaryCodec().encode([_record("torn").to_dict()])
+            for cut in (3, len(frame) // 2, len(frame) - 1):
+                with self.subTest(cut=cut):
+                    log_path.write_bytes(intact + frame[:cut])
+                    self.assertEqual([r.task for r in log.read_all()], ["first", "second"])
+                    self.assertEqual([r.task for r in log.read_last(5)], ["first", "second"])
+
+    def test_memory_adapter_binary_codec(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = FileSystemMemoryAdapter(Path(tmpdir) / "memory.jsonl", codec=BinaryCodec())
+            adapter.write(
+                MemoryBlock(
+                    content="binary",
+                    tags=TagSet(schema_version="v0", tags={"intent": "match"}),
+                    provenance={"source": "test"},
+                    lane="episodic",
+                    confidence=0.5,
+                )
+            )
+            results = FileSystemMemoryAdapter(adapter.path).read(TagSet(schema_version="v0", tags={"intent": "match"}))
+            self.assertEqual([block.content for block in results], ["binary"])
+
+    def test_convert_store_in_place_both_ways(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "eventlog.jsonl"
+            log = EventLog(log_path)
+            for idx in range(5):
+                log.append(_record(f"task-{idx}"))
+
+            self.assertEqual(convert_store(log_path, log_path, get_codec("binary+zlib")), 5)
+            self.assertEqual(detect_codec(log_path).spec, "binary+zlib")
+            self.assertEqual(len(EventLog(log_path).read_all()), 5)
+
+            self.assertEqual(convert_store(log_path, log_path, JsonLinesCodec()), 5)
+            self.assertEqual(detect_codec(log_path).spec, "jsonl")
+            self.assertEqual([r.task for r in EventLog(log_path).read_last(1)], ["task-4"])
+
+
+    def test_convert_store_keeps_source_permissions(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "eventlog.jsonl"
+            EventLog(source).append(_record("task"))
+            source.chmod(0o640)
+            existing = Path(tmpdir) / "existing.bin"
+            existing.write_bytes(b"")
+            existing.chmod(0o600)
+
+            for target in (Path(tmpdir) / "new.bin", existing):
+                with self.subTest(target=target.name):
+                    convert_store(source, target, BinaryCodec())
+                    self.assertEqual(stat.S_IMODE(target.stat().st_mode), 0o640)
+
+
+if __name__ == "__main__":
+    unittest.main()
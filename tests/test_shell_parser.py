@@ -0,0 +1,89 @@
+import random
+import shlex
+import unittest
+
+from src.execution.classifier import classify_command
+from src.execution.shell_parser import ShellSyntaxError, parse, split_commands
+
+_WORDS = ["ls", "-la", "src", "cat", "notes.txt", "git", "status", "grep", "-n", "TODO", "a&&b", "x;y", "p|q", "$HOME"]
+_OPERATORS = [" && ", " || ", " ; ", " | ", " & ", "\n", ";", "|", "&&"]
+_ALPHABET = "ab $()`'\"\\;&|<>#{}\n\t-=*"
+_CLASSES = {"read_only", "write_non_destructive", "destructive", "network"}
+
+
+class TestShellParser(unittest.TestCase):
+    def test_boundaries(self) -> None:
+        self.assertEqual(split_commands("ls && rm x || echo y; pwd & wait"), ["ls", "rm x", "echo y", "pwd", "wait"])
+        self.assertEqual([c.words for c in parse("(cd /tmp && ls) | sort")], [["cd", "/tmp"], ["ls"], ["sort"]])
+        self.assertEqual([c.words for c in parse('echo "$(rm -rf x)" `id`')][:2], [["rm", "-rf", "x"], ["id"]])
+        self.assertEqual([c.words for c in parse("cat <<'EOF'\nrm -rf /\nEOF\nls")], [["cat"], ["ls"]])
+        self.assertEqual([c.words for c in parse("if test -f a; then cat a; fi")], [["test", "-f", "a"], ["cat", "a"]])
+
+    def test_redirects(self) -> None:
+        (command,) = parse("cmd 2>&1 >out.txt >>log <in")
+        self.assertEqual(
+            [(r.op, r.target, r.fd) for r in command.redirects],
+            [(">&", "1", 2), (">", "out.txt", None), (">>", "log", None), ("<", "in", None)],
+        )
+        self.assertTrue(parse("cat <<EOF\n$(rm x)\nEOF")[0].opaque)
+
+    def test_syntax_errors(self) -> None:
+        for command in ["echo 'open", 'echo "open', "echo $(ls", "ls )", "echo `ls", "ls >"]:
+            with self.subTest(command=command), self.assertRaises(ShellSyntaxError):
+                parse(command)
+
+    def test_property_operators_split_and_quoting_preserves_words(self) -> None:
+        rng = random.Random(1234)
+        for _ in range(500):
+            commands = [[rng.choice(_WORDS) for _ in range(rng.randint(1, 4))] for _ in range(rng.randint(1, 5))]
+            source = ""
+            for idx, words in enumerate(commands):
+                if idx:
+                    source += rng.choice(_OPERATORS)
+                source += " ".join(shlex.quote(word) for word in words)
+            with self.subTest(source=source):
+                self.assertEqual([command.words for command in parse(source)], commands)
+
+    def test_fuzz_never_crashes_and_classifier_stays_total(self) -> None:
+        rng = random.Random(99)
+        for _ in range(2000):
+            source = "".join(rng.choice(_ALPHABET) for _ in range(rng.randint(0, 40)))
+            with self.subTest(source=source):
+                try:
+                    parse(source)
+                except ShellSyntaxError:
+                    pass
+                self.assertIn(classify_command(source), _CLASSES)
+        with self.assertRaises(ShellSyntaxError):
+            parse("$(" * 5000)
+
+    def test_classifier_sees_hidden_commands(self) -> None:
+        self.assertEqual(classify_command("python -m unittest discover 2>&1"), "read_only")
+        self.assertEqual(classify_command("ls || rm -rf /tmp/x"), "destructive")
+        self.assertEqual(classify_command("ls\nrm -rf /tmp/x"), "destructive")
+        self.assertEqual(classify_command("cat $(curl https://example.com)"), "network")
+        self.assertEqual(classify_command("ls 2>/dev/null"), "read_only")
+        self.assertEqual(classify_command("git status 2>&1 | cat"), "read_only")
+
+    def test_inline_interpreter_code_needs_approval(self) -> None:
+        for command in (
+            'python -c "import shutil; shutil.rmtree(\'/x\')"',
+            "python3 -c 'import os; os.remove(\"f\")'",
+            'python -c "print(1)"',
+        ):
+            with self.subTest(command=command):
+                self.assertEqual(classify_command(command), "destructive")
+
+    def test_substitutions_inside_expansions(self) -> None:
+        self.assertEqual([c.words for c in parse("cat ${x:-$(rm -rf ~)}")], [["rm", "-rf", "~"], ["cat", "${x:-$(rm -rf ~)}"]])
+        self.assertEqual(classify_command("cat ${x:-$(rm -rf ~)}"), "destructive")
+        self.assertEqual(classify_command('cat "${x:-$(rm -rf ~)}"'), "destructive")
+        self.assertEqual(classify_command("cat ${x:-`rm -rf ~`}"), "destructive")
+        self.assertEqual(classify_command("cat ${a:-${b:-$(rm x)}}"), "destructive")
+        self.assertEqual(classify_command("ls $(( $(curl http://e) ))"), "network")
+        self.assertEqual(classify_command('ls "$(( $(curl http://e) ))"'), "network")
+        self.assertEqual(classify_command("ls ${HOME} $((1 + 2))"), "read_only")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import time
+import unittest
+from unittest import mock
+
+from src.agents import tagger_agent
+from src.tagger import Tagger, TaggerService
+
+
+class TestTaggerService(unittest.TestCase):
+    def test_cache_hits_on_normalized_text(self) -> None:
+        service = TaggerService(Tagger(fake_backend=True))
+        first = service.extract_tags("fix  the bug")
+        second = service.extract_tags(" fix the bug ")
+        self.assertEqual(first, second)
+        self.assertEqual(first.tags["task_length"], len("fix the bug"))
+        self.assertEqual(service.stats()["hits"], 1)
+        self.assertEqual(service.stats()["misses"], 1)
+
+        second.tags["intent"] = "mutated"
+        self.assertEqual(service.extract_tags("fix the bug").tags["intent"], "fake")
+
+    def test_lru_eviction_and_ttl_expiry(self) -> None:
+        service = TaggerService(Tagger(fake_backend=True), maxsize=2, ttl=None)
+        for task in ["a", "b", "a", "c", "b"]:
+            service.extract_tags(task)
+        stats = service.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 4, 2))
+
+        expiring = TaggerService(Tagger(fake_backend=True), ttl=0.01)
+        expiring.extract_tags("a")
+        time.sleep(0.02)
+        expiring.extract_tags("a")
+        self.assertEqual(expiring.stats()["misses"], 2)
+
+    def test_extract_tags_many_dedupes_misses(self) -> None:
+        tagger = Tagger(fake_backend=True)
+        service = TaggerService(tagger)
+        service.extract_tags("cached")
+        with mock.patch.object(tagger, "extract", wraps=tagger.extract) as batch:
+            results = service.extract_tags_many(["cached", "new", "new ", "other"])
+        batch.assert_called_once_with(["new", "other"])
+        self.assertEqual([tags.tags["task_prefix"] for tags in results], ["cached", "new", "new", "other"])
+
+
+class TestTaggerAgent(unittest.TestCase):
+    def tearDown(self) -> None:
+        tagger_agent.reset_tagger_services()
+
+    def test_service_is_shared_per_configuration(self) -> None:
+        service = tagger_agent.get_tagger_service(fake_backend=True)
+        self.assertIs(tagger_agent.get_tagger_service(fake_backend=True), service)
+        tagger_agent.extract_tags("shared", fake_backend=True)
+        tagger_agent.extract_tags("shared", fake_backend=True)
+        self.assertEqual(service.stats()["hits"], 1)
+
+    def test_explicit_endpoint_does_not_require_environment(self) -> None:
+        with mock.patch.dict("os.environ", {}, clear=True):
+            service = tagger_agent.get_tagger_service(model_endpoint="http://127.0.0.1:9")
+        self.assertEqual(service.model_endpoint, "http://127.0.0.1:9")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.contracts import MemoryBlock, QueryPlan, TagSet
+from src.memory_adapter import FileSystemMemoryAdapter
+from src.text_index import BM25Index, HashingEmbedder, HybridIndex
+
+
+def _block(content: str, tags: dict) -> MemoryBlock:
+    return MemoryBlock(
+        content=content,
+        tags=TagSet(schema_version="v0", tags=tags),
+        provenance={"source": "test"},
+        lane="episodic",
+        confidence=0.5,
+    )
+
+
+class TestTextIndex(unittest.TestCase):
+    def test_bm25_ranks_rarer_terms_higher_and_updates_incrementally(self) -> None:
+        index = BM25Index()
+        index.add("a", "deploy the web service")
+        index.add("b", "deploy the database")
+        index.add("c", "rotate database credentials")
+        scores = index.search({"database": 1.0, "credentials": 1.0})
+        self.assertEqual(max(scores, key=scores.get), "c")
+        self.assertNotIn("a", scores)
+
+        index.add("a", "database credentials leaked")
+        self.assertIn("a", index.search({"credentials": 1.0}))
+        self.assertEqual(index.search({"web": 1.0}), {})
+        self.assertEqual(len(index), 3)
+
+    def test_hashing_embedder_is_deterministic_and_normalized(self) -> None:
+        embedder = HashingEmbedder(dim=64)
+        first, second = embedder(["Fix the login bug", "fix THE login bug"])
+        self.assertEqual(first, second)
+        self.assertAlmostEqual(sum(value * value for value in first), 1.0, places=6)
+
+    def test_hybrid_search_fuses_dense_scores_and_expands_synonyms(self) -> None:
+        hybrid = HybridIndex(embedder=HashingEmbedder(dim=128))
+        hybrid.add_many([("a", "login defect on mobile"), ("b", "quarterly revenue report")])
+        scores = hybrid.search("login defect")
+        self.assertEqual(max(scores, key=scores.get), "a")
+        self.assertTrue(all(0.0 < score <= 1.0 for score in scores.values()))
+
+        lexical = HybridIndex(synonyms={"bug": ["defect"]})
+        lexical.add_many([("a", "login defect on mobile"), ("b", "quarterly revenue report")])
+        self.assertEqual(lexical.search("bug"), {})
+        self.assertEqual(lexical.search("bug", expand=True).keys(), {"a"})
+
+    def test_adapter_finds_blocks_by_content(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "memory.jsonl"
+            FileSystemMemoryAdapter(path).write(_block("postgres connection pool exhausted", {"intent": "ops"}))
+            adapter = FileSystemMemoryAdapter(path, text_index=HybridIndex(synonyms={"database": ["postgres"]}))
+            adapter.write(_block("update the changelog", {"intent": "docs"}))
+
+            query_tags = TagSet(schema_version="v0", tags={"intent": "debug"})
+            plan = QueryPlan(
+                filters={"query": "database pool errors"},
+                limits=5,
+                recency_bias=0.0,
+                expansion_rules=["synonyms"],
+            )
+            results = adapter.read(query_tags, query_plan=plan)
+            self.assertEqual([block.content for block in results], ["postgres connection pool exhausted"])
+            self.assertEqual(FileSystemMemoryAdapter(path).read(query_tags, query_plan=plan), [])
+
+
+if __name__ == "__main__":
+    unittest.main()